@@ -1 +1,7 @@
-from .repositories import Connection, SessionManager, SQLConnection
+from .repositories import (
+    AsyncSessionManager,
+    AsyncSQLConnection,
+    Connection,
+    SessionManager,
+    SQLConnection,
+)
@@ -0,0 +1,6 @@
+from .backend import CacheBackend
+from .in_memory import InMemoryCacheBackend
+from .lru_cache import CacheStats, LRUCache
+from .product_cache import ProductCache, deserialize_product, serialize_product
+from .redis_backend import RedisCacheBackend
+from .stats_cache import StatsCache, deserialize_stats, serialize_stats
@@ -0,0 +1,87 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheBackend(ABC):
+    """Key/value store shared by the product caches of one or many workers."""
+
+    # Generations only have to outlive a load; one that expires reads as 0.
+    GENERATION_TTL_SECONDS = 3600.0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Values of `keys` in order; backends with a multi-key read override
+        this so a batch costs one round trip."""
+        return [self.get(key) for key in keys]
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def generations(self, keys: List[str]) -> List[int]:
+        """Generation of each of `keys`, 0 for a key never invalidated. Read it
+        before loading a value and pass it to `set_if_generation`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_if_generation(
+        self, key: str, value: bytes, ttl_seconds: float, generation: int
+    ) -> bool:
+        """Sets `key` only while it is still at `generation`, atomically, so a
+        value loaded before an invalidation by any worker never lands after it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, *keys: str) -> None:
+        """Deletes `keys` and moves each to its next generation."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        """Takes `key` if nobody holds it and returns the token that releases
+        it, or None when it is taken. The lock expires by itself after
+        `ttl_seconds`, so a crashed holder cannot block the key forever."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_lock(self, key: str, token: str) -> None:
+        """Frees `key` only while it still holds `token`, so a holder that ran
+        past the TTL cannot free a lock another worker has taken since."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def publish(self, channel: str, message: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        raise NotImplementedError
+
+    @property
+    def evictions(self) -> int:
+        return 0
+
+    @property
+    def is_shared(self) -> bool:
+        """True when other processes see the same entries."""
+        return False
+
+
+async def call_backend(backend: CacheBackend, function: Callable[..., T], *args: Any) -> T:
+    """Runs a cache call from a coroutine: in a worker thread when the backend
+    talks to a server, so the event loop never waits on the network, and inline
+    when it is in-process, where a thread hop would cost more than the call."""
+    if backend.is_shared:
+        return await asyncio.to_thread(function, *args)
+    return function(*args)
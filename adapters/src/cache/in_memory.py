@@ -0,0 +1,79 @@
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .backend import CacheBackend
+from .lru_cache import LRUCache
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local backend on top of LRUCache; the default for one worker."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.cache = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._generations = LRUCache(max_size=max_size, ttl_seconds=self.GENERATION_TTL_SECONDS)
+        self._generations_guard = threading.Lock()
+        self._locks: Dict[str, Tuple[str, float]] = {}
+        self._locks_guard = threading.Lock()
+        self._subscribers: Dict[str, List[Callable[[str], None]]] = defaultdict(list)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def delete(self, *keys: str) -> None:
+        self.cache.invalidate(*keys)
+
+    def generations(self, keys: List[str]) -> List[int]:
+        return [self._generations.get(key) or 0 for key in keys]
+
+    def set_if_generation(
+        self, key: str, value: bytes, ttl_seconds: float, generation: int
+    ) -> bool:
+        with self._generations_guard:
+            if (self._generations.get(key) or 0) != generation:
+                return False
+            self.cache.set(key, value, ttl_seconds=ttl_seconds)
+            return True
+
+    def invalidate(self, *keys: str) -> None:
+        with self._generations_guard:
+            self.cache.invalidate(*keys)
+            for key in keys:
+                self._generations.set(key, (self._generations.get(key) or 0) + 1)
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        now = time.monotonic()
+        with self._locks_guard:
+            held = self._locks.get(key)
+            if held is not None and held[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._locks[key] = (token, now + ttl_seconds)
+            return token
+
+    def release_lock(self, key: str, token: str) -> None:
+        with self._locks_guard:
+            held = self._locks.get(key)
+            if held is not None and held[0] == token:
+                del self._locks[key]
+
+    def publish(self, channel: str, message: str) -> None:
+        for callback in list(self._subscribers[channel]):
+            callback(message)
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        self._subscribers[channel].append(callback)
+
+    @property
+    def evictions(self) -> int:
+        return self.cache.stats.evictions
+
+    def clear(self) -> None:
+        self.cache.clear()
+        with self._locks_guard:
+            self._locks.clear()
@@ -0,0 +1,223 @@
+import asyncio
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.src import Product
+
+from .backend import CacheBackend, call_backend
+from .lru_cache import CacheStats, LRUCache
+
+
+def serialize_product(product: Product) -> bytes:
+    status = getattr(product.status, "value", product.status)
+    updated_at = product.updated_at.isoformat() if product.updated_at else None
+    payload = {
+        **product._asdict(),
+        "price": str(product.price),
+        "status": status,
+        "updated_at": updated_at,
+    }
+    return json.dumps(payload).encode()
+
+
+def deserialize_product(payload: bytes) -> Product:
+    fields = json.loads(payload)
+    updated_at = fields.get("updated_at")
+    return Product(**{
+        **fields,
+        "price": Decimal(fields["price"]),
+        "updated_at": datetime.fromisoformat(updated_at) if updated_at else None,
+    })
+
+
+class ProductCache:
+    """Caches serialized Product tuples in a CacheBackend.
+
+    Misses are single-flight: the first caller to miss takes a short lock and
+    loads from the repository while concurrent callers for the same id poll for
+    its result, so a hot key expiring does not send a stampede to the database.
+    A waiter that outlives LOCK_WAIT_SECONDS loads on its own.
+    A loaded product is stored only if no worker invalidated its key since the
+    load began: the backend keeps a generation per key that `invalidate`
+    bumps, and the store is a compare-and-set against the generation read
+    before loading. Invalidations are published so that workers holding a near cache (a small
+    in-process LRU in front of a shared backend) drop their copies too.
+    """
+
+    INVALIDATION_CHANNEL = "product-invalidations"
+    LOCK_TTL_SECONDS = 5.0
+    LOCK_WAIT_SECONDS = 2.0
+    LOCK_POLL_SECONDS = 0.01
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        near_cache: Optional[LRUCache] = None,
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.near_cache = near_cache
+        self._stats = CacheStats()
+        if near_cache is not None:
+            backend.subscribe(self.INVALIDATION_CHANNEL, self._on_invalidation)
+
+    @property
+    def stats(self) -> CacheStats:
+        self._stats.evictions = self.backend.evictions
+        return self._stats
+
+    def get_or_load(
+        self, product_id: str, loader: Callable[[], Optional[Product]]
+    ) -> Optional[Product]:
+        deadline = time.monotonic() + self.LOCK_WAIT_SECONDS
+        first_attempt = True
+        while True:
+            product = self._lookup(product_id, count=first_attempt)
+            if product is not None:
+                return product
+            lock_key = self._lock_key(product_id)
+            token = self.backend.acquire_lock(lock_key, self.LOCK_TTL_SECONDS)
+            if token is not None:
+                try:
+                    version = self._version([product_id])[0]
+                    product = loader()
+                    self._store(product_id, product, version)
+                    return product
+                finally:
+                    self.backend.release_lock(lock_key, token)
+            if time.monotonic() >= deadline:
+                return loader()
+            first_attempt = False
+            time.sleep(self.LOCK_POLL_SECONDS)
+
+    async def aget_or_load(
+        self, product_id: str, loader: Callable[[], Awaitable[Optional[Product]]]
+    ) -> Optional[Product]:
+        """get_or_load for coroutines; backend calls go through call_backend."""
+        deadline = time.monotonic() + self.LOCK_WAIT_SECONDS
+        first_attempt = True
+        while True:
+            product = await call_backend(self.backend, self._lookup, product_id, first_attempt)
+            if product is not None:
+                return product
+            lock_key = self._lock_key(product_id)
+            token = await call_backend(
+                self.backend, self.backend.acquire_lock, lock_key, self.LOCK_TTL_SECONDS
+            )
+            if token is not None:
+                try:
+                    version = (
+                        await call_backend(self.backend, self._version, [product_id])
+                    )[0]
+                    product = await loader()
+                    await call_backend(self.backend, self._store, product_id, product, version)
+                    return product
+                finally:
+                    await call_backend(self.backend, self.backend.release_lock, lock_key, token)
+            if time.monotonic() >= deadline:
+                return await loader()
+            first_attempt = False
+            await asyncio.sleep(self.LOCK_POLL_SECONDS)
+
+    def get_many_or_load(
+        self,
+        product_ids: List[str],
+        loader: Callable[[List[str]], List[Optional[Product]]],
+    ) -> Dict[str, Optional[Product]]:
+        """Products of `product_ids` by id, with one read of the cache and one
+        call to `loader` for every id the cache misses. Batch misses are not
+        single-flight: a lock per id would cost more round trips than it saves."""
+        product_ids = list(dict.fromkeys(product_ids))
+        keys = [self._key(product_id) for product_id in product_ids]
+        payloads: Dict[str, Optional[bytes]] = {}
+        if self.near_cache is not None:
+            payloads = {key: self.near_cache.get(key) for key in keys}
+        remote = [key for key in keys if payloads.get(key) is None]
+        for key, payload in zip(remote, self.backend.get_many(remote)):
+            payloads[key] = payload
+            if payload is not None and self.near_cache is not None:
+                self.near_cache.set(key, payload)
+
+        products: Dict[str, Optional[Product]] = {}
+        missing = []
+        for product_id, key in zip(product_ids, keys):
+            if payloads[key] is None:
+                missing.append(product_id)
+            else:
+                products[product_id] = deserialize_product(payloads[key])
+        self._stats.hits += len(products)
+        self._stats.misses += len(missing)
+        if missing:
+            versions = self._version(missing)
+            for product_id, product, version in zip(missing, loader(missing), versions):
+                self._store(product_id, product, version)
+                products[product_id] = product
+        return products
+
+    def invalidate(self, *product_ids: str) -> None:
+        if not product_ids:
+            return
+        keys = [self._key(product_id) for product_id in product_ids]
+        if self.near_cache is not None:
+            self.near_cache.invalidate(*keys)
+        self.backend.invalidate(*keys)
+        self._stats.invalidations += len(keys)
+        if self.backend.is_shared:
+            self.backend.publish(self.INVALIDATION_CHANNEL, json.dumps(list(product_ids)))
+
+    async def ainvalidate(self, *product_ids: str) -> None:
+        await call_backend(self.backend, self.invalidate, *product_ids)
+
+    def clear(self) -> None:
+        if self.near_cache is not None:
+            self.near_cache.clear()
+        if hasattr(self.backend, "clear"):
+            self.backend.clear()
+
+    def _lookup(self, product_id: str, count: bool = True) -> Optional[Product]:
+        key = self._key(product_id)
+        payload = self.near_cache.get(key) if self.near_cache is not None else None
+        if payload is None:
+            payload = self.backend.get(key)
+            if payload is not None and self.near_cache is not None:
+                self.near_cache.set(key, payload)
+        if count:
+            if payload is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return deserialize_product(payload) if payload is not None else None
+
+    def _version(self, product_ids: List[str]) -> List[Tuple[int, int]]:
+        """What `_store` checks: the backend generation of every product key
+        and the epoch of the near cache, read before loading."""
+        near_epoch = self.near_cache.epoch if self.near_cache is not None else 0
+        generations = self.backend.generations([self._key(p) for p in product_ids])
+        return [(generation, near_epoch) for generation in generations]
+
+    def _store(
+        self, product_id: str, product: Optional[Product], version: Tuple[int, int]
+    ) -> None:
+        # Missing products are not cached, so a create is visible right away.
+        if product is None:
+            return
+        generation, near_epoch = version
+        key, payload = self._key(product_id), serialize_product(product)
+        stored = self.backend.set_if_generation(key, payload, self.ttl_seconds, generation)
+        if stored and self.near_cache is not None:
+            self.near_cache.set(key, payload, epoch=near_epoch)
+
+    def _on_invalidation(self, message: str) -> None:
+        self.near_cache.invalidate(*[self._key(product_id) for product_id in json.loads(message)])
+
+    @staticmethod
+    def _key(product_id: str) -> str:
+        return f"product:{product_id}"
+
+    @staticmethod
+    def _lock_key(product_id: str) -> str:
+        return f"lock:product:{product_id}"
@@ -0,0 +1,117 @@
+import logging
+import threading
+import uuid
+from typing import Any, Callable, List, Optional
+
+from .backend import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Compare-and-delete, atomic on the server.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Set-if-generation: KEYS = (value key, generation key),
+# ARGV = (expected generation, value, ttl in milliseconds).
+_SET_IF_GENERATION_SCRIPT = """
+if tonumber(redis.call("get", KEYS[2]) or "0") == tonumber(ARGV[1]) then
+    redis.call("set", KEYS[1], ARGV[2], "PX", ARGV[3])
+    return 1
+end
+return 0
+"""
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend for anything speaking the Redis protocol (Redis, Valkey,
+    KeyDB, fakeredis in tests), shared by every worker and host."""
+
+    def __init__(self, client: Any, prefix: str = "catalog:") -> None:
+        self.client = client
+        self.prefix = prefix
+        self._release_lock = client.register_script(_RELEASE_LOCK_SCRIPT)
+        self._set_if_generation = client.register_script(_SET_IF_GENERATION_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "catalog:") -> "RedisCacheBackend":
+        try:
+            import redis
+        except ImportError:
+            raise Exception("The 'redis' package is required for the redis cache backend.")
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return self.client.mget([self.prefix + key for key in keys])
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.client.set(self.prefix + key, value, px=int(ttl_seconds * 1000))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+    def generations(self, keys: List[str]) -> List[int]:
+        if not keys:
+            return []
+        values = self.client.mget([self._generation_key(key) for key in keys])
+        return [int(value) if value is not None else 0 for value in values]
+
+    def set_if_generation(
+        self, key: str, value: bytes, ttl_seconds: float, generation: int
+    ) -> bool:
+        return bool(self._set_if_generation(
+            keys=[self.prefix + key, self._generation_key(key)],
+            args=[generation, value, int(ttl_seconds * 1000)],
+        ))
+
+    def invalidate(self, *keys: str) -> None:
+        if not keys:
+            return
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.delete(*[self.prefix + key for key in keys])
+        for key in keys:
+            pipeline.incr(self._generation_key(key))
+            pipeline.pexpire(self._generation_key(key), int(self.GENERATION_TTL_SECONDS * 1000))
+        pipeline.execute()
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self.prefix}generation:{key}"
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        if self.client.set(self.prefix + key, token, nx=True, px=int(ttl_seconds * 1000)):
+            return token
+        return None
+
+    def release_lock(self, key: str, token: str) -> None:
+        self._release_lock(keys=[self.prefix + key], args=[token])
+
+    def publish(self, channel: str, message: str) -> None:
+        self.client.publish(self.prefix + channel, message)
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.prefix + channel)
+
+        def listen() -> None:
+            for message in pubsub.listen():
+                try:
+                    data = message["data"]
+                    callback(data.decode() if isinstance(data, bytes) else str(data))
+                except Exception:
+                    logger.exception("Cache invalidation callback failed")
+
+        threading.Thread(target=listen, name=f"cache-{channel}", daemon=True).start()
+
+    @property
+    def is_shared(self) -> bool:
+        return True
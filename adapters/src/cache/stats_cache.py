@@ -0,0 +1,110 @@
+import hashlib
+import json
+import uuid
+from decimal import Decimal
+from typing import Callable
+
+from app.src import ProductFilter, ProductStats, StatusStats
+
+from .backend import CacheBackend, call_backend
+from .lru_cache import CacheStats
+
+
+def serialize_stats(stats: ProductStats) -> bytes:
+    def price(value):
+        return None if value is None else str(value)
+
+    payload = {
+        "count": stats.count,
+        "available": stats.available,
+        "by_status": {status: list(counts) for status, counts in stats.by_status.items()},
+        "price_min": price(stats.price_min),
+        "price_avg": price(stats.price_avg),
+        "price_max": price(stats.price_max),
+        "price_percentiles": {name: str(value) for name, value in stats.price_percentiles.items()},
+    }
+    return json.dumps(payload).encode()
+
+
+def deserialize_stats(payload: bytes) -> ProductStats:
+    fields = json.loads(payload)
+
+    def price(name):
+        return None if fields[name] is None else Decimal(fields[name])
+
+    return ProductStats(
+        count=fields["count"],
+        available=fields["available"],
+        by_status={status: StatusStats(*counts) for status, counts in fields["by_status"].items()},
+        price_min=price("price_min"),
+        price_avg=price("price_avg"),
+        price_max=price("price_max"),
+        price_percentiles={
+            name: Decimal(value) for name, value in fields["price_percentiles"].items()
+        },
+    )
+
+
+class StatsCache:
+    """Caches ProductStats per filter in a CacheBackend.
+
+    Entries are keyed under a generation token kept in the backend itself, so
+    `invalidate` is a single write that every worker sharing the backend sees:
+    it replaces the token and the old entries become unreachable until they
+    expire. A load that races with an invalidation stores its result under the
+    token it started with, so stale figures are never served afterwards.
+    """
+
+    GENERATION_KEY = "stats:generation"
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        self._stats.evictions = self.backend.evictions
+        return self._stats
+
+    def get_or_load(
+        self, product_filter: ProductFilter, loader: Callable[[], ProductStats]
+    ) -> ProductStats:
+        key = self._key(self._generation(), product_filter)
+        payload = self.backend.get(key)
+        if payload is not None:
+            self._stats.hits += 1
+            return deserialize_stats(payload)
+        self._stats.misses += 1
+        stats = loader()
+        self.backend.set(key, serialize_stats(stats), self.ttl_seconds)
+        return stats
+
+    def invalidate(self) -> None:
+        self._new_generation()
+        self._stats.invalidations += 1
+
+    async def ainvalidate(self) -> None:
+        await call_backend(self.backend, self.invalidate)
+
+    def clear(self) -> None:
+        self._new_generation()
+
+    def _generation(self) -> str:
+        generation = self.backend.get(self.GENERATION_KEY)
+        if generation is None:
+            # Evicted or expired: a fresh token, never an old one, so entries
+            # cached before an invalidation cannot come back.
+            return self._new_generation()
+        return generation.decode()
+
+    def _new_generation(self) -> str:
+        generation = uuid.uuid4().hex
+        self.backend.set(self.GENERATION_KEY, generation.encode(), self.ttl_seconds)
+        return generation
+
+    @staticmethod
+    def _key(generation: str, product_filter: ProductFilter) -> str:
+        criteria = product_filter._replace(sort=None)
+        digest = hashlib.sha1(repr(tuple(criteria)).encode()).hexdigest()
+        return f"stats:{generation}:{digest}"
@@ -0,0 +1,5 @@
+from .in_process_bus import (
+    InProcessProductEventBus,
+    Subscription,
+    SubscriptionOverflowException,
+)
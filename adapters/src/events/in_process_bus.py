@@ -0,0 +1,134 @@
+"""In-process pub/sub for live product updates.
+
+Subscribers are asyncio consumers (an SSE stream or a WebSocket) that each own a
+bounded queue on the event loop they subscribed from. Publishers are the write
+use cases, which run either on that loop or on a threadpool worker, so events
+are handed over with `loop.call_soon_threadsafe` and a publish never waits for
+a subscriber. A subscriber that falls a full queue behind is dropped rather than
+slowing writes down or holding unbounded memory; it is told so, and reloads.
+
+An idle subscriber is a queue and a parked coroutine: nothing is polled and a
+publish costs one dict lookup per event when nobody watches the product.
+
+Only writes served by this process are seen. With several workers, a watcher
+connected to one misses writes handled by the others.
+"""
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.src import ProductEvent, ProductEventPublisher
+
+_OVERFLOW = object()
+
+
+class SubscriptionOverflowException(Exception):
+    def __init__(self) -> None:
+        super().__init__("Subscriber fell too far behind and was disconnected")
+
+
+class Subscription:
+    def __init__(self, bus: "InProcessProductEventBus", max_queue_size: int) -> None:
+        self._bus = bus
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue_size)
+        self.product_ids: Set[str] = set()
+        self.closed = False
+
+    def subscribe(self, product_ids: Iterable[str]) -> None:
+        self._bus._add(self, product_ids)
+
+    def unsubscribe(self, product_ids: Iterable[str]) -> None:
+        self._bus._remove(self, product_ids)
+
+    def close(self) -> None:
+        self.closed = True
+        self._bus._remove(self)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[ProductEvent]:
+        """The next event, or None when `timeout` seconds pass without one.
+        Raises SubscriptionOverflowException once the subscriber was dropped."""
+        try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is _OVERFLOW:
+            self._queue.put_nowait(_OVERFLOW)
+            raise SubscriptionOverflowException()
+        return event
+
+    def _offer(self, event: ProductEvent) -> None:
+        # Runs on the subscriber's loop.
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.close()
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_OVERFLOW)
+
+
+class InProcessProductEventBus(ProductEventPublisher):
+    def __init__(self, max_queue_size: int = 64) -> None:
+        self.max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, product_ids: Iterable[str] = ()) -> Subscription:
+        """A subscription bound to the running event loop."""
+        subscription = Subscription(self, self.max_queue_size)
+        subscription.subscribe(product_ids)
+        return subscription
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len({s for subscriptions in self._subscriptions.values() for s in subscriptions})
+
+    def publish(self, event: ProductEvent) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(event.product_id)
+            if not subscriptions:
+                return
+            by_loop: Dict[asyncio.AbstractEventLoop, List[Subscription]] = defaultdict(list)
+            for subscription in subscriptions:
+                by_loop[subscription._loop].append(subscription)
+        for loop, receivers in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, receivers, event)
+            except RuntimeError:
+                # The loop is closed: its subscribers are gone without saying so.
+                for subscription in receivers:
+                    subscription.closed = True
+                    self._remove(subscription)
+
+    def _add(self, subscription: Subscription, product_ids: Iterable[str]) -> None:
+        with self._lock:
+            if subscription.closed:
+                return
+            for product_id in product_ids:
+                self._subscriptions[product_id].add(subscription)
+                subscription.product_ids.add(product_id)
+
+    def _remove(
+        self, subscription: Subscription, product_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """Stops delivering the given products, or all of them, to the subscription."""
+        with self._lock:
+            if product_ids is None:
+                product_ids = list(subscription.product_ids)
+            for product_id in product_ids:
+                subscriptions = self._subscriptions.get(product_id)
+                if subscriptions is not None:
+                    subscriptions.discard(subscription)
+                    if not subscriptions:
+                        del self._subscriptions[product_id]
+                subscription.product_ids.discard(product_id)
+
+
+def _deliver(subscriptions: List[Subscription], event: ProductEvent) -> None:
+    for subscription in subscriptions:
+        subscription._offer(event)
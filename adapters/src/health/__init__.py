@@ -0,0 +1,9 @@
+from .readiness import (
+    AnyEngine,
+    PoolReport,
+    ReadinessProbe,
+    ReadinessReport,
+    async_ping,
+    ping,
+    pool_saturation,
+)
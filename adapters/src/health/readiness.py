@@ -0,0 +1,156 @@
+import asyncio
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.concurrency import run_in_threadpool
+
+from adapters.src.metrics import SlidingWindow
+
+
+AnyEngine = Union[Engine, AsyncEngine]
+
+
+class PoolReport(NamedTuple):
+    database_ok: bool
+    database_latency_ms: Optional[float]
+    saturation: Optional[float]
+
+
+class ReadinessReport(NamedTuple):
+    ready: bool
+    # Summaries over every pool: all answered, slowest ping, fullest pool.
+    database_ok: bool
+    database_latency_ms: Optional[float]
+    pool_saturation: Optional[float]
+    error_rate: Optional[float]
+    reasons: List[str]
+    pools: Dict[str, PoolReport]
+
+
+def pool_saturation(engine: AnyEngine) -> Optional[float]:
+    """Share of the pool's capacity (size + max overflow) in use, or None for
+    pools without a fixed capacity."""
+    pool = getattr(engine, "sync_engine", engine).pool
+    size = getattr(pool, "size", None)
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if size is None or max_overflow is None or max_overflow < 0:
+        return None
+    capacity = size() + max_overflow
+    return pool.checkedout() / capacity if capacity else None
+
+
+def ping(engine: Engine, timeout_seconds: float) -> None:
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            timeout_ms = max(int(timeout_seconds * 1000), 1)
+            connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+        connection.execute(text("SELECT 1"))
+
+
+async def async_ping(engine: AsyncEngine, timeout_seconds: float) -> None:
+    async with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            timeout_ms = max(int(timeout_seconds * 1000), 1)
+            await connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+        await connection.execute(text("SELECT 1"))
+
+
+class ReadinessProbe:
+    """Decides whether this worker should receive traffic.
+
+    Every engine serving traffic is checked (the sync one, plus the async one
+    under CATALOG_REPOSITORY=ASYNC_SQL). Not ready when `SELECT 1` fails or
+    exceeds `timeout_seconds` on any of them, when any connection pool is
+    nearly exhausted, or when too many recent requests failed. Reports are
+    reused for `cache_seconds`, so frequent probes from several load
+    balancers cost at most one query per pool per interval.
+    """
+
+    def __init__(
+        self,
+        engines: Dict[str, Callable[[], AnyEngine]],
+        window: SlidingWindow,
+        timeout_seconds: float,
+        cache_seconds: float,
+        saturation_threshold: float,
+        error_rate_threshold: float,
+        error_rate_min_requests: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.engines = engines
+        self.window = window
+        self.timeout_seconds = timeout_seconds
+        self.cache_seconds = cache_seconds
+        self.saturation_threshold = saturation_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.error_rate_min_requests = error_rate_min_requests
+        self.clock = clock
+        self._report: Optional[ReadinessReport] = None
+        self._expires_at = 0.0
+
+    async def check(self) -> ReadinessReport:
+        if self._report is not None and self.clock() < self._expires_at:
+            return self._report
+        report = await self._probe()
+        self._report, self._expires_at = report, self.clock() + self.cache_seconds
+        return report
+
+    def clear(self) -> None:
+        self._report = None
+
+    async def _probe(self) -> ReadinessReport:
+        reasons: List[str] = []
+        names = list(self.engines)
+        reports = await asyncio.gather(*[self._probe_pool(name, reasons) for name in names])
+        pools = dict(zip(names, reports))
+        latencies = [pool.database_latency_ms for pool in reports if pool.database_ok]
+        saturations = [pool.saturation for pool in reports if pool.saturation is not None]
+        saturation = max(saturations, default=None)
+
+        requests, errors = self.window.totals()
+        error_rate = errors / requests if requests else None
+        if (
+            error_rate is not None
+            and requests >= self.error_rate_min_requests
+            and error_rate >= self.error_rate_threshold
+        ):
+            reasons.append(f"{error_rate:.0%} of the last {requests} requests failed")
+
+        return ReadinessReport(
+            ready=not reasons,
+            database_ok=all(pool.database_ok for pool in reports),
+            database_latency_ms=max(latencies) if len(latencies) == len(reports) else None,
+            pool_saturation=saturation,
+            error_rate=round(error_rate, 3) if error_rate is not None else None,
+            reasons=reasons,
+            pools=pools,
+        )
+
+    async def _probe_pool(self, name: str, reasons: List[str]) -> PoolReport:
+        database_ok, latency_ms, saturation = False, None, None
+        try:
+            engine = self.engines[name]()
+            saturation = pool_saturation(engine)
+            started = time.perf_counter()
+            if isinstance(engine, AsyncEngine):
+                check = async_ping(engine, self.timeout_seconds)
+            else:
+                check = run_in_threadpool(ping, engine, self.timeout_seconds)
+            await asyncio.wait_for(check, self.timeout_seconds)
+            latency_ms = round((time.perf_counter() - started) * 1000, 3)
+            database_ok = True
+        except asyncio.TimeoutError:
+            reasons.append(f"{name} database did not answer within {self.timeout_seconds}s")
+        except Exception as e:
+            reasons.append(f"{name} database unavailable: {type(e).__name__}")
+
+        if saturation is not None and saturation >= self.saturation_threshold:
+            reasons.append(f"{name} connection pool {saturation:.0%} saturated")
+        return PoolReport(
+            database_ok=database_ok,
+            database_latency_ms=latency_ms,
+            saturation=round(saturation, 3) if saturation is not None else None,
+        )
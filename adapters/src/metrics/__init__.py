@@ -0,0 +1,11 @@
+from .catalog import REPOSITORY_METHODS, CatalogMetrics
+from .registry import (
+    CallbackCounter,
+    Counter,
+    CounterChild,
+    Gauge,
+    Histogram,
+    HistogramChild,
+    Registry,
+)
+from .window import SlidingWindow
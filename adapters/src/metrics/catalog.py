@@ -0,0 +1,87 @@
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.pool import Pool
+
+from adapters.src.cache import CacheStats
+from app.src.repositories import ProductRepository
+
+from .registry import (
+    CallbackCounter,
+    Counter,
+    CounterChild,
+    Gauge,
+    Histogram,
+    HistogramChild,
+    Registry,
+)
+from .window import SlidingWindow
+
+REPOSITORY_METHODS = tuple(sorted(ProductRepository.__abstractmethods__))
+
+
+class CatalogMetrics:
+    """The metric families exported on /metrics."""
+
+    def __init__(self, registry: Optional[Registry] = None, window_seconds: int = 60) -> None:
+        self.registry = registry or Registry()
+        # Recent API requests and server errors, read by the readiness probe.
+        self.recent_requests = SlidingWindow(window_seconds)
+        self.request_latency = self.registry.register(Histogram(
+            "http_request_duration_seconds",
+            "Request latency by route template, method and status code.",
+            ("route", "method", "status"),
+        ))
+        self.repository_latency = self.registry.register(Histogram(
+            "product_repository_duration_seconds",
+            "ProductRepository call latency by method.",
+            ("method",),
+        ))
+        self.repository_errors = self.registry.register(Counter(
+            "product_repository_errors",
+            "ProductRepository calls that raised, by method.",
+            ("method",),
+        ))
+        # Label children are created once here, so wrapping a repository per
+        # request costs no lookups or allocations beyond the wrapper itself.
+        self.repository_latency_by_method: Dict[str, HistogramChild] = {
+            method: self.repository_latency.labels(method) for method in REPOSITORY_METHODS
+        }
+        self.repository_errors_by_method: Dict[str, CounterChild] = {
+            method: self.repository_errors.labels(method) for method in REPOSITORY_METHODS
+        }
+
+    def register_pools(self, pools: Callable[[], Dict[str, Pool]]) -> None:
+        """Gauges from the pools' public API. The pool exposes no count of
+        callers waiting for a connection; overflow at max_overflow together
+        with checked_out at size + max_overflow is the sign that they queue."""
+        def collect(read: Callable[[Pool], float]) -> Callable[[], dict]:
+            return lambda: {(name,): read(pool) for name, pool in pools().items()}
+
+        for name, documentation, read in (
+            ("db_pool_size", "Connections the pool keeps open.", lambda pool: pool.size()),
+            ("db_pool_checked_out", "Connections in use.", lambda pool: pool.checkedout()),
+            (
+                "db_pool_overflow",
+                "Connections opened beyond the pool size.",
+                lambda pool: pool.overflow(),
+            ),
+        ):
+            self.registry.register(Gauge(name, documentation, collect(read), ("engine",)))
+
+    def register_cache(self, stats: Callable[[], CacheStats]) -> None:
+        self.registry.register(CallbackCounter(
+            "product_cache_lookups",
+            "Product cache lookups by result.",
+            lambda: {("hit",): stats().hits, ("miss",): stats().misses},
+            ("result",),
+        ))
+        self.registry.register(CallbackCounter(
+            "product_cache_evictions",
+            "Entries evicted from the product cache.",
+            lambda: {(): stats().evictions},
+        ))
+        self.registry.register(Gauge(
+            "product_cache_hit_ratio",
+            "Share of product cache lookups served from the cache.",
+            lambda: {(): stats().hit_ratio},
+        ))
@@ -0,0 +1,36 @@
+import time
+from typing import Callable, List, Tuple
+
+
+class SlidingWindow:
+    """Counts requests and errors over the last `seconds`, in one-second slots.
+
+    Like the registry, it takes no locks; a racing increment may be lost.
+    """
+
+    def __init__(self, seconds: int = 60, clock: Callable[[], float] = time.monotonic) -> None:
+        self.seconds = seconds
+        self.clock = clock
+        # Each slot holds [second, requests, errors].
+        self._slots: List[List[int]] = [[-1, 0, 0] for _ in range(seconds)]
+
+    def record(self, error: bool) -> None:
+        now = int(self.clock())
+        slot = self._slots[now % self.seconds]
+        if slot[0] != now:
+            slot[:] = [now, 0, 0]
+        slot[1] += 1
+        slot[2] += error
+
+    def totals(self) -> Tuple[int, int]:
+        now = int(self.clock())
+        requests = errors = 0
+        for second, slot_requests, slot_errors in self._slots:
+            if now - second < self.seconds:
+                requests += slot_requests
+                errors += slot_errors
+        return requests, errors
+
+    def clear(self) -> None:
+        for slot in self._slots:
+            slot[:] = [-1, 0, 0]
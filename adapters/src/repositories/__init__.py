@@ -1,7 +1,12 @@
 from .sql import (
+    AsyncSessionManager,
+    AsyncSQLConnection,
+    AsyncSQLProductRepository,
     Connection,
     SessionManager,
     SQLConnection,
     ProductSchema,
     SQLProductRepository,
 )
+from .cached import AsyncCachedProductRepository, CachedProductRepository
+from .instrumented import AsyncInstrumentedProductRepository, InstrumentedProductRepository
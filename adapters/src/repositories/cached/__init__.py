@@ -0,0 +1 @@
+from .cached_product_repository import AsyncCachedProductRepository, CachedProductRepository
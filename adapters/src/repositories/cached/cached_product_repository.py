@@ -0,0 +1,215 @@
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from adapters.src.cache import ProductCache, StatsCache
+from app.src import (
+    AsyncProductRepository,
+    CollectionVersion,
+    Product,
+    ProductChange,
+    ProductFilter,
+    ProductRepository,
+    ProductSearchHit,
+    ProductStats,
+    StatusStats,
+)
+
+
+class CachedProductRepository(ProductRepository):
+    """Read-through cache in front of any ProductRepository.
+
+    `get_by_id` and `get_many` are served from the cache; every write invalidates the products
+    it touches, which the cache publishes to the other workers when its backend
+    is shared. With a StatsCache, `stats` is cached too and every write
+    invalidates it. Listing methods are passed through untouched.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        cache: ProductCache,
+        stats_cache: Optional[StatsCache] = None,
+    ) -> None:
+        self.product_repository = product_repository
+        self.cache = cache
+        self.stats_cache = stats_cache
+
+    def get_by_id(self, product_id: str) -> Optional[Product]:
+        return self.cache.get_or_load(
+            product_id, lambda: self.product_repository.get_by_id(product_id)
+        )
+
+    def get_many(self, product_ids: List[str]) -> List[Optional[Product]]:
+        products = self.cache.get_many_or_load(product_ids, self.product_repository.get_many)
+        return [products[product_id] for product_id in product_ids]
+
+    def _invalidate(self, *product_ids: str) -> None:
+        self.cache.invalidate(*product_ids)
+        if self.stats_cache is not None:
+            self.stats_cache.invalidate()
+
+    def create(self, product: Product) -> Product:
+        try:
+            return self.product_repository.create(product)
+        finally:
+            self._invalidate(product.product_id)
+
+    def bulk_create(self, products: List[Product]) -> List[str]:
+        try:
+            return self.product_repository.bulk_create(products)
+        finally:
+            self._invalidate(*[product.product_id for product in products])
+
+    def bulk_upsert(self, products: List[Product]) -> List[str]:
+        try:
+            return self.product_repository.bulk_upsert(products)
+        finally:
+            self._invalidate(*[product.product_id for product in products])
+
+    def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            return self.product_repository.update(
+                product=product, expected_version=expected_version
+            )
+        finally:
+            self._invalidate(product.product_id)
+
+    def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            return self.product_repository.delete(
+                product_id, expected_version=expected_version
+            )
+        finally:
+            self._invalidate(product_id)
+
+    def patch(
+        self, product_id: str, fields: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            return self.product_repository.patch(
+                product_id, fields, expected_version=expected_version
+            )
+        finally:
+            self._invalidate(product_id)
+
+    def bulk_patch(self, product_ids: List[str], fields: Dict[str, Any]) -> List[str]:
+        try:
+            return self.product_repository.bulk_patch(product_ids, fields)
+        finally:
+            self._invalidate(*product_ids)
+
+    def list_all(self) -> List[Product]:
+        return self.product_repository.list_all()
+
+    def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        return self.product_repository.list_page(after=after, limit=limit, status=status)
+
+    def list_by_user(self, user_id: str, after: Optional[str], limit: int) -> List[Product]:
+        return self.product_repository.list_by_user(user_id, after=after, limit=limit)
+
+    def count_by_user(self, user_id: str) -> Dict[str, int]:
+        return self.product_repository.count_by_user(user_id)
+
+    def list_filtered(
+        self, product_filter: ProductFilter, limit: int, after: Optional[Tuple[Any, str]] = None
+    ) -> List[Product]:
+        return self.product_repository.list_filtered(product_filter, limit=limit, after=after)
+
+    def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        return self.product_repository.collection_version(status=status)
+
+    def search(
+        self, query: str, limit: int, after: Optional[Tuple[float, str]] = None
+    ) -> List[ProductSearchHit]:
+        return self.product_repository.search(query, limit=limit, after=after)
+
+    def list_changes(self, since: int, limit: int) -> List[ProductChange]:
+        return self.product_repository.list_changes(since, limit=limit)
+
+    def count_by_status(self) -> Dict[str, StatusStats]:
+        return self.product_repository.count_by_status()
+
+    def stats(self, product_filter: ProductFilter = ProductFilter()) -> ProductStats:
+        if self.stats_cache is None:
+            return self.product_repository.stats(product_filter)
+        return self.stats_cache.get_or_load(
+            product_filter, lambda: self.product_repository.stats(product_filter)
+        )
+
+    def stream_all(self, batch_size: int = 1000) -> Iterator[Product]:
+        return self.product_repository.stream_all(batch_size=batch_size)
+
+    def filter(self, status: str) -> List[Product]:
+        return self.product_repository.filter(status)
+
+
+class AsyncCachedProductRepository(AsyncProductRepository):
+    """Async counterpart of CachedProductRepository, sharing the same caches."""
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        cache: ProductCache,
+        stats_cache: Optional[StatsCache] = None,
+    ) -> None:
+        self.product_repository = product_repository
+        self.cache = cache
+        self.stats_cache = stats_cache
+
+    async def get_by_id(self, product_id: str) -> Optional[Product]:
+        return await self.cache.aget_or_load(
+            product_id, lambda: self.product_repository.get_by_id(product_id)
+        )
+
+    async def _invalidate(self, *product_ids: str) -> None:
+        await self.cache.ainvalidate(*product_ids)
+        if self.stats_cache is not None:
+            await self.stats_cache.ainvalidate()
+
+    async def create(self, product: Product) -> Product:
+        try:
+            return await self.product_repository.create(product)
+        finally:
+            await self._invalidate(product.product_id)
+
+    async def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            return await self.product_repository.update(
+                product=product, expected_version=expected_version
+            )
+        finally:
+            await self._invalidate(product.product_id)
+
+    async def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            return await self.product_repository.delete(
+                product_id, expected_version=expected_version
+            )
+        finally:
+            await self._invalidate(product_id)
+
+    async def list_all(self) -> List[Product]:
+        return await self.product_repository.list_all()
+
+    async def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        return await self.product_repository.list_page(after=after, limit=limit, status=status)
+
+    async def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        return await self.product_repository.collection_version(status=status)
+
+    def stream_all(self, batch_size: int = 1000) -> AsyncIterator[Product]:
+        return self.product_repository.stream_all(batch_size=batch_size)
+
+    async def filter(self, status: str) -> List[Product]:
+        return await self.product_repository.filter(status)
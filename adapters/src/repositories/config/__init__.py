@@ -1 +1,4 @@
+from .cache import CacheConfig
+from .events import EventsConfig
+from .health import HealthConfig
 from .sql import SQLConfig
@@ -0,0 +1,14 @@
+import os
+
+
+class CacheConfig:
+    ENABLED = os.environ.get("PRODUCT_CACHE_ENABLED", "true").lower() == "true"
+    BACKEND = os.environ.get("PRODUCT_CACHE_BACKEND", "memory").lower()
+    REDIS_URL = os.environ.get("PRODUCT_CACHE_REDIS_URL", "redis://localhost:6379/0")
+    MAX_SIZE = int(os.environ.get("PRODUCT_CACHE_MAX_SIZE", "10000"))
+    TTL_SECONDS = float(os.environ.get("PRODUCT_CACHE_TTL_SECONDS", "60"))
+    # Per-worker LRU in front of a shared backend; 0 disables it.
+    NEAR_CACHE_TTL_SECONDS = float(os.environ.get("PRODUCT_CACHE_NEAR_TTL_SECONDS", "5"))
+    # Upper bound on how stale /products/stats can be after writes made
+    # outside the app; writes through it invalidate the stats right away.
+    STATS_TTL_SECONDS = float(os.environ.get("PRODUCT_STATS_CACHE_TTL_SECONDS", "300"))
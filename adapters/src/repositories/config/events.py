@@ -0,0 +1,10 @@
+import os
+
+
+class EventsConfig:
+    # Events a live subscriber may fall behind by before it is disconnected.
+    QUEUE_SIZE = int(os.environ.get("PRODUCT_EVENTS_QUEUE_SIZE", "64"))
+    # Idle SSE streams send a comment this often so proxies keep them open.
+    KEEPALIVE_SECONDS = float(os.environ.get("PRODUCT_EVENTS_KEEPALIVE_SECONDS", "15"))
+    # Products one WebSocket connection may watch at once.
+    MAX_SUBSCRIPTIONS = int(os.environ.get("PRODUCT_EVENTS_MAX_SUBSCRIPTIONS", "1000"))
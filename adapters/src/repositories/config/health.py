@@ -0,0 +1,11 @@
+import os
+
+
+class HealthConfig:
+    PROBE_TIMEOUT_SECONDS = float(os.environ.get("READINESS_PROBE_TIMEOUT_SECONDS", "1"))
+    PROBE_CACHE_SECONDS = float(os.environ.get("READINESS_PROBE_CACHE_SECONDS", "2"))
+    POOL_SATURATION_THRESHOLD = float(os.environ.get("READINESS_POOL_SATURATION", "0.9"))
+    ERROR_RATE_THRESHOLD = float(os.environ.get("READINESS_ERROR_RATE", "0.5"))
+    # Below this many requests in the window the error rate is not trusted.
+    ERROR_RATE_MIN_REQUESTS = int(os.environ.get("READINESS_ERROR_RATE_MIN_REQUESTS", "20"))
+    ERROR_WINDOW_SECONDS = int(os.environ.get("READINESS_ERROR_WINDOW_SECONDS", "60"))
@@ -3,3 +3,10 @@ import os
 
 class SQLConfig:
     DB_CONFIG = os.environ.get("DATABASE_URL") #changing SQL_URL to DATABASE_URL
+    ASYNC_DB_CONFIG = os.environ.get("ASYNC_DATABASE_URL")
+    POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+    MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))
+    POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+    POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+    POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+    RUN_MIGRATIONS = os.environ.get("DB_RUN_MIGRATIONS", "true").lower() == "true"
@@ -0,0 +1,4 @@
+from .instrumented_product_repository import (
+    AsyncInstrumentedProductRepository,
+    InstrumentedProductRepository,
+)
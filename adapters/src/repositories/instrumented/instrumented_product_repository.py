@@ -0,0 +1,192 @@
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from adapters.src.metrics import CounterChild, HistogramChild
+from app.src import (
+    AsyncProductRepository,
+    CollectionVersion,
+    Product,
+    ProductChange,
+    ProductFilter,
+    ProductRepository,
+    ProductSearchHit,
+    ProductStats,
+    StatusStats,
+)
+
+
+class InstrumentedProductRepository(ProductRepository):
+    """Records latency and errors of every call to the wrapped repository.
+
+    Works for any ProductRepository implementation. The label children are
+    handed in ready-made, so a call costs two dict lookups and a bisect.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        latency: Dict[str, HistogramChild],
+        errors: Dict[str, CounterChild],
+    ) -> None:
+        self.product_repository = product_repository
+        self.latency = latency
+        self.errors = errors
+
+    def _call(self, method: str, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return getattr(self.product_repository, method)(*args, **kwargs)
+        except Exception:
+            self.errors[method].inc()
+            raise
+        finally:
+            self.latency[method].observe(time.perf_counter() - started)
+
+    def create(self, product: Product) -> Product:
+        return self._call("create", product)
+
+    def bulk_create(self, products: List[Product]) -> List[str]:
+        return self._call("bulk_create", products)
+
+    def bulk_upsert(self, products: List[Product]) -> List[str]:
+        return self._call("bulk_upsert", products)
+
+    def list_all(self) -> List[Product]:
+        return self._call("list_all")
+
+    def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        return self._call("list_page", after=after, limit=limit, status=status)
+
+    def list_by_user(self, user_id: str, after: Optional[str], limit: int) -> List[Product]:
+        return self._call("list_by_user", user_id, after=after, limit=limit)
+
+    def count_by_user(self, user_id: str) -> Dict[str, int]:
+        return self._call("count_by_user", user_id)
+
+    def list_filtered(
+        self, product_filter: ProductFilter, limit: int, after: Optional[Tuple[Any, str]] = None
+    ) -> List[Product]:
+        return self._call("list_filtered", product_filter, limit=limit, after=after)
+
+    def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        return self._call("collection_version", status=status)
+
+    def search(
+        self, query: str, limit: int, after: Optional[Tuple[float, str]] = None
+    ) -> List[ProductSearchHit]:
+        return self._call("search", query, limit=limit, after=after)
+
+    def list_changes(self, since: int, limit: int) -> List[ProductChange]:
+        return self._call("list_changes", since, limit=limit)
+
+    def count_by_status(self) -> Dict[str, StatusStats]:
+        return self._call("count_by_status")
+
+    def stats(self, product_filter: ProductFilter = ProductFilter()) -> ProductStats:
+        return self._call("stats", product_filter)
+
+    def stream_all(self, batch_size: int = 1000) -> Iterator[Product]:
+        # Timed until the stream is exhausted or closed, not just until the
+        # generator object is created.
+        started = time.perf_counter()
+        try:
+            yield from self.product_repository.stream_all(batch_size=batch_size)
+        except Exception:
+            self.errors["stream_all"].inc()
+            raise
+        finally:
+            self.latency["stream_all"].observe(time.perf_counter() - started)
+
+    def get_by_id(self, product_id: str) -> Optional[Product]:
+        return self._call("get_by_id", product_id)
+
+    def get_many(self, product_ids: List[str]) -> List[Optional[Product]]:
+        return self._call("get_many", product_ids)
+
+    def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        return self._call("update", product=product, expected_version=expected_version)
+
+    def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        return self._call("delete", product_id, expected_version=expected_version)
+
+    def patch(
+        self, product_id: str, fields: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        return self._call("patch", product_id, fields, expected_version=expected_version)
+
+    def bulk_patch(self, product_ids: List[str], fields: Dict[str, Any]) -> List[str]:
+        return self._call("bulk_patch", product_ids, fields)
+
+    def filter(self, status: str) -> List[Product]:
+        return self._call("filter", status)
+
+
+class AsyncInstrumentedProductRepository(AsyncProductRepository):
+    """Async counterpart of InstrumentedProductRepository."""
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        latency: Dict[str, HistogramChild],
+        errors: Dict[str, CounterChild],
+    ) -> None:
+        self.product_repository = product_repository
+        self.latency = latency
+        self.errors = errors
+
+    async def _call(self, method: str, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await getattr(self.product_repository, method)(*args, **kwargs)
+        except Exception:
+            self.errors[method].inc()
+            raise
+        finally:
+            self.latency[method].observe(time.perf_counter() - started)
+
+    async def create(self, product: Product) -> Product:
+        return await self._call("create", product)
+
+    async def list_all(self) -> List[Product]:
+        return await self._call("list_all")
+
+    async def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        return await self._call("list_page", after=after, limit=limit, status=status)
+
+    async def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        return await self._call("collection_version", status=status)
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[Product]:
+        started = time.perf_counter()
+        try:
+            async for product in self.product_repository.stream_all(batch_size=batch_size):
+                yield product
+        except Exception:
+            self.errors["stream_all"].inc()
+            raise
+        finally:
+            self.latency["stream_all"].observe(time.perf_counter() - started)
+
+    async def get_by_id(self, product_id: str) -> Optional[Product]:
+        return await self._call("get_by_id", product_id)
+
+    async def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        return await self._call("update", product=product, expected_version=expected_version)
+
+    async def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        return await self._call("delete", product_id, expected_version=expected_version)
+
+    async def filter(self, status: str) -> List[Product]:
+        return await self._call("filter", status)
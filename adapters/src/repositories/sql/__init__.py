@@ -1,4 +1,6 @@
-from .connections import Connection, SQLConnection
+from .connections import AsyncSQLConnection, Connection, SQLConnection
+from .async_session_manager import AsyncSessionManager
 from .session_manager import SessionManager
+from .async_sql_product_repository import AsyncSQLProductRepository
 from .sql_product_repository import SQLProductRepository
 from .tables import ProductSchema
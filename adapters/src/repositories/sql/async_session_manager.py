@@ -0,0 +1,77 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from adapters.src.repositories.config.sql import SQLConfig
+
+from .connections import Connection
+from .tables import Base
+
+
+class AsyncSessionManager:
+    _engine: Optional[AsyncEngine] = None
+    _session_factory: Optional[async_sessionmaker] = None
+    _instance = None
+
+    def __new__(cls) -> "AsyncSessionManager":
+        if cls._instance is None:
+            cls._instance = super(AsyncSessionManager, cls).__new__(cls)
+        return cls._instance
+
+    @classmethod
+    async def initialize_session(cls, connection: Connection) -> None:
+        url = make_url(connection.get_connection_string())
+        options = {
+            "pool_pre_ping": SQLConfig.POOL_PRE_PING,
+            "pool_recycle": SQLConfig.POOL_RECYCLE,
+        }
+        if url.get_backend_name() != "sqlite":
+            options.update(
+                pool_size=SQLConfig.POOL_SIZE,
+                max_overflow=SQLConfig.MAX_OVERFLOW,
+                pool_timeout=SQLConfig.POOL_TIMEOUT,
+            )
+        engine = create_async_engine(url, **options)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        cls._engine = engine
+        cls._session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    @classmethod
+    def get_engine(cls) -> AsyncEngine:
+        if not cls._engine:
+            raise Exception("Async database session has not been initialized.")
+        return cls._engine
+
+    @classmethod
+    def get_session(cls) -> AsyncSession:
+        if not cls._session_factory:
+            raise Exception("Async database session has not been initialized.")
+        return cls._session_factory()
+
+    @classmethod
+    @asynccontextmanager
+    async def session_scope(cls) -> AsyncIterator[AsyncSession]:
+        session = cls.get_session()
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    @classmethod
+    async def close_session(cls) -> None:
+        if not cls._engine:
+            raise Exception("Async database session has not been initialized to be closed.")
+        await cls._engine.dispose()
+        cls._engine = None
+        cls._session_factory = None
@@ -0,0 +1,178 @@
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src import (
+    AsyncProductRepository,
+    CollectionVersion,
+    Product,
+    ProductRepositoryException,
+)
+from .counters import collection_version_statement, uses_counters
+from .outbox import CREATED, DELETED, UPDATED, append_statement, commit_order_lock
+from .mappers import PRODUCT_COLUMNS, row_to_product, to_product, to_utc
+from .tables import ProductSchema
+from .writes import delete_statement, select_statement, update_statement
+
+
+class AsyncSQLProductRepository(AsyncProductRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def list_all(self) -> List[Product]:
+        try:
+            async with self.session as session:
+                rows = await session.execute(select(*PRODUCT_COLUMNS))
+                return [row_to_product(row) for row in rows]
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="list")
+
+    async def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        try:
+            async with self.session as session:
+                statement = select(*PRODUCT_COLUMNS)
+                if status is not None:
+                    statement = statement.where(ProductSchema.status == status)
+                if after is not None:
+                    statement = statement.where(ProductSchema.product_id > after)
+                rows = await session.execute(
+                    statement.order_by(ProductSchema.product_id).limit(limit)
+                )
+                return [row_to_product(row) for row in rows]
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="list_page")
+
+    async def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        try:
+            async with self.session as session:
+                counters = await session.run_sync(
+                    lambda sync_session: uses_counters(sync_session.connection())
+                )
+                statement = collection_version_statement(counters, status)
+                count, last_modified = (await session.execute(statement)).one()
+                return CollectionVersion(count=count, last_modified=to_utc(last_modified))
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="collection_version")
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[Product]:
+        try:
+            async with self.session as session:
+                statement = (
+                    select(*PRODUCT_COLUMNS)
+                    .order_by(ProductSchema.product_id)
+                    .execution_options(yield_per=batch_size)
+                )
+                async for row in await session.stream(statement):
+                    yield row_to_product(row)
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="stream")
+
+    async def create(self, product: Product) -> Product:
+        try:
+            product_to_create = ProductSchema(
+                product_id=product.product_id,
+                user_id=product.user_id,
+                name=product.name,
+                description=product.description,
+                price=product.price,
+                location=product.location,
+                status=product.status,
+                is_available=product.is_available,
+            )
+            async with self.session as session:
+                await self._lock_change_feed(session)
+                session.add(product_to_create)
+                await self._record_changes(session, CREATED, [product.product_id])
+                await session.commit()
+            return product._replace(
+                updated_at=to_utc(product_to_create.updated_at),
+                version=product_to_create.version,
+            )
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="create")
+
+    async def get_by_id(self, product_id: str) -> Optional[Product]:
+        try:
+            async with self.session as session:
+                product = await session.get(ProductSchema, product_id)
+                if product is None:
+                    return None
+                return to_product(product)
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="find")
+
+    async def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            async with self.session as session:
+                await self._lock_change_feed(session)
+                statement = update_statement(product, expected_version)
+                if session.get_bind().dialect.update_returning:
+                    row = (await session.execute(statement.returning(*PRODUCT_COLUMNS))).first()
+                elif (await session.execute(statement)).rowcount:
+                    row = (await session.execute(select_statement(product.product_id))).first()
+                else:
+                    row = None
+                if row is not None:
+                    await self._record_changes(session, UPDATED, [product.product_id])
+                await session.commit()
+                return None if row is None else row_to_product(row)
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="update")
+
+    async def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            async with self.session as session:
+                await self._lock_change_feed(session)
+                statement = delete_statement(product_id, expected_version)
+                if session.get_bind().dialect.delete_returning:
+                    row = (await session.execute(statement.returning(*PRODUCT_COLUMNS))).first()
+                else:
+                    row = (await session.execute(select_statement(product_id))).first()
+                    if row is not None and not (await session.execute(statement)).rowcount:
+                        row = None
+                if row is not None:
+                    await self._record_changes(session, DELETED, [product_id])
+                await session.commit()
+                return None if row is None else row_to_product(row)
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="delete")
+
+    @staticmethod
+    async def _lock_change_feed(session: AsyncSession) -> None:
+        lock = commit_order_lock(session.get_bind().dialect.name)
+        if lock is not None:
+            await session.execute(lock)
+
+    @staticmethod
+    async def _record_changes(
+        session: AsyncSession, operation: str, product_ids: List[str]
+    ) -> None:
+        statement, rows = append_statement(operation, product_ids)
+        if rows:
+            await session.execute(statement, rows)
+
+    async def filter(self, status: str) -> List[Product]:
+        try:
+            async with self.session as session:
+                rows = await session.execute(
+                    select(*PRODUCT_COLUMNS).where(ProductSchema.status == status)
+                )
+                return [row_to_product(row) for row in rows]
+        except Exception:
+            await self.session.rollback()
+            raise ProductRepositoryException(method="get_by_status")
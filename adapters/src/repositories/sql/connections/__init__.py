@@ -1,2 +1,3 @@
+from .async_sql_connection import AsyncSQLConnection
 from .connection import Connection
 from .sql_connection import SQLConnection
@@ -0,0 +1,22 @@
+from sqlalchemy import make_url
+
+from adapters.src.repositories.config.sql import SQLConfig
+
+from .connection import Connection
+
+
+class AsyncSQLConnection(Connection):
+    _ASYNC_DRIVERS = {
+        "postgres": "postgresql+asyncpg",
+        "postgresql": "postgresql+asyncpg",
+        "sqlite": "sqlite+aiosqlite",
+    }
+
+    def get_connection_string(self) -> str:
+        if SQLConfig.ASYNC_DB_CONFIG:
+            return f"{SQLConfig.ASYNC_DB_CONFIG}"
+        url = make_url(f"{SQLConfig.DB_CONFIG}")
+        driver = self._ASYNC_DRIVERS.get(url.get_backend_name())
+        if driver is None:
+            raise Exception(f"No async driver available for '{url.get_backend_name()}'.")
+        return url.set(drivername=driver).render_as_string(hide_password=False)
@@ -0,0 +1,112 @@
+"""Materialized product counts per (status, is_available).
+
+Triggers installed by migration 6 keep `product_counters` current inside the
+transaction of every write to `products`, whichever code path or process makes
+it. `reconcile_product_counters` rebuilds the table from scratch to repair any
+drift; run it with:
+
+    python -m adapters.src.repositories.sql.counters
+"""
+import weakref
+from typing import Dict, Optional
+
+from sqlalchemy import Select, delete, func, insert, inspect, literal, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.src import StatusStats
+
+from .tables import ProductCounterSchema, ProductSchema
+
+# Dialects whose migration installs the triggers; elsewhere counts fall back
+# to aggregating the products table.
+COUNTER_DIALECTS = {"sqlite", "postgresql"}
+COUNTERS_MIGRATION = 6
+
+_installed: "weakref.WeakKeyDictionary[Engine, bool]" = weakref.WeakKeyDictionary()
+
+
+def uses_counters(connection: Connection) -> bool:
+    """True when migration 6 is recorded, so triggers keep the counters current.
+    `create_all` creates an empty product_counters table either way, so only
+    schema_migrations tells; without it counts aggregate the products table.
+    Checked once per engine: applying migrations takes a restart to be seen."""
+    if connection.dialect.name not in COUNTER_DIALECTS:
+        return False
+    installed = _installed.get(connection.engine)
+    if installed is None:
+        installed = inspect(connection).has_table("schema_migrations") and bool(
+            connection.scalar(
+                text("SELECT 1 FROM schema_migrations WHERE version = :version"),
+                {"version": COUNTERS_MIGRATION},
+            )
+        )
+        _installed[connection.engine] = installed
+    return installed
+
+
+def count_statement(status: Optional[str] = None) -> Select:
+    """Product count read from the counters, a handful of rows at most."""
+    statement = select(func.coalesce(func.sum(ProductCounterSchema.count), 0))
+    if status is not None:
+        statement = statement.where(ProductCounterSchema.status == status)
+    return statement
+
+
+def collection_version_statement(counters: bool, status: Optional[str] = None) -> Select:
+    """Row count and latest updated_at. The count is read from the counters
+    when triggers maintain them (see uses_counters), and counted from the
+    products otherwise."""
+    statement = select(func.count(), func.max(ProductSchema.updated_at))
+    if status is not None:
+        statement = statement.where(ProductSchema.status == status)
+    if not counters:
+        return statement
+    last_modified = statement.with_only_columns(func.max(ProductSchema.updated_at))
+    return select(count_statement(status).scalar_subquery(), last_modified.scalar_subquery())
+
+
+def counts_by_status(rows) -> Dict[str, StatusStats]:
+    by_status: Dict[str, StatusStats] = {}
+    for status, is_available, count in rows:
+        if not count:
+            continue
+        current = by_status.get(status, StatusStats(0, 0))
+        by_status[status] = StatusStats(
+            current.count + count, current.available + (count if is_available else 0)
+        )
+    return by_status
+
+
+def reconcile_product_counters(connection: Connection) -> None:
+    """Recomputes every counter from the products table, in the caller's
+    transaction. On PostgreSQL writers are blocked (readers are not) until that
+    transaction ends, so no write lands between the recount and the rewrite."""
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("LOCK TABLE products IN SHARE MODE"))
+    status = func.coalesce(ProductSchema.status, literal(""))
+    is_available = func.coalesce(ProductSchema.is_available, literal(False))
+    connection.execute(delete(ProductCounterSchema))
+    connection.execute(
+        insert(ProductCounterSchema).from_select(
+            ["status", "is_available", "count"],
+            select(status, is_available, func.count())
+            .select_from(ProductSchema)
+            .group_by(status, is_available),
+        )
+    )
+
+
+def main() -> None:
+    from sqlalchemy import create_engine
+
+    from .connections import SQLConnection
+
+    engine = create_engine(SQLConnection().get_connection_string())
+    with engine.begin() as connection:
+        reconcile_product_counters(connection)
+        total = connection.scalar(count_statement())
+    print(f"Reconciled product counters: {total} products")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import ColumnElement, Select, select, tuple_
+
+from app.src import ProductFilter
+
+from .mappers import PRODUCT_COLUMNS
+from .tables import ProductSchema
+
+_products = ProductSchema.__table__
+
+
+def filter_statement(
+    dialect: str, product_filter: ProductFilter, limit: int, after: Optional[Tuple[Any, str]]
+) -> Select:
+    """One query for the whole filter, shaped so every condition can use the
+    indexes from migrations 1 and 4."""
+    sort = product_filter.sort
+    sort_column = _products.c[sort.field]
+    product_id = _products.c.product_id
+    statement = select(*PRODUCT_COLUMNS).where(*filter_conditions(dialect, product_filter))
+
+    if after is not None:
+        if sort.field == "product_id":
+            key, last = product_id, after[1]
+        else:
+            key, last = tuple_(sort_column, product_id), tuple_(*after)
+        statement = statement.where(key < last if sort.descending else key > last)
+
+    if sort.field == "product_id":
+        order_by = [product_id]
+    else:
+        order_by = [sort_column, product_id]
+    if sort.descending:
+        order_by = [column.desc() for column in order_by]
+    return statement.order_by(*order_by).limit(limit)
+
+
+def filter_conditions(dialect: str, product_filter: ProductFilter) -> List[ColumnElement]:
+    """WHERE clauses for every criterion set on the filter."""
+    conditions: List[ColumnElement] = []
+    if product_filter.statuses:
+        conditions.append(_products.c.status.in_(product_filter.statuses))
+    if product_filter.is_available is not None:
+        conditions.append(_products.c.is_available.is_(product_filter.is_available))
+    if product_filter.price_min is not None:
+        conditions.append(_products.c.price >= product_filter.price_min)
+    if product_filter.price_max is not None:
+        conditions.append(_products.c.price <= product_filter.price_max)
+    if product_filter.user_id is not None:
+        conditions.append(_products.c.user_id == product_filter.user_id)
+    if product_filter.location_prefix:
+        conditions.append(
+            _starts_with(dialect, _products.c.location, product_filter.location_prefix)
+        )
+    return conditions
+
+
+def _starts_with(dialect: str, column: ColumnElement, prefix: str) -> ColumnElement:
+    if dialect == "sqlite":
+        # SQLite's LIKE is case-insensitive and so cannot use a BINARY index;
+        # a half-open range matches the same (case-sensitive) prefix and can.
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return (column >= prefix) & (column < upper)
+    # PostgreSQL serves this LIKE from the text_pattern_ops index.
+    return column.startswith(prefix, autoescape=True)
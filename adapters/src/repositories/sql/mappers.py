@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional, Sequence
+
+from app.src import Product
+
+from .tables import ProductSchema
+
+
+def to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands timestamps back without their offset; they are stored as UTC.
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def to_product(product: ProductSchema) -> Product:
+    return Product(
+        product_id=str(product.product_id),
+        user_id=str(product.user_id),
+        name=str(product.name),
+        description=str(product.description),
+        price=Decimal(product.price),
+        location=str(product.location),
+        status=str(product.status),
+        is_available=bool(product.is_available),
+        updated_at=to_utc(product.updated_at),
+        version=product.version,
+    )
+
+
+# Column projection in Product field order: selecting these skips building ORM
+# instances (identity map, attribute instrumentation) for read-only listings.
+PRODUCT_COLUMNS = tuple(ProductSchema.__table__.c[field] for field in Product._fields)
+
+
+def row_to_product(row: Sequence) -> Product:
+    # Drivers already return str, Decimal and bool for these columns.
+    *fields, updated_at, version = row
+    return Product(*fields, to_utc(updated_at), version)
+
+
+def to_row(product: Product) -> dict:
+    return {
+        "product_id": product.product_id,
+        "user_id": product.user_id,
+        "name": product.name,
+        "description": product.description,
+        "price": product.price,
+        "location": product.location,
+        "status": getattr(product.status, "value", product.status),
+        "is_available": product.is_available,
+    }
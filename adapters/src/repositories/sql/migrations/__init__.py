@@ -0,0 +1,3 @@
+from .base import Migration
+from .runner import MigrationRunner
+from .versions import MIGRATIONS
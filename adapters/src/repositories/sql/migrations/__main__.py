@@ -0,0 +1,27 @@
+import sys
+
+from sqlalchemy import create_engine
+
+from adapters.src.repositories.sql.connections import SQLConnection
+
+from .runner import MigrationRunner
+
+USAGE = "usage: python -m adapters.src.repositories.sql.migrations [upgrade|status]"
+
+
+def main(command: str) -> None:
+    runner = MigrationRunner(create_engine(SQLConnection().get_connection_string()))
+    if command == "upgrade":
+        applied = runner.upgrade()
+        print(f"Applied migrations: {applied or 'none'}")
+    elif command == "status":
+        for migration in runner.migrations:
+            state = "applied" if migration.version in runner.applied_versions() else "pending"
+            print(f"{migration.version:04d} {state:8} {migration.description}")
+    else:
+        print(USAGE)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "")
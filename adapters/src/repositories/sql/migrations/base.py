@@ -0,0 +1,38 @@
+from typing import Sequence
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+class Migration:
+    """One versioned schema change.
+
+    Migrations with `transactional = False` run on an autocommit connection,
+    which PostgreSQL needs for `CREATE INDEX CONCURRENTLY` (building an index
+    without locking writes on a live table).
+    """
+
+    version: int
+    description: str
+    transactional: bool = True
+
+    def upgrade(self, connection: Connection) -> None:
+        raise NotImplementedError
+
+
+def create_index(
+    connection: Connection, name: str, table: str, columns: Sequence[str]
+) -> None:
+    concurrently = "CONCURRENTLY " if connection.dialect.name == "postgresql" else ""
+    connection.execute(
+        text(f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+    )
+
+
+def has_column(connection: Connection, table: str, column: str) -> bool:
+    return column in {info["name"] for info in inspect(connection).get_columns(table)}
+
+
+def drop_index(connection: Connection, name: str) -> None:
+    concurrently = "CONCURRENTLY " if connection.dialect.name == "postgresql" else ""
+    connection.execute(text(f"DROP INDEX {concurrently}IF EXISTS {name}"))
@@ -0,0 +1,81 @@
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from .base import Migration
+from .versions import MIGRATIONS
+
+logger = logging.getLogger(__name__)
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String),
+    Column("applied_at", DateTime, server_default=func.now()),
+)
+
+# Arbitrary key so only one worker applies migrations at a time on PostgreSQL.
+_ADVISORY_LOCK_KEY = 7_201_305
+
+
+class MigrationRunner:
+    def __init__(self, engine: Engine, migrations: List[Migration] = MIGRATIONS) -> None:
+        self.engine = engine
+        self.migrations = sorted(migrations, key=lambda migration: migration.version)
+
+    def applied_versions(self) -> List[int]:
+        _metadata.create_all(self.engine)
+        with self.engine.connect() as connection:
+            return list(connection.scalars(select(schema_migrations.c.version)))
+
+    def pending(self) -> List[Migration]:
+        applied = set(self.applied_versions())
+        return [migration for migration in self.migrations if migration.version not in applied]
+
+    def upgrade(self) -> List[int]:
+        _metadata.create_all(self.engine)
+        with self._lock():
+            applied = []
+            for migration in self.pending():
+                self._apply(migration)
+                applied.append(migration.version)
+            return applied
+
+    def _apply(self, migration: Migration) -> None:
+        logger.info("Applying migration %s: %s", migration.version, migration.description)
+        if migration.transactional:
+            with self.engine.begin() as connection:
+                migration.upgrade(connection)
+                self._record(connection, migration)
+        else:
+            with self.engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            ) as connection:
+                migration.upgrade(connection)
+            with self.engine.begin() as connection:
+                self._record(connection, migration)
+
+    @staticmethod
+    def _record(connection: Connection, migration: Migration) -> None:
+        connection.execute(
+            schema_migrations.insert().values(
+                version=migration.version, description=migration.description
+            )
+        )
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        if self.engine.dialect.name != "postgresql":
+            yield
+            return
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock:
+            lock.execute(text(f"SELECT pg_advisory_lock({_ADVISORY_LOCK_KEY})"))
+            try:
+                yield
+            finally:
+                lock.execute(text(f"SELECT pg_advisory_unlock({_ADVISORY_LOCK_KEY})"))
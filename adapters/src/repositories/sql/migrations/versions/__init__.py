@@ -0,0 +1,19 @@
+from .m0001_product_indexes import AddProductIndexes
+from .m0002_product_updated_at import AddProductUpdatedAt
+from .m0003_product_search import AddProductSearch
+from .m0004_product_filter_indexes import AddProductFilterIndexes
+from .m0005_product_user_indexes import AddProductUserIndexes
+from .m0006_product_counters import AddProductCounters
+from .m0007_product_version import AddProductVersion
+from .m0008_product_changes import AddProductChanges
+
+MIGRATIONS = [
+    AddProductIndexes(),
+    AddProductUpdatedAt(),
+    AddProductSearch(),
+    AddProductFilterIndexes(),
+    AddProductUserIndexes(),
+    AddProductCounters(),
+    AddProductVersion(),
+    AddProductChanges(),
+]
@@ -0,0 +1,17 @@
+from sqlalchemy.engine import Connection
+
+from ..base import Migration, create_index
+
+
+class AddProductIndexes(Migration):
+    version = 1
+    description = "Index products by status, user, status + availability and location"
+    transactional = False
+
+    def upgrade(self, connection: Connection) -> None:
+        create_index(connection, "ix_products_status", "products", ["status"])
+        create_index(connection, "ix_products_user_id", "products", ["user_id"])
+        create_index(
+            connection, "ix_products_status_is_available", "products", ["status", "is_available"]
+        )
+        create_index(connection, "ix_products_location", "products", ["location"])
@@ -0,0 +1,24 @@
+from sqlalchemy import DateTime, column, table, text, update
+from sqlalchemy.engine import Connection
+
+from ...tables.product import utcnow
+from ..base import Migration, create_index, has_column
+
+_TIMESTAMP_TYPES = {"postgresql": "TIMESTAMP WITH TIME ZONE"}
+
+
+class AddProductUpdatedAt(Migration):
+    version = 2
+    description = "Track products.updated_at for ETag and Last-Modified headers"
+    transactional = False
+
+    def upgrade(self, connection: Connection) -> None:
+        if not has_column(connection, "products", "updated_at"):
+            column_type = _TIMESTAMP_TYPES.get(connection.dialect.name, "DATETIME")
+            connection.execute(text(f"ALTER TABLE products ADD COLUMN updated_at {column_type}"))
+        # Rows written before the column existed get one shared timestamp.
+        products = table("products", column("updated_at", DateTime(timezone=True)))
+        connection.execute(
+            update(products).where(products.c.updated_at.is_(None)).values(updated_at=utcnow())
+        )
+        create_index(connection, "ix_products_updated_at", "products", ["updated_at"])
@@ -0,0 +1,57 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ...search import POSTGRESQL_SEARCH_DOCUMENT
+from ..base import Migration, create_index
+
+# Name hits outweigh description hits; product_id is only indexed so the
+# triggers can find a product's entry without scanning the whole index.
+_SQLITE_STATEMENTS = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5("
+    "product_id, name, description, tokenize='unicode61 remove_diacritics 2')",
+    "INSERT INTO products_fts(products_fts, rank) VALUES ('rank', 'bm25(0.0, 10.0, 5.0)')",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_insert AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_fts (product_id, name, description) "
+    "VALUES (new.product_id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_delete AFTER DELETE ON products BEGIN "
+    "DELETE FROM products_fts WHERE products_fts MATCH "
+    "'product_id : \"' || replace(old.product_id, '\"', '\"\"') || '\"' "
+    "AND product_id = old.product_id; END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_update "
+    "AFTER UPDATE OF product_id, name, description ON products BEGIN "
+    "DELETE FROM products_fts WHERE products_fts MATCH "
+    "'product_id : \"' || replace(old.product_id, '\"', '\"\"') || '\"' "
+    "AND product_id = old.product_id; "
+    "INSERT INTO products_fts (product_id, name, description) "
+    "VALUES (new.product_id, new.name, new.description); END",
+    # Rebuilt from scratch, so re-running after the products table was
+    # recreated leaves no stale entries behind.
+    "DELETE FROM products_fts",
+    "INSERT INTO products_fts (product_id, name, description) "
+    "SELECT product_id, name, description FROM products",
+]
+
+# An expression index rather than a stored column: adding a generated column
+# rewrites the whole table under an exclusive lock, while the index builds
+# concurrently next to live writes.
+_POSTGRESQL_SEARCH_INDEX = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_search_document "
+    f"ON products USING GIN (({POSTGRESQL_SEARCH_DOCUMENT}))"
+)
+
+
+class AddProductSearch(Migration):
+    version = 3
+    description = "Full-text index over product names and descriptions"
+    transactional = False
+
+    def upgrade(self, connection: Connection) -> None:
+        if connection.dialect.name == "sqlite":
+            for statement in _SQLITE_STATEMENTS:
+                connection.execute(text(statement))
+        elif connection.dialect.name == "postgresql":
+            connection.execute(text(_POSTGRESQL_SEARCH_INDEX))
+        else:
+            # Other databases fall back to a LIKE scan; an index on name still
+            # helps the prefix matches.
+            create_index(connection, "ix_products_name", "products", ["name"])
@@ -0,0 +1,21 @@
+from sqlalchemy.engine import Connection
+
+from ..base import Migration, create_index
+
+
+class AddProductFilterIndexes(Migration):
+    version = 4
+    description = "Index products by price and, on PostgreSQL, by location prefix"
+    transactional = False
+
+    def upgrade(self, connection: Connection) -> None:
+        create_index(connection, "ix_products_price", "products", ["price", "product_id"])
+        if connection.dialect.name == "postgresql":
+            # LIKE 'prefix%' can only use a btree index built with pattern ops
+            # when the database collation is not C.
+            create_index(
+                connection,
+                "ix_products_location_pattern",
+                "products",
+                ["location text_pattern_ops"],
+            )
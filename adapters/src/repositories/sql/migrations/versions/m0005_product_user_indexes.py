@@ -0,0 +1,18 @@
+from sqlalchemy.engine import Connection
+
+from ..base import Migration, create_index, drop_index
+
+
+class AddProductUserIndexes(Migration):
+    version = 5
+    description = "Index products by user for keyset pages and per-status counts"
+    transactional = False
+
+    def upgrade(self, connection: Connection) -> None:
+        create_index(
+            connection, "ix_products_user_id_product_id", "products", ["user_id", "product_id"]
+        )
+        create_index(connection, "ix_products_user_id_status", "products", ["user_id", "status"])
+        # Both new indexes lead with user_id, so the single column one only
+        # costs writes.
+        drop_index(connection, "ix_products_user_id")
@@ -0,0 +1,75 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ...counters import reconcile_product_counters
+from ...tables import ProductCounterSchema
+from ..base import Migration
+
+_SQLITE_DECREMENT = (
+    "UPDATE product_counters SET count = count - 1 WHERE status = "
+    "coalesce(old.status, '') AND is_available = coalesce(old.is_available, 0);"
+)
+_SQLITE_INCREMENT = (
+    "INSERT INTO product_counters (status, is_available, count) "
+    "VALUES (coalesce(new.status, ''), coalesce(new.is_available, 0), 1) "
+    "ON CONFLICT (status, is_available) DO UPDATE SET count = count + 1;"
+)
+_SQLITE_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS product_counters_insert AFTER INSERT ON products "
+    f"BEGIN {_SQLITE_INCREMENT} END",
+    "CREATE TRIGGER IF NOT EXISTS product_counters_delete AFTER DELETE ON products "
+    f"BEGIN {_SQLITE_DECREMENT} END",
+    "CREATE TRIGGER IF NOT EXISTS product_counters_update "
+    "AFTER UPDATE OF status, is_available ON products "
+    "WHEN old.status IS NOT new.status OR old.is_available IS NOT new.is_available "
+    f"BEGIN {_SQLITE_DECREMENT} {_SQLITE_INCREMENT} END",
+]
+
+_POSTGRESQL_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_counters_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND NEW.status IS NOT DISTINCT FROM OLD.status
+        AND NEW.is_available IS NOT DISTINCT FROM OLD.is_available THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE product_counters SET count = count - 1
+        WHERE status = coalesce(OLD.status, '')
+            AND is_available = coalesce(OLD.is_available, false);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO product_counters (status, is_available, count)
+        VALUES (coalesce(NEW.status, ''), coalesce(NEW.is_available, false), 1)
+        ON CONFLICT (status, is_available)
+        DO UPDATE SET count = product_counters.count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+_POSTGRESQL_TRIGGER = (
+    "CREATE TRIGGER product_counters_apply "
+    "AFTER INSERT OR DELETE OR UPDATE OF status, is_available ON products "
+    "FOR EACH ROW EXECUTE FUNCTION product_counters_apply()"
+)
+
+
+class AddProductCounters(Migration):
+    version = 6
+    description = "Maintain product counts per status and availability with triggers"
+
+    def upgrade(self, connection: Connection) -> None:
+        ProductCounterSchema.__table__.create(connection, checkfirst=True)
+        if connection.dialect.name == "sqlite":
+            for statement in _SQLITE_TRIGGERS:
+                connection.execute(text(statement))
+        elif connection.dialect.name == "postgresql":
+            connection.execute(text(_POSTGRESQL_FUNCTION))
+            connection.execute(text("DROP TRIGGER IF EXISTS product_counters_apply ON products"))
+            connection.execute(text(_POSTGRESQL_TRIGGER))
+        else:
+            return
+        # Same transaction as the triggers, so no write is counted twice or
+        # missed in between.
+        reconcile_product_counters(connection)
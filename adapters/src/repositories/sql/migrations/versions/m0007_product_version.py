@@ -0,0 +1,17 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..base import Migration, has_column
+
+
+class AddProductVersion(Migration):
+    version = 7
+    description = "Version products for optimistic concurrency control"
+
+    def upgrade(self, connection: Connection) -> None:
+        if not has_column(connection, "products", "version"):
+            # A constant default: PostgreSQL 11+ and SQLite add the column
+            # without rewriting the table.
+            connection.execute(
+                text("ALTER TABLE products ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+            )
@@ -0,0 +1,12 @@
+from sqlalchemy.engine import Connection
+
+from ...tables import ProductChangeSchema
+from ..base import Migration
+
+
+class AddProductChanges(Migration):
+    version = 8
+    description = "Record product writes in a product_changes outbox"
+
+    def upgrade(self, connection: Connection) -> None:
+        ProductChangeSchema.__table__.create(connection, checkfirst=True)
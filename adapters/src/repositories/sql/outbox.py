@@ -0,0 +1,67 @@
+"""Product change feed, written as a transactional outbox.
+
+Write methods of the SQL repositories call `append_statement` with the ids they
+changed before committing, so the change rows commit or roll back with the
+write. Readers page through `product_changes` by sequence.
+
+A sequence is handed out when its row is inserted but only becomes visible
+when the transaction commits. Were two writers to commit in the other order, a
+reader could see N+1 before N, move past it and never see N. On PostgreSQL
+every write transaction therefore takes a transaction-scoped advisory lock,
+held until commit, so sequences are assigned in commit order and resuming from
+the last one seen never skips a change. The lock is taken before the
+transaction writes any row: were it taken after, a writer holding row locks
+could wait on the advisory lock held by one waiting on those rows, and
+PostgreSQL would abort one of them as a deadlock. SQLite already serializes
+writers.
+"""
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import Insert, Select, func, insert, select
+
+from app.src import ProductChange
+
+from .mappers import to_utc
+from .tables import ProductChangeSchema
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+# Arbitrary application-wide key of the PostgreSQL advisory lock.
+OUTBOX_LOCK_KEY = 0x70726F64
+
+
+def commit_order_lock(dialect: str) -> Optional[Select]:
+    """The statement to run first in a write transaction, if the dialect needs
+    one to keep sequences in commit order."""
+    if dialect != "postgresql":
+        return None
+    return select(func.pg_advisory_xact_lock(OUTBOX_LOCK_KEY))
+
+
+def append_statement(operation: str, product_ids: Iterable[str]) -> Tuple[Insert, List[dict]]:
+    """The INSERT and its parameters (one set per product, executemany) that
+    record `operation` for every product id."""
+    rows = [{"product_id": product_id, "operation": operation} for product_id in product_ids]
+    return insert(ProductChangeSchema), rows
+
+
+def changes_statement(since: int, limit: int) -> Select:
+    """Changes after the `since` sequence, oldest first, read off the primary key."""
+    return (
+        select(
+            ProductChangeSchema.sequence,
+            ProductChangeSchema.product_id,
+            ProductChangeSchema.operation,
+            ProductChangeSchema.changed_at,
+        )
+        .where(ProductChangeSchema.sequence > since)
+        .order_by(ProductChangeSchema.sequence)
+        .limit(limit)
+    )
+
+
+def row_to_change(row) -> ProductChange:
+    sequence, product_id, operation, changed_at = row
+    return ProductChange(sequence, product_id, operation, to_utc(changed_at))
@@ -0,0 +1,92 @@
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import (
+    Float,
+    Select,
+    String,
+    and_,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from .mappers import PRODUCT_COLUMNS
+from .tables import ProductSchema
+
+MAX_SEARCH_TERMS = 16
+
+# The document searched on PostgreSQL. Migration 3 builds its GIN index on this
+# exact expression, so queries spell it the same way for the planner to use it.
+POSTGRESQL_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+_products = ProductSchema.__table__
+
+
+def search_terms(query: str) -> List[str]:
+    """Words of the query, lower-cased; everything else is dropped so user input
+    never reaches the database's query syntax."""
+    return re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+
+
+def search_statement(
+    dialect: str, terms: List[str], limit: int, after: Optional[Tuple[float, str]]
+) -> Select:
+    """Products matching every term (the last one as a prefix, for search as
+    you type) with their `score` column, best match first."""
+    if dialect == "sqlite":
+        statement, score = _sqlite_search(terms)
+    elif dialect == "postgresql":
+        statement, score = _postgresql_search(terms)
+    else:
+        statement, score = _like_search(terms)
+    if after is not None:
+        statement = statement.where(
+            tuple_(score, _products.c.product_id) > tuple_(literal(after[0]), literal(after[1]))
+        )
+    return statement.order_by(score, _products.c.product_id).limit(limit)
+
+
+def _sqlite_search(terms: List[str]) -> Tuple[Select, object]:
+    phrases = [f'"{term}"' for term in terms]
+    phrases[-1] += "*"
+    hits = (
+        text(
+            "SELECT product_id, rank AS score FROM products_fts "
+            "WHERE products_fts MATCH :match"
+        )
+        .bindparams(match=f"{{name description}} : ({' '.join(phrases)})")
+        .columns(product_id=String, score=Float)
+        .subquery("hits")
+    )
+    statement = select(*PRODUCT_COLUMNS, hits.c.score).join_from(
+        _products, hits, hits.c.product_id == _products.c.product_id
+    )
+    return statement, hits.c.score
+
+
+def _postgresql_search(terms: List[str]) -> Tuple[Select, object]:
+    query = func.to_tsquery("simple", " & ".join(terms[:-1] + [f"{terms[-1]}:*"]))
+    vector = literal_column(f"({POSTGRESQL_SEARCH_DOCUMENT})", TSVECTOR)
+    # ts_rank_cd grows with relevance; negated so lower still ranks first.
+    score = -func.ts_rank_cd(vector, query)
+    statement = select(*PRODUCT_COLUMNS, score.label("score")).where(vector.bool_op("@@")(query))
+    return statement, score
+
+
+def _like_search(terms: List[str]) -> Tuple[Select, object]:
+    score = literal(0.0, Float)
+    matches = [
+        or_(_products.c.name.ilike(f"%{term}%"), _products.c.description.ilike(f"%{term}%"))
+        for term in terms
+    ]
+    statement = select(*PRODUCT_COLUMNS, score.label("score")).where(and_(*matches))
+    return statement, score
@@ -1,12 +1,20 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.engine import URL
 from sqlalchemy.orm import Session, sessionmaker
 
+from adapters.src.repositories.config.sql import SQLConfig
+
 from .connections import Connection
+from .migrations import MigrationRunner
 from .tables import Base
 
 
 class SessionManager:
-    _session = None
+    _engine: Optional[Engine] = None
+    _session_factory: Optional[sessionmaker] = None
     _instance = None
 
     def __new__(cls) -> "SessionManager":
@@ -16,20 +24,65 @@ class SessionManager:
 
     @classmethod
     def initialize_session(cls, connection: Connection):
-        engine = create_engine(connection.get_connection_string())
+        url = make_url(connection.get_connection_string())
+        engine = create_engine(url, **cls._engine_options(url))
         Base.metadata.create_all(engine)
-        session_factory = sessionmaker(bind=engine)
-        cls._session = session_factory()
+        if SQLConfig.RUN_MIGRATIONS:
+            MigrationRunner(engine).upgrade()
+        cls._engine = engine
+        cls._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    @staticmethod
+    def _engine_options(url: URL) -> dict:
+        options = {
+            "pool_pre_ping": SQLConfig.POOL_PRE_PING,
+            "pool_recycle": SQLConfig.POOL_RECYCLE,
+        }
+        if url.get_backend_name() == "sqlite":
+            # SQLite picks its own pool class and a session may be closed from a
+            # different worker thread than the one that opened it.
+            options["connect_args"] = {"check_same_thread": False}
+        else:
+            options.update(
+                pool_size=SQLConfig.POOL_SIZE,
+                max_overflow=SQLConfig.MAX_OVERFLOW,
+                pool_timeout=SQLConfig.POOL_TIMEOUT,
+            )
+        return options
+
+    @classmethod
+    def get_engine(cls) -> Engine:
+        if not cls._engine:
+            raise Exception("Database session has not been initialized.")
+        return cls._engine
 
     @classmethod
     def get_session(cls) -> Session:
-        if not cls._session:
+        """Returns a new session bound to the pooled engine.
+
+        Every caller gets its own session, so one request's transaction and
+        rollback never leak into another one.
+        """
+        if not cls._session_factory:
             raise Exception("Database session has not been initialized.")
-        return cls._session
+        return cls._session_factory()
+
+    @classmethod
+    @contextmanager
+    def session_scope(cls) -> Iterator[Session]:
+        session = cls.get_session()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
     @classmethod
     def close_session(cls) -> None:
-        if not cls._session:
+        if not cls._engine:
             raise Exception("Database session has not been initialized to be closed.")
-        cls._session.close()
-        cls._session = None
+        cls._engine.dispose()
+        cls._engine = None
+        cls._session_factory = None
@@ -1,38 +1,182 @@
-from typing import List, Optional
-from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import Update, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from app.src import Product, ProductRepository, ProductRepositoryException
-from .tables import ProductSchema
+from app.src import (
+    CollectionVersion,
+    Product,
+    ProductChange,
+    ProductFilter,
+    ProductRepository,
+    ProductRepositoryException,
+    ProductSearchHit,
+    ProductStats,
+    StatusStats,
+)
+from .mappers import PRODUCT_COLUMNS, row_to_product, to_product, to_row, to_utc
+from .counters import (
+    collection_version_statement,
+    counts_by_status,
+    uses_counters,
+)
+from .filters import filter_statement
+from .outbox import (
+    CREATED,
+    DELETED,
+    UPDATED,
+    append_statement,
+    changes_statement,
+    commit_order_lock,
+    row_to_change,
+)
+from .search import search_statement, search_terms
+from .stats import product_stats
+from .tables import ProductCounterSchema, ProductSchema
+from .tables.product import utcnow
+from .writes import (
+    delete_statement,
+    overwrite_many_statement,
+    patch_statement,
+    select_statement,
+    update_statement,
+)
 from app.src.exceptions import ProductNotFoundException
 
 class SQLProductRepository(ProductRepository):
+    BULK_CHUNK_SIZE = 1000
+    _UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
     def __init__(self, session: Session) -> None:
         self.session = session
 
     def list_all(self) -> List[Product]:
         try:
             with self.session as session:
-                products = session.query(ProductSchema).all()
-                if products is None:
-                    return []
-                product_list = [
-                    Product(
-                        product_id=str(product.product_id),
-                        user_id=str(product.user_id),
-                        name=str(product.name),
-                        description=str(product.description),
-                        price=Decimal(product.price),
-                        location=str(product.location),
-                        status=str(product.status),
-                        is_available=bool(product.is_available),
-                    )
-                    for product in products
-                ]
-                return product_list
+                rows = session.execute(select(*PRODUCT_COLUMNS))
+                return [row_to_product(row) for row in rows]
         except Exception:
             self.session.rollback()
             raise ProductRepositoryException(method="list")
 
+    def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        try:
+            with self.session as session:
+                statement = select(*PRODUCT_COLUMNS)
+                if status is not None:
+                    statement = statement.where(ProductSchema.status == status)
+                if after is not None:
+                    statement = statement.where(ProductSchema.product_id > after)
+                rows = session.execute(statement.order_by(ProductSchema.product_id).limit(limit))
+                return [row_to_product(row) for row in rows]
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="list_page")
+
+    def list_by_user(self, user_id: str, after: Optional[str], limit: int) -> List[Product]:
+        try:
+            with self.session as session:
+                statement = select(*PRODUCT_COLUMNS).where(ProductSchema.user_id == user_id)
+                if after is not None:
+                    statement = statement.where(ProductSchema.product_id > after)
+                rows = session.execute(statement.order_by(ProductSchema.product_id).limit(limit))
+                return [row_to_product(row) for row in rows]
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="list_by_user")
+
+    def count_by_user(self, user_id: str) -> Dict[str, int]:
+        try:
+            with self.session as session:
+                rows = session.execute(
+                    select(ProductSchema.status, func.count())
+                    .where(ProductSchema.user_id == user_id)
+                    .group_by(ProductSchema.status)
+                )
+                return {product_status: count for product_status, count in rows}
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="count_by_user")
+
+    def list_filtered(
+        self, product_filter: ProductFilter, limit: int, after: Optional[Tuple[Any, str]] = None
+    ) -> List[Product]:
+        try:
+            with self.session as session:
+                dialect = session.get_bind().dialect.name
+                rows = session.execute(filter_statement(dialect, product_filter, limit, after))
+                return [row_to_product(row) for row in rows]
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="list_filtered")
+
+    def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        try:
+            with self.session as session:
+                counters = uses_counters(session.connection())
+                statement = collection_version_statement(counters, status)
+                count, last_modified = session.execute(statement).one()
+                return CollectionVersion(count=count, last_modified=to_utc(last_modified))
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="collection_version")
+
+    def search(
+        self, query: str, limit: int, after: Optional[Tuple[float, str]] = None
+    ) -> List[ProductSearchHit]:
+        terms = search_terms(query)
+        if not terms:
+            return []
+        try:
+            with self.session as session:
+                dialect = session.get_bind().dialect.name
+                rows = session.execute(search_statement(dialect, terms, limit, after))
+                return [ProductSearchHit(row_to_product(row[:-1]), row[-1]) for row in rows]
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="search")
+
+    def count_by_status(self) -> Dict[str, StatusStats]:
+        try:
+            with self.session as session:
+                if uses_counters(session.connection()):
+                    statement = select(
+                        ProductCounterSchema.status,
+                        ProductCounterSchema.is_available,
+                        ProductCounterSchema.count,
+                    )
+                else:
+                    statement = select(
+                        ProductSchema.status, ProductSchema.is_available, func.count()
+                    ).group_by(ProductSchema.status, ProductSchema.is_available)
+                return counts_by_status(session.execute(statement))
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="count_by_status")
+
+    def stats(self, product_filter: ProductFilter = ProductFilter()) -> ProductStats:
+        try:
+            with self.session as session:
+                return product_stats(session, product_filter)
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="stats")
+
+    def stream_all(self, batch_size: int = 1000) -> Iterator[Product]:
+        try:
+            with self.session as session:
+                statement = (
+                    select(*PRODUCT_COLUMNS)
+                    .order_by(ProductSchema.product_id)
+                    .execution_options(yield_per=batch_size)
+                )
+                for row in session.execute(statement):
+                    yield row_to_product(row)
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="stream")
+
     def create(self, product: Product) -> Product:
         try:
             product_to_create = ProductSchema(
@@ -46,13 +190,118 @@ class SQLProductRepository(ProductRepository):
                 is_available=product.is_available,
             )
             with self.session as session:
+                self._lock_change_feed(session)
                 session.add(product_to_create)
+                self._record_changes(session, CREATED, [product.product_id])
                 session.commit()
-            return product
+            return product._replace(
+                updated_at=to_utc(product_to_create.updated_at),
+                version=product_to_create.version,
+            )
         except Exception:
             self.session.rollback()
             raise ProductRepositoryException(method="create")
 
+    def bulk_create(self, products: List[Product]) -> List[str]:
+        try:
+            created: List[str] = []
+            with self.session as session:
+                self._lock_change_feed(session)
+                for chunk in self._chunks(products):
+                    existing = self._existing_ids(session, chunk)
+                    rows = [to_row(p) for p in chunk if p.product_id not in existing]
+                    if rows:
+                        session.execute(insert(ProductSchema), rows)
+                        new_ids = [row["product_id"] for row in rows]
+                        created.extend(new_ids)
+                        self._record_changes(session, CREATED, new_ids)
+                session.commit()
+            return created
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="bulk_create")
+
+    def bulk_upsert(self, products: List[Product]) -> List[str]:
+        try:
+            created: List[str] = []
+            now = utcnow()
+            with self.session as session:
+                self._lock_change_feed(session)
+                dialect_insert = self._UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+                for chunk in self._chunks(products):
+                    existing = self._existing_ids(session, chunk)
+                    # Column onupdate does not fire for ON CONFLICT DO UPDATE.
+                    rows = [{**to_row(product), "updated_at": now} for product in chunk]
+                    if dialect_insert is not None:
+                        statement = dialect_insert(ProductSchema)
+                        statement = statement.on_conflict_do_update(
+                            index_elements=[ProductSchema.product_id],
+                            set_={
+                                **{
+                                    column: statement.excluded[column]
+                                    for column in rows[0] if column != "product_id"
+                                },
+                                "version": ProductSchema.version + 1,
+                            },
+                        )
+                        session.execute(statement, rows)
+                    else:
+                        new_rows = [row for row in rows if row["product_id"] not in existing]
+                        old_rows = [row for row in rows if row["product_id"] in existing]
+                        if new_rows:
+                            session.execute(insert(ProductSchema), new_rows)
+                        if old_rows:
+                            session.execute(overwrite_many_statement(list(old_rows[0])), old_rows)
+                    new_ids = [p.product_id for p in chunk if p.product_id not in existing]
+                    created.extend(new_ids)
+                    self._record_changes(session, CREATED, new_ids)
+                    self._record_changes(
+                        session, UPDATED, [p.product_id for p in chunk if p.product_id in existing]
+                    )
+                session.commit()
+            return created
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="bulk_upsert")
+
+    def _chunks(self, products: List[Product]) -> Iterator[List[Product]]:
+        for start in range(0, len(products), self.BULK_CHUNK_SIZE):
+            yield products[start:start + self.BULK_CHUNK_SIZE]
+
+    @staticmethod
+    def _existing_ids(session: Session, products: List[Product]) -> Set[str]:
+        product_ids = [product.product_id for product in products]
+        return set(
+            session.scalars(
+                select(ProductSchema.product_id).where(ProductSchema.product_id.in_(product_ids))
+            )
+        )
+
+    def list_changes(self, since: int, limit: int) -> List[ProductChange]:
+        try:
+            with self.session as session:
+                rows = session.execute(changes_statement(since, limit))
+                return [row_to_change(row) for row in rows]
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="list_changes")
+
+    def get_many(self, product_ids: List[str]) -> List[Optional[Product]]:
+        if not product_ids:
+            return []
+        try:
+            with self.session as session:
+                rows = session.execute(
+                    select(*PRODUCT_COLUMNS).where(
+                        ProductSchema.product_id.in_(set(product_ids))
+                    )
+                )
+                products = {row.product_id: row_to_product(row) for row in rows}
+                return [products.get(product_id) for product_id in product_ids]
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="find")
+
     def get_by_id(self, product_id: str) -> Optional[Product]:
         try:
             with self.session as session:
@@ -63,102 +312,126 @@ class SQLProductRepository(ProductRepository):
                 )
                 if product is None:
                     return None
-                return Product(
-                    product_id=str(product.product_id),
-                    user_id=str(product.user_id),
-                    name=str(product.name),
-                    description=str(product.description),
-                    price=Decimal(product.price),
-                    location=str(product.location),
-                    status=str(product.status),
-                    is_available=bool(product.is_available),
-                )
+                return to_product(product)
         except Exception:
             self.session.rollback()
             raise ProductRepositoryException(method="find")
 
 #Isadora's code starts here.
 
-    def update(self, product: Product) -> Product:
-        try:
-            with self.session as session:
-                existing_product = (session.query(ProductSchema).filter(
-                    ProductSchema.product_id == product.product_id).first())
-                
-                if existing_product is None:
-                    raise ProductRepositoryException(
-                        method="edit", message="Product not found")
-                
-                existing_product.user_id = product.user_id
-                existing_product.name = product.name
-                existing_product.description = product.description
-                existing_product.price = product.price
-                existing_product.location = product.location
-                existing_product.status = product.status
-                existing_product.is_available = product.is_available
-                
-                session.commit()
-
-            print(f"Product updated successfully: {product}")
-            return product
+    def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            return self._write_one(
+                update_statement(product, expected_version), product.product_id
+            )
         except Exception as e:
             self.session.rollback()
-            print(f"Error occurred: {str(e)}")
             raise ProductRepositoryException(method="update", message=str(e))
 
-    def delete(self, product_id: str) -> Optional[Product]:
+    def patch(
+        self, product_id: str, fields: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            return self._write_one(
+                patch_statement([product_id], fields, expected_version), product_id
+            )
+        except Exception as e:
+            self.session.rollback()
+            raise ProductRepositoryException(method="patch", message=str(e))
+
+    def bulk_patch(self, product_ids: List[str], fields: Dict[str, Any]) -> List[str]:
+        if not product_ids:
+            return []
         try:
             with self.session as session:
-                product = (
-                    session.query(ProductSchema)
-                    .filter(ProductSchema.product_id == product_id)
-                    .first()
-                )
-                if product is None:
-                    raise ProductRepositoryException(
-                        method="delete", message="Product not found"
+                self._lock_change_feed(session)
+                statement = patch_statement(product_ids, fields)
+                if session.get_bind().dialect.update_returning:
+                    patched = set(session.scalars(statement.returning(ProductSchema.product_id)))
+                else:
+                    patched = set(
+                        session.scalars(
+                            select(ProductSchema.product_id)
+                            .where(ProductSchema.product_id.in_(product_ids))
+                        )
                     )
-                session.query(ProductSchema).filter(
-                    ProductSchema.product_id == product_id).delete()
+                    session.execute(statement)
+                updated = [
+                    product_id for product_id in dict.fromkeys(product_ids) if product_id in patched
+                ]
+                self._record_changes(session, UPDATED, updated)
                 session.commit()
-                return Product(
-                    product_id=str(product.product_id),
-                    user_id=str(product.user_id),
-                    name=str(product.name),
-                    description=str(product.description),
-                    price=Decimal(product.price),
-                    location=str(product.location),
-                    status=str(product.status),
-                    is_available=bool(product.is_available),
-                )
+            return updated
+        except Exception:
+            self.session.rollback()
+            raise ProductRepositoryException(method="bulk_patch")
+
+    def _write_one(self, statement: Update, product_id: str) -> Optional[Product]:
+        """Runs an UPDATE of one product and returns the row it wrote."""
+        with self.session as session:
+            self._lock_change_feed(session)
+            if session.get_bind().dialect.update_returning:
+                row = session.execute(statement.returning(*PRODUCT_COLUMNS)).first()
+            elif session.execute(statement).rowcount:
+                row = session.execute(select_statement(product_id)).first()
+            else:
+                row = None
+            if row is not None:
+                self._record_changes(session, UPDATED, [product_id])
+            session.commit()
+            return None if row is None else row_to_product(row)
+
+    @staticmethod
+    def _lock_change_feed(session: Session) -> None:
+        """Takes the commit order lock, before the transaction writes any row."""
+        lock = commit_order_lock(session.get_bind().dialect.name)
+        if lock is not None:
+            session.execute(lock)
+
+    @staticmethod
+    def _record_changes(session: Session, operation: str, product_ids: List[str]) -> None:
+        """Appends to the change feed in the caller's transaction."""
+        statement, rows = append_statement(operation, product_ids)
+        if rows:
+            session.execute(statement, rows)
+
+    def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            with self.session as session:
+                self._lock_change_feed(session)
+                statement = delete_statement(product_id, expected_version)
+                if session.get_bind().dialect.delete_returning:
+                    row = session.execute(statement.returning(*PRODUCT_COLUMNS)).first()
+                else:
+                    row = session.execute(select_statement(product_id)).first()
+                    if row is not None and not session.execute(statement).rowcount:
+                        row = None
+                if row is not None:
+                    self._record_changes(session, DELETED, [product_id])
+                session.commit()
+                return None if row is None else row_to_product(row)
         except Exception:
             self.session.rollback()
             raise ProductRepositoryException(method="delete")
-        
+
     def filter(self, status: str) -> List[Product]:
         try:
             with self.session as session:
                 # Query to filter products by status and return a list of results
-                products = session.query(ProductSchema).filter(ProductSchema.status == status).all()
+                rows = session.execute(
+                    select(*PRODUCT_COLUMNS).where(ProductSchema.status == status)
+                ).all()
 
-                if not products:
+                if not rows:
                     print(f"No products found with status: {status}")
                     return []
 
                 # Return the list of products converted to Product model
-                return [
-                    Product(
-                        product_id=str(product.product_id),
-                        user_id=str(product.user_id),
-                        name=str(product.name),
-                        description=str(product.description),
-                        price=Decimal(product.price),
-                        location=str(product.location),
-                        status=str(product.status),
-                        is_available=bool(product.is_available),
-                        )
-                        for product in products
-                    ]
+                return [row_to_product(row) for row in rows]
         except Exception:
             self.session.rollback()
             raise ProductRepositoryException(method="get_by_status")
\ No newline at end of file
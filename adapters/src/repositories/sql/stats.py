@@ -0,0 +1,120 @@
+import math
+from decimal import Decimal
+from typing import Dict, List
+
+from sqlalchemy import ColumnElement, Integer, cast, func, or_, select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.orm import Session
+
+from app.src import ProductFilter, ProductStats, StatusStats
+
+from .filters import filter_conditions
+from .tables import ProductSchema
+
+PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+_CENT = Decimal("0.01")
+
+
+def product_stats(session: Session, product_filter: ProductFilter) -> ProductStats:
+    """One GROUP BY status, is_available query for the counts and price range,
+    plus one query for the percentiles: percentile_cont on PostgreSQL, one
+    ordered pass over the matching prices (ROW_NUMBER, with their count as a
+    window over the same rows) elsewhere. Both are linear in the number of
+    priced products matched."""
+    dialect = session.get_bind().dialect.name
+    conditions = filter_conditions(dialect, product_filter)
+    groups = session.execute(
+        select(
+            ProductSchema.status,
+            ProductSchema.is_available,
+            func.count(),
+            func.count(ProductSchema.price),
+            func.min(ProductSchema.price),
+            func.max(ProductSchema.price),
+            func.sum(ProductSchema.price),
+        )
+        .where(*conditions)
+        .group_by(ProductSchema.status, ProductSchema.is_available)
+    ).all()
+
+    by_status: Dict[str, StatusStats] = {}
+    priced, total = 0, Decimal(0)
+    minimums: List[Decimal] = []
+    maximums: List[Decimal] = []
+    for status, is_available, count, price_count, price_min, price_max, price_sum in groups:
+        current = by_status.get(status, StatusStats(0, 0))
+        by_status[status] = StatusStats(
+            current.count + count, current.available + (count if is_available else 0)
+        )
+        if price_count:
+            priced += price_count
+            total += Decimal(price_sum)
+            minimums.append(Decimal(price_min).quantize(_CENT))
+            maximums.append(Decimal(price_max).quantize(_CENT))
+
+    return ProductStats(
+        count=sum(stats.count for stats in by_status.values()),
+        available=sum(stats.available for stats in by_status.values()),
+        by_status=by_status,
+        price_min=min(minimums, default=None),
+        price_avg=(total / priced).quantize(_CENT) if priced else None,
+        price_max=max(maximums, default=None),
+        price_percentiles=_percentiles(session, dialect, conditions, priced),
+    )
+
+
+def _percentiles(
+    session: Session, dialect: str, conditions: List[ColumnElement], priced: int
+) -> Dict[str, Decimal]:
+    if not priced:
+        return {}
+    conditions = [*conditions, ProductSchema.price.is_not(None)]
+    if dialect == "postgresql":
+        values = session.scalar(
+            select(
+                func.percentile_cont(array(list(PERCENTILES.values())))
+                .within_group(ProductSchema.price)
+            ).where(*conditions)
+        )
+        return {
+            name: Decimal(str(value)).quantize(_CENT)
+            for name, value in zip(PERCENTILES, values)
+        }
+    # The count comes from the same statement as the prices, so a write
+    # committed between two reads cannot leave a wanted position unread.
+    ranked = (
+        select(
+            ProductSchema.price.label("price"),
+            (func.row_number().over(order_by=ProductSchema.price) - 1).label("position"),
+            func.count().over().label("total"),
+        )
+        .where(*conditions)
+        .subquery()
+    )
+    lowers = [
+        cast((ranked.c.total - 1) * fraction, Integer) for fraction in PERCENTILES.values()
+    ]
+    rows = session.execute(
+        select(ranked.c.position, ranked.c.price, ranked.c.total).where(
+            or_(*(ranked.c.position.between(lower, lower + 1) for lower in lowers))
+        )
+    ).all()
+    if not rows:
+        return {}
+    total = rows[0].total
+    prices = {position: Decimal(price) for position, price, _ in rows}
+    return {
+        name: _interpolated(prices, fraction * (total - 1))
+        for name, fraction in PERCENTILES.items()
+    }
+
+
+def _interpolated(prices: Dict[int, Decimal], position: float) -> Decimal:
+    """Linear interpolation between the prices ranked either side of `position`."""
+    lower = math.floor(position)
+    upper = prices.get(lower + 1)
+    if upper is None:
+        return prices[lower].quantize(_CENT)
+    fraction = Decimal(str(position - lower))
+    return (prices[lower] + (upper - prices[lower]) * fraction).quantize(_CENT)
@@ -1,2 +1,4 @@
 from .base import Base
 from .product import ProductSchema
+from .product_change import ProductChangeSchema
+from .product_counter import ProductCounterSchema
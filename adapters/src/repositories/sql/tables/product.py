@@ -1,10 +1,26 @@
-from sqlalchemy import Column, String, Boolean, Numeric
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Boolean, Numeric
 
 from .base import Base
 
 
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class ProductSchema(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_status", "status"),
+        Index("ix_products_user_id_product_id", "user_id", "product_id"),
+        Index("ix_products_user_id_status", "user_id", "status"),
+        Index("ix_products_status_is_available", "status", "is_available"),
+        Index("ix_products_location", "location"),
+        Index("ix_products_updated_at", "updated_at"),
+        Index("ix_products_price", "price", "product_id"),
+    )
+
     product_id = Column(String, primary_key=True)
     user_id = Column(String)
     name = Column(String)
@@ -13,3 +29,5 @@ class ProductSchema(Base):
     location = Column(String)
     status = Column(String)
     is_available = Column(Boolean)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+
+from .base import Base
+from .product import utcnow
+
+
+class ProductChangeSchema(Base):
+    """Transactional outbox of product writes. The repository appends one row
+    per created, updated or deleted product in the transaction of the write
+    itself, so the feed never misses a committed write nor shows a rolled back
+    one."""
+
+    __tablename__ = "product_changes"
+
+    # INTEGER PRIMARY KEY is SQLite's rowid alias, the only autoincrementing type.
+    sequence = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    product_id = Column(String, nullable=False)
+    operation = Column(String, nullable=False)
+    changed_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
@@ -0,0 +1,15 @@
+from sqlalchemy import BigInteger, Boolean, Column, String
+
+from .base import Base
+
+
+class ProductCounterSchema(Base):
+    """Number of products per (status, is_available), kept current by database
+    triggers (migration 6). Products without a status or availability are
+    counted under "" and false."""
+
+    __tablename__ = "product_counters"
+
+    status = Column(String, primary_key=True)
+    is_available = Column(Boolean, primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,64 @@
+"""Writes that touch one product in a single statement. Where the dialect
+supports it, UPDATE/DELETE ... RETURNING hands back the written row, so a
+missing product shows up as an empty result instead of needing a SELECT first.
+Other dialects read the row with `select_statement` in the same transaction.
+
+Every write bumps products.version. Given an `expected_version`, a statement
+only matches the row while it still has that version, so a concurrent write in
+between makes it match nothing rather than be overwritten (optimistic locking).
+"""
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Delete, Select, Update, bindparam, delete, select, update
+
+from app.src import Product
+
+from .mappers import PRODUCT_COLUMNS, to_row
+from .tables import ProductSchema
+
+_products = ProductSchema.__table__
+
+
+def update_statement(product: Product, expected_version: Optional[int] = None) -> Update:
+    """Overwrites every field but the product_id."""
+    values = to_row(product)
+    del values["product_id"]
+    return patch_statement([product.product_id], values, expected_version)
+
+
+def patch_statement(
+    product_ids: List[str], fields: Dict[str, Any], expected_version: Optional[int] = None
+) -> Update:
+    """Sets only the given columns, on every listed product; updated_at comes
+    from the column's onupdate."""
+    values = {**fields, "version": _products.c.version + 1}
+    if "status" in values:
+        values["status"] = getattr(values["status"], "value", values["status"])
+    statement = update(_products).where(_products.c.product_id.in_(product_ids))
+    return _expecting(statement, expected_version).values(values)
+
+
+def overwrite_many_statement(columns: List[str]) -> Update:
+    """UPDATE by product_id to run once per row (executemany) of to_row dicts
+    carrying `columns`."""
+    values = {column: bindparam(column) for column in columns if column != "product_id"}
+    return (
+        update(_products)
+        .where(_products.c.product_id == bindparam("product_id"))
+        .values({**values, "version": _products.c.version + 1})
+    )
+
+
+def delete_statement(product_id: str, expected_version: Optional[int] = None) -> Delete:
+    statement = delete(_products).where(_products.c.product_id == product_id)
+    return _expecting(statement, expected_version)
+
+
+def select_statement(product_id: str) -> Select:
+    return select(*PRODUCT_COLUMNS).where(_products.c.product_id == product_id)
+
+
+def _expecting(statement, expected_version: Optional[int]):
+    if expected_version is None:
+        return statement
+    return statement.where(_products.c.version == expected_version)
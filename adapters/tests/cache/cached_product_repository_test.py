@@ -0,0 +1,168 @@
+import asyncio
+import threading
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from adapters.src.cache import InMemoryCacheBackend, ProductCache, StatsCache
+from adapters.src.repositories.cached import (
+    AsyncCachedProductRepository,
+    CachedProductRepository,
+)
+from app.src.core import ProductFilter, ProductStats, StatusStats
+from app.src.core.models._product import Product
+
+product = Product(
+    product_id="1001",
+    user_id="user-1",
+    name="Lamp",
+    description="A lamp",
+    price=Decimal("10.00"),
+    location="Quito",
+    status="New",
+    is_available=True,
+)
+
+
+@pytest.fixture
+def inner_repository():
+    repository = MagicMock()
+    repository.get_by_id.return_value = product
+    return repository
+
+
+@pytest.fixture
+def repository(inner_repository):
+    cache = ProductCache(InMemoryCacheBackend(max_size=10, ttl_seconds=60), ttl_seconds=60)
+    return CachedProductRepository(inner_repository, cache)
+
+
+def test_get_by_id_is_served_from_cache(repository, inner_repository):
+    assert repository.get_by_id("1001") == product
+    assert repository.get_by_id("1001") == product
+
+    inner_repository.get_by_id.assert_called_once_with("1001")
+    assert repository.cache.stats.hits == 1
+
+
+def test_writes_invalidate_cached_product(repository, inner_repository):
+    repository.get_by_id("1001")
+
+    repository.update(product)
+    repository.get_by_id("1001")
+    repository.delete("1001")
+    repository.get_by_id("1001")
+
+    assert inner_repository.get_by_id.call_count == 3
+
+
+def test_missing_products_are_not_cached(repository, inner_repository):
+    inner_repository.get_by_id.return_value = None
+
+    repository.get_by_id("404")
+    repository.get_by_id("404")
+
+    assert inner_repository.get_by_id.call_count == 2
+
+
+def test_stats_are_cached_per_filter_until_a_write(inner_repository):
+    stats = ProductStats(
+        count=1,
+        available=1,
+        by_status={"New": StatusStats(1, 1)},
+        price_min=Decimal("10.00"),
+        price_avg=Decimal("10.00"),
+        price_max=Decimal("10.00"),
+        price_percentiles={"p50": Decimal("10.00")},
+    )
+    inner_repository.stats.return_value = stats
+    backend = InMemoryCacheBackend(max_size=10, ttl_seconds=60)
+    repository = CachedProductRepository(
+        inner_repository,
+        ProductCache(backend, ttl_seconds=60),
+        StatsCache(backend, ttl_seconds=60),
+    )
+
+    assert repository.stats(ProductFilter()) == stats
+    assert repository.stats(ProductFilter()) == stats
+    repository.stats(ProductFilter(user_id="user-1"))
+    assert inner_repository.stats.call_count == 2
+
+    repository.create(product)
+    repository.stats(ProductFilter())
+    assert inner_repository.stats.call_count == 3
+
+
+def test_get_many_loads_only_cache_misses_in_one_call(repository, inner_repository):
+    other = product._replace(product_id="1002")
+    inner_repository.get_many.side_effect = lambda ids: [
+        {"1001": product, "1002": other}.get(product_id) for product_id in ids
+    ]
+    repository.get_by_id("1001")
+
+    assert repository.get_many(["1002", "404", "1001"]) == [other, None, product]
+    assert repository.get_many(["1001", "1002"]) == [product, other]
+
+    assert [call.args[0] for call in inner_repository.get_many.call_args_list] == [["1002", "404"]]
+
+
+class ThreadRecordingBackend(InMemoryCacheBackend):
+    """A backend that claims to be remote and records the threads it runs on."""
+
+    def __init__(self) -> None:
+        super().__init__(max_size=10, ttl_seconds=60)
+        self.threads = set()
+
+    @property
+    def is_shared(self) -> bool:
+        return True
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, ttl_seconds):
+        self.threads.add(threading.get_ident())
+        super().set(key, value, ttl_seconds)
+
+    def delete(self, *keys):
+        self.threads.add(threading.get_ident())
+        super().delete(*keys)
+
+    def generations(self, keys):
+        self.threads.add(threading.get_ident())
+        return super().generations(keys)
+
+    def set_if_generation(self, key, value, ttl_seconds, generation):
+        self.threads.add(threading.get_ident())
+        return super().set_if_generation(key, value, ttl_seconds, generation)
+
+    def invalidate(self, *keys):
+        self.threads.add(threading.get_ident())
+        super().invalidate(*keys)
+
+    def publish(self, channel, message):
+        self.threads.add(threading.get_ident())
+
+
+def test_async_repository_keeps_remote_cache_calls_off_the_event_loop():
+    backend = ThreadRecordingBackend()
+    inner_repository = AsyncMock()
+    inner_repository.get_by_id.return_value = product
+    repository = AsyncCachedProductRepository(
+        inner_repository,
+        ProductCache(backend, ttl_seconds=60),
+        StatsCache(backend, ttl_seconds=60),
+    )
+
+    async def scenario():
+        assert await repository.get_by_id("1001") == product
+        assert await repository.get_by_id("1001") == product
+        await repository.update(product)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+
+    inner_repository.get_by_id.assert_awaited_once_with("1001")
+    assert backend.threads and loop_thread not in backend.threads
@@ -0,0 +1,43 @@
+from adapters.src.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_evicts_least_recently_used_entry():
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_load_that_raced_with_an_invalidation_is_not_cached():
+    cache = LRUCache(max_size=10, ttl_seconds=60)
+    epoch = cache.epoch
+    cache.invalidate("a")
+
+    cache.set("a", "stale", epoch)
+
+    assert cache.get("a") is None
@@ -0,0 +1,157 @@
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from adapters.src.cache import (
+    InMemoryCacheBackend,
+    LRUCache,
+    ProductCache,
+    RedisCacheBackend,
+    deserialize_product,
+    serialize_product,
+)
+from app.src.core.models._product import Product
+
+product = Product(
+    product_id="1001",
+    user_id="user-1",
+    name="Lamp",
+    description="A lamp",
+    price=Decimal("10.50"),
+    location="Quito",
+    status="New",
+    is_available=True,
+)
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeRedis()
+
+
+def test_products_round_trip_through_serialization():
+    assert deserialize_product(serialize_product(product)) == product
+
+
+def test_concurrent_misses_load_once():
+    cache = ProductCache(InMemoryCacheBackend(max_size=10, ttl_seconds=60), ttl_seconds=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return product
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("1001", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [product] * 8
+    assert len(calls) == 1
+
+
+def test_invalidation_during_load_is_not_overwritten():
+    cache = ProductCache(InMemoryCacheBackend(max_size=10, ttl_seconds=60), ttl_seconds=60)
+
+    def loader():
+        cache.invalidate("1001")
+        return product
+
+    cache.get_or_load("1001", loader)
+
+    assert cache.backend.get("product:1001") is None
+
+
+def test_redis_backend_shares_entries_between_workers(redis_client):
+    first = ProductCache(RedisCacheBackend(redis_client), ttl_seconds=60)
+    second = ProductCache(RedisCacheBackend(redis_client), ttl_seconds=60)
+
+    first.get_or_load("1001", lambda: product)
+
+    assert second.get_or_load("1001", lambda: None) == product
+    second.invalidate("1001")
+    assert first.get_or_load("1001", lambda: None) is None
+
+
+def test_invalidation_by_another_worker_during_load_is_not_overwritten(redis_client):
+    pytest.importorskip("lupa")
+    first = ProductCache(RedisCacheBackend(redis_client), ttl_seconds=60)
+    second = ProductCache(RedisCacheBackend(redis_client), ttl_seconds=60)
+
+    def stale_loader():
+        # The other worker commits an update while this one is loading.
+        second.invalidate("1001")
+        return product
+
+    def stale_batch_loader(product_ids):
+        second.invalidate(*product_ids)
+        return [product for _ in product_ids]
+
+    assert first.get_or_load("1001", stale_loader) == product
+    assert first.get_many_or_load(["1002"], stale_batch_loader) == {"1002": product}
+    assert redis_client.get("catalog:product:1001") is None
+    assert redis_client.get("catalog:product:1002") is None
+
+    renamed = product._replace(name="Desk lamp")
+    assert second.get_or_load("1001", lambda: renamed) == renamed
+    assert first.get_or_load("1001", lambda: None) == renamed
+
+
+def test_redis_lock_expires(redis_client):
+    backend = RedisCacheBackend(redis_client)
+
+    assert backend.acquire_lock("lock:1001", ttl_seconds=0.05)
+    assert not backend.acquire_lock("lock:1001", ttl_seconds=0.05)
+    time.sleep(0.1)
+    assert backend.acquire_lock("lock:1001", ttl_seconds=0.05)
+
+
+def test_in_memory_lock_is_only_released_by_its_holder():
+    backend = InMemoryCacheBackend(max_size=10, ttl_seconds=60)
+    expired = backend.acquire_lock("lock:1001", ttl_seconds=0.01)
+    time.sleep(0.02)
+    current = backend.acquire_lock("lock:1001", ttl_seconds=60)
+
+    backend.release_lock("lock:1001", expired)
+    assert backend.acquire_lock("lock:1001", ttl_seconds=60) is None
+    backend.release_lock("lock:1001", current)
+    assert backend.acquire_lock("lock:1001", ttl_seconds=60) is not None
+
+
+def test_redis_lock_is_only_released_by_its_holder(redis_client):
+    pytest.importorskip("lupa")
+    backend = RedisCacheBackend(redis_client)
+    expired = backend.acquire_lock("lock:1001", ttl_seconds=0.05)
+    time.sleep(0.1)
+    current = backend.acquire_lock("lock:1001", ttl_seconds=60)
+
+    backend.release_lock("lock:1001", expired)
+    assert backend.acquire_lock("lock:1001", ttl_seconds=60) is None
+
+    backend.release_lock("lock:1001", current)
+    assert backend.acquire_lock("lock:1001", ttl_seconds=60) is not None
+
+
+def test_invalidation_is_published_to_near_caches(redis_client):
+    backend = RedisCacheBackend(redis_client)
+    near_cache = LRUCache(max_size=10, ttl_seconds=60)
+    cache = ProductCache(backend, ttl_seconds=60, near_cache=near_cache)
+    cache.get_or_load("1001", lambda: product)
+    assert len(near_cache) == 1
+
+    # Another worker writes the product and publishes the invalidation.
+    ProductCache(RedisCacheBackend(redis_client), ttl_seconds=60).invalidate("1001")
+
+    deadline = time.monotonic() + 2
+    while len(near_cache) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(near_cache) == 0
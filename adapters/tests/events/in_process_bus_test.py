@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import pytest
+
+from adapters.src.events import InProcessProductEventBus, SubscriptionOverflowException
+from app.src.core import ProductEvent
+
+
+def test_events_reach_only_subscribers_of_the_product():
+    bus = InProcessProductEventBus()
+
+    async def scenario():
+        watching = bus.subscribe(["1"])
+        other = bus.subscribe(["2"])
+        bus.publish(ProductEvent("1", "updated"))
+        assert await watching.get(timeout=1) == ProductEvent("1", "updated")
+        assert await other.get(timeout=0.01) is None
+
+    asyncio.run(scenario())
+
+
+def test_events_published_from_other_threads_are_delivered_in_order():
+    bus = InProcessProductEventBus()
+
+    async def scenario():
+        subscription = bus.subscribe(["1"])
+        operations = ["created", "updated", "deleted"]
+        publisher = threading.Thread(
+            target=lambda: [bus.publish(ProductEvent("1", operation)) for operation in operations]
+        )
+        publisher.start()
+        received = [(await subscription.get(timeout=1)).operation for _ in operations]
+        publisher.join()
+        assert received == operations
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscribers_are_dropped_without_blocking_publishers():
+    bus = InProcessProductEventBus(max_queue_size=2)
+
+    async def scenario():
+        slow = bus.subscribe(["1"])
+        for _ in range(3):
+            bus.publish(ProductEvent("1", "updated"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(SubscriptionOverflowException):
+            await slow.get(timeout=1)
+        assert slow.closed
+        assert bus.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_unsubscribed_and_closed_subscriptions_stop_receiving():
+    bus = InProcessProductEventBus()
+
+    async def scenario():
+        subscription = bus.subscribe(["1", "2"])
+        subscription.unsubscribe(["1"])
+        bus.publish(ProductEvent("1", "updated"))
+        assert await subscription.get(timeout=0.01) is None
+
+        subscription.close()
+        bus.publish(ProductEvent("2", "updated"))
+        assert await subscription.get(timeout=0.01) is None
+        assert subscription.product_ids == set()
+        assert bus.subscriber_count == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from adapters.src.health import ReadinessProbe
+from adapters.src.metrics import SlidingWindow
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ready.db'}")
+    yield engine
+    engine.dispose()
+
+
+def build_probe(
+    engine_provider=None, window=None, clock=None, engines=None, **overrides
+) -> ReadinessProbe:
+    options = dict(
+        timeout_seconds=1,
+        cache_seconds=2,
+        saturation_threshold=0.9,
+        error_rate_threshold=0.5,
+        error_rate_min_requests=10,
+    )
+    options.update(overrides)
+    return ReadinessProbe(
+        engines=engines or {"sync": engine_provider},
+        window=window or SlidingWindow(60),
+        clock=clock or FakeClock(),
+        **options,
+    )
+
+
+def test_ready_when_database_answers(engine):
+    report = asyncio.run(build_probe(lambda: engine).check())
+
+    assert report.ready
+    assert report.database_ok
+    assert report.database_latency_ms is not None
+    assert report.pool_saturation == 0
+    assert report.pools["sync"].database_ok
+
+
+def test_not_ready_when_database_is_unavailable():
+    def broken_engine():
+        raise RuntimeError("Database session has not been initialized.")
+
+    report = asyncio.run(build_probe(broken_engine).check())
+
+    assert not report.ready
+    assert not report.database_ok
+    assert report.reasons == ["sync database unavailable: RuntimeError"]
+
+
+def test_not_ready_when_pool_is_saturated(engine):
+    connection = engine.connect()
+    try:
+        report = asyncio.run(build_probe(lambda: engine, saturation_threshold=0.01).check())
+    finally:
+        connection.close()
+
+    assert not report.ready
+    assert "saturated" in report.reasons[0]
+
+
+def test_not_ready_when_recent_requests_fail(engine):
+    window = SlidingWindow(60)
+    for index in range(20):
+        window.record(error=index % 4 != 0)
+
+    report = asyncio.run(build_probe(lambda: engine, window=window).check())
+
+    assert not report.ready
+    assert report.error_rate == 0.75
+
+
+def test_reports_are_cached_for_the_interval(engine):
+    calls = []
+    clock = FakeClock()
+
+    def counting_engine():
+        calls.append(1)
+        return engine
+
+    probe = build_probe(counting_engine, clock=clock)
+    asyncio.run(probe.check())
+    asyncio.run(probe.check())
+    clock.now += 3
+    asyncio.run(probe.check())
+
+    assert len(calls) == 2
+
+
+def test_window_forgets_old_requests():
+    clock = FakeClock()
+    window = SlidingWindow(60, clock=clock)
+    window.record(error=True)
+    clock.now += 30
+    window.record(error=False)
+
+    assert window.totals() == (2, 1)
+    clock.now += 45
+    assert window.totals() == (1, 0)
+
+
+def test_every_pool_in_use_is_probed(engine, tmp_path):
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ready.db'}")
+
+    def broken_engine():
+        raise RuntimeError("Async session has not been initialized.")
+
+    async def scenario():
+        healthy = await build_probe(
+            engines={"sync": lambda: engine, "async": lambda: async_engine}
+        ).check()
+        broken = await build_probe(
+            engines={"sync": lambda: engine, "async": broken_engine}
+        ).check()
+        await async_engine.dispose()
+        return healthy, broken
+
+    healthy, broken = asyncio.run(scenario())
+
+    assert healthy.ready
+    assert set(healthy.pools) == {"sync", "async"}
+    assert healthy.pools["async"].database_ok
+    assert not broken.ready
+    assert broken.pools["sync"].database_ok and not broken.pools["async"].database_ok
+    assert broken.reasons == ["async database unavailable: RuntimeError"]
@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from adapters.src.metrics import CatalogMetrics
+from adapters.src.repositories.instrumented import InstrumentedProductRepository
+
+
+@pytest.fixture
+def metrics():
+    return CatalogMetrics()
+
+
+@pytest.fixture
+def inner_repository():
+    return MagicMock()
+
+
+@pytest.fixture
+def repository(inner_repository, metrics):
+    return InstrumentedProductRepository(
+        inner_repository,
+        metrics.repository_latency_by_method,
+        metrics.repository_errors_by_method,
+    )
+
+
+def test_calls_are_timed_per_method(repository, inner_repository, metrics):
+    inner_repository.get_by_id.return_value = None
+
+    assert repository.get_by_id("1") is None
+    repository.get_by_id("2")
+
+    assert sum(metrics.repository_latency_by_method["get_by_id"].counts) == 2
+    assert metrics.repository_errors_by_method["get_by_id"].value == 0
+
+
+def test_errors_are_counted_and_reraised(repository, inner_repository, metrics):
+    inner_repository.delete.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        repository.delete("1")
+
+    assert metrics.repository_errors_by_method["delete"].value == 1
+    assert sum(metrics.repository_latency_by_method["delete"].counts) == 1
+
+
+def test_streams_are_timed_until_exhausted(repository, inner_repository, metrics):
+    inner_repository.stream_all.return_value = iter(["a", "b"])
+
+    stream = repository.stream_all(batch_size=10)
+    assert sum(metrics.repository_latency_by_method["stream_all"].counts) == 0
+
+    assert list(stream) == ["a", "b"]
+    assert sum(metrics.repository_latency_by_method["stream_all"].counts) == 1
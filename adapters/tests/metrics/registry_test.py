@@ -0,0 +1,43 @@
+from adapters.src.metrics import Counter, Gauge, Histogram, Registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", ("route",), (0.1, 1)))
+    child = histogram.labels("/products/")
+    child.observe(0.05)
+    child.observe(0.5)
+    child.observe(5)
+
+    text = registry.render()
+
+    assert '# TYPE latency_seconds histogram' in text
+    assert 'latency_seconds_bucket{route="/products/",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/products/",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/products/",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/products/"} 3' in text
+    assert 'latency_seconds_sum{route="/products/"} 5.55' in text
+
+
+def test_counter_and_gauge_samples():
+    registry = Registry()
+    counter = registry.register(Counter("errors", "Errors.", ("method",)))
+    counter.labels("get_by_id").inc()
+    counter.labels("get_by_id").inc()
+    registry.register(Gauge("pool_size", "Pool size.", lambda: {("sync",): 5}, ("engine",)))
+
+    text = registry.render()
+
+    assert 'errors_total{method="get_by_id"} 2' in text
+    assert 'pool_size{engine="sync"} 5' in text
+
+
+def test_failing_collector_is_skipped():
+    registry = Registry()
+    registry.register(Gauge("broken", "Broken.", lambda: 1 / 0))
+    registry.register(Gauge("ok", "Fine.", lambda: {(): 1}))
+
+    text = registry.render()
+
+    assert "broken" not in text
+    assert "ok 1" in text
@@ -0,0 +1,85 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from adapters.src.repositories.sql.async_session_manager import AsyncSessionManager
+from adapters.src.repositories.sql.async_sql_product_repository import AsyncSQLProductRepository
+from adapters.src.repositories.sql.connections import Connection
+from app.src.core.models._product import Product
+
+
+class AioSQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite+aiosqlite:///{self.database_path}"
+
+
+def build_product(product_id: str, status: str = "New") -> Product:
+    return Product(
+        product_id=product_id,
+        user_id="user-1",
+        name=f"Product {product_id}",
+        description="A product",
+        price=Decimal("10.50"),
+        location="Quito",
+        status=status,
+        is_available=True,
+    )
+
+
+@pytest.fixture
+def run(tmp_path):
+    """Run a coroutine against a repository bound to a fresh async SQLite database"""
+    asyncio.run(AsyncSessionManager.initialize_session(
+        AioSQLiteTestConnection(tmp_path / "catalog.db")
+    ))
+
+    def _run(operation):
+        async def _with_repository():
+            async with AsyncSessionManager.session_scope() as session:
+                return await operation(AsyncSQLProductRepository(session))
+        return asyncio.run(_with_repository())
+
+    yield _run
+    asyncio.run(AsyncSessionManager.close_session())
+
+
+def test_create_and_get_by_id(run):
+    product = build_product("1001")
+
+    run(lambda repository: repository.create(product))
+    found = run(lambda repository: repository.get_by_id("1001"))
+
+    assert found._replace(updated_at=None, version=None) == product
+    assert found.updated_at is not None
+    assert found.version == 1
+
+
+def test_filter_returns_only_matching_status(run):
+    run(lambda repository: repository.create(build_product("1001", status="New")))
+    run(lambda repository: repository.create(build_product("1002", status="Used")))
+
+    used = run(lambda repository: repository.filter("Used"))
+    everything = run(lambda repository: repository.list_all())
+
+    assert [product.product_id for product in used] == ["1002"]
+    assert len(everything) == 2
+
+
+def test_update_and_delete(run):
+    run(lambda repository: repository.create(build_product("1001")))
+
+    updated = run(lambda repository: repository.update(build_product("1001", status="Used")))
+    deleted = run(lambda repository: repository.delete("1001"))
+
+    assert updated.version == 2
+    assert deleted.status == "Used"
+    assert run(lambda repository: repository.get_by_id("1001")) is None
+
+
+def test_update_and_delete_missing_product_return_none(run):
+    assert run(lambda repository: repository.update(build_product("404"))) is None
+    assert run(lambda repository: repository.delete("404")) is None
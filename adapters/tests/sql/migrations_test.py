@@ -0,0 +1,73 @@
+from sqlalchemy import create_engine, inspect, text
+
+from adapters.src.repositories.sql.migrations import MIGRATIONS, MigrationRunner
+
+
+def create_legacy_products_table(engine) -> None:
+    """Products table as deployed before any index was declared"""
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE products (product_id VARCHAR PRIMARY KEY, user_id VARCHAR, "
+            "name VARCHAR, description VARCHAR, price NUMERIC, location VARCHAR, "
+            "status VARCHAR, is_available BOOLEAN)"
+        ))
+
+
+def test_upgrade_adds_indexes_to_existing_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    create_legacy_products_table(engine)
+
+    applied = MigrationRunner(engine).upgrade()
+
+    index_names = {index["name"] for index in inspect(engine).get_indexes("products")}
+    assert applied == [migration.version for migration in MIGRATIONS]
+    assert {
+        "ix_products_status",
+        "ix_products_user_id_product_id",
+        "ix_products_user_id_status",
+        "ix_products_status_is_available",
+        "ix_products_location",
+    } <= index_names
+
+
+def test_upgrade_is_a_no_op_once_applied(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    create_legacy_products_table(engine)
+    runner = MigrationRunner(engine)
+    runner.upgrade()
+
+    assert runner.upgrade() == []
+    assert runner.pending() == []
+
+
+def test_upgrade_backfills_updated_at(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    create_legacy_products_table(engine)
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO products (product_id, name) VALUES ('1', 'Lamp')"))
+
+    MigrationRunner(engine).upgrade()
+
+    with engine.connect() as connection:
+        assert connection.scalar(text("SELECT updated_at FROM products")) is not None
+
+
+def test_upgrade_versions_existing_products(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    create_legacy_products_table(engine)
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO products (product_id, name) VALUES ('1', 'Lamp')"))
+
+    MigrationRunner(engine).upgrade()
+
+    with engine.connect() as connection:
+        assert connection.scalar(text("SELECT version FROM products")) == 1
+
+
+def test_upgrade_creates_product_changes_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    create_legacy_products_table(engine)
+
+    MigrationRunner(engine).upgrade()
+
+    assert "product_changes" in inspect(engine).get_table_names()
@@ -0,0 +1,56 @@
+import pytest
+
+from adapters.src.repositories.sql.connections import Connection
+from adapters.src.repositories.sql.session_manager import SessionManager
+from adapters.src.repositories.sql.tables.product import ProductSchema
+
+
+class SQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite:///{self.database_path}"
+
+
+@pytest.fixture(autouse=True)
+def session_manager(tmp_path):
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "catalog.db"))
+    yield SessionManager
+    SessionManager.close_session()
+
+
+def test_get_session_returns_a_new_session_per_call():
+    first = SessionManager.get_session()
+    second = SessionManager.get_session()
+
+    assert first is not second
+    assert first.bind is second.bind
+    first.close()
+    second.close()
+
+
+def test_failed_scope_does_not_leak_into_other_sessions():
+    with SessionManager.session_scope() as session:
+        session.add(ProductSchema(product_id="1", name="kept", status="New"))
+        session.commit()
+
+    with pytest.raises(RuntimeError):
+        with SessionManager.session_scope() as session:
+            session.add(ProductSchema(product_id="2", name="discarded", status="New"))
+            session.flush()
+            raise RuntimeError("request failed")
+
+    with SessionManager.session_scope() as session:
+        product_ids = [product.product_id for product in session.query(ProductSchema).all()]
+
+    assert product_ids == ["1"]
+
+
+def test_get_session_fails_when_not_initialized():
+    SessionManager.close_session()
+
+    with pytest.raises(Exception):
+        SessionManager.get_session()
+
+    SessionManager.initialize_session(SQLiteTestConnection(":memory:"))
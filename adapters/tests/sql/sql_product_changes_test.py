@@ -0,0 +1,133 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, literal_column, select
+from sqlalchemy.dialects import postgresql
+
+from adapters.src.repositories.sql import sql_product_repository
+from adapters.src.repositories.sql.connections import Connection
+from adapters.src.repositories.sql.outbox import commit_order_lock
+from adapters.src.repositories.sql.session_manager import SessionManager
+from adapters.src.repositories.sql.sql_product_repository import SQLProductRepository
+from app.src.core.models._product import Product
+
+
+class SQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite:///{self.database_path}"
+
+
+def build_product(product_id: str, status: str = "New") -> Product:
+    return Product(
+        product_id=product_id,
+        user_id="user-1",
+        name=f"Product {product_id}",
+        description="A product",
+        price=Decimal("10.00"),
+        location="Quito",
+        status=status,
+        is_available=True,
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository bound to a fresh SQLite database"""
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "catalog.db"))
+    yield SQLProductRepository(SessionManager.get_session())
+    SessionManager.close_session()
+
+
+def operations(changes):
+    return [(change.product_id, change.operation) for change in changes]
+
+
+def test_every_write_is_recorded_in_order(repository):
+    repository.create(build_product("1"))
+    repository.bulk_create([build_product("2"), build_product("3")])
+    repository.update(build_product("2", "Used"))
+    repository.patch("3", {"name": "Renamed"})
+    repository.bulk_upsert([build_product("3", "Used"), build_product("4")])
+    repository.bulk_patch(["1", "4"], {"is_available": False})
+    repository.delete("1")
+
+    changes = repository.list_changes(0, limit=100)
+    assert operations(changes) == [
+        ("1", "created"),
+        ("2", "created"),
+        ("3", "created"),
+        ("2", "updated"),
+        ("3", "updated"),
+        ("4", "created"),
+        ("3", "updated"),
+        ("1", "updated"),
+        ("4", "updated"),
+        ("1", "deleted"),
+    ]
+    sequences = [change.sequence for change in changes]
+    assert sequences == sorted(sequences)
+    assert all(change.changed_at.tzinfo is not None for change in changes)
+
+
+def test_changes_page_by_sequence(repository):
+    repository.bulk_create([build_product(str(i)) for i in range(5)])
+
+    first = repository.list_changes(0, limit=2)
+    rest = repository.list_changes(first[-1].sequence, limit=10)
+
+    assert operations(first + rest) == [(str(i), "created") for i in range(5)]
+
+
+def test_writes_that_match_nothing_are_not_recorded(repository):
+    repository.create(build_product("1"))
+
+    assert repository.update(build_product("missing")) is None
+    assert repository.patch("1", {"name": "Stale"}, expected_version=7) is None
+    assert repository.delete("missing") is None
+
+    assert operations(repository.list_changes(0, limit=100)) == [("1", "created")]
+
+
+def test_postgresql_appends_take_the_commit_order_lock():
+    lock = commit_order_lock("postgresql")
+
+    assert "pg_advisory_xact_lock" in str(lock.compile(dialect=postgresql.dialect()))
+    assert commit_order_lock("sqlite") is None
+
+
+def test_writes_take_the_commit_order_lock_before_writing_any_row(repository, monkeypatch):
+    monkeypatch.setattr(
+        sql_product_repository,
+        "commit_order_lock",
+        lambda dialect: select(literal_column("'commit order lock'")),
+    )
+    statements = []
+    event.listen(
+        SessionManager.get_engine(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    repository.create(build_product("0"))
+    writes = [
+        lambda: repository.create(build_product("1")),
+        lambda: repository.bulk_create([build_product("2"), build_product("3")]),
+        lambda: repository.bulk_upsert([build_product("3", "Used"), build_product("4")]),
+        lambda: repository.update(build_product("2", "Used")),
+        lambda: repository.patch("3", {"name": "Renamed"}),
+        lambda: repository.bulk_patch(["1", "4"], {"is_available": False}),
+        lambda: repository.delete("1"),
+    ]
+
+    for write in writes:
+        statements.clear()
+        write()
+        locks = [i for i, sql in enumerate(statements) if "commit order lock" in sql]
+        rows = [
+            i for i, sql in enumerate(statements)
+            if sql.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+        assert len(locks) == 1
+        assert locks[0] < rows[0]
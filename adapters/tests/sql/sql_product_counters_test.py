@@ -0,0 +1,85 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+
+from adapters.src.repositories.config import SQLConfig
+from adapters.src.repositories.sql.connections import Connection
+from adapters.src.repositories.sql.counters import reconcile_product_counters
+from adapters.src.repositories.sql.session_manager import SessionManager
+from adapters.src.repositories.sql.sql_product_repository import SQLProductRepository
+from app.src.core import StatusStats
+from app.src.core.models._product import Product
+
+
+class SQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite:///{self.database_path}"
+
+
+def build_product(product_id: str, status: str, is_available: bool) -> Product:
+    return Product(
+        product_id=product_id,
+        user_id="user-1",
+        name=f"Product {product_id}",
+        description="A product",
+        price=Decimal("10.00"),
+        location="Quito",
+        status=status,
+        is_available=is_available,
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository bound to a fresh SQLite database"""
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "catalog.db"))
+    yield SQLProductRepository(SessionManager.get_session())
+    SessionManager.close_session()
+
+
+def test_counters_follow_every_write(repository):
+    repository.create(build_product("1", "New", True))
+    repository.bulk_create([build_product("2", "New", False), build_product("3", "Used", True)])
+    assert repository.count_by_status() == {"New": StatusStats(2, 1), "Used": StatusStats(1, 1)}
+
+    repository.update(build_product("2", "Used", True))
+    repository.bulk_upsert([
+        build_product("3", "For parts", False), build_product("4", "New", True)
+    ])
+    repository.delete("1")
+
+    assert repository.count_by_status() == {
+        "New": StatusStats(1, 1), "Used": StatusStats(1, 1), "For parts": StatusStats(1, 0)
+    }
+    assert repository.collection_version().count == 3
+    assert repository.collection_version("New").count == 1
+
+
+def test_reconcile_repairs_drift(repository):
+    repository.bulk_create([build_product("1", "New", True), build_product("2", "Used", False)])
+    with SessionManager.get_engine().begin() as connection:
+        connection.execute(text("UPDATE product_counters SET count = 42"))
+
+    with SessionManager.get_engine().begin() as connection:
+        reconcile_product_counters(connection)
+
+    assert repository.count_by_status() == {"New": StatusStats(1, 1), "Used": StatusStats(1, 0)}
+
+
+def test_counts_fall_back_to_products_without_the_counters_migration(tmp_path, monkeypatch):
+    monkeypatch.setattr(SQLConfig, "RUN_MIGRATIONS", False)
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "unmigrated.db"))
+    try:
+        repository = SQLProductRepository(SessionManager.get_session())
+        repository.bulk_create([build_product("1", "New", True), build_product("2", "Used", False)])
+
+        assert repository.count_by_status() == {
+            "New": StatusStats(1, 1), "Used": StatusStats(1, 0)
+        }
+        assert repository.collection_version().count == 2
+    finally:
+        SessionManager.close_session()
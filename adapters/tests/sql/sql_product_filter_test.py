@@ -0,0 +1,147 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from adapters.src.repositories.sql.connections import Connection
+from adapters.src.repositories.sql.session_manager import SessionManager
+from adapters.src.repositories.sql.sql_product_repository import SQLProductRepository
+from app.src.core import ProductFilter, ProductSortOrder
+from app.src.core.models._product import Product
+from app.src.use_cases.product import FilterProducts, FilterProductsRequest
+
+
+class SQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite:///{self.database_path}"
+
+
+def build_product(product_id: str, **fields) -> Product:
+    values = dict(
+        product_id=product_id,
+        user_id="user-1",
+        name=f"Product {product_id}",
+        description="A product",
+        price=Decimal("10.00"),
+        location="Quito",
+        status="New",
+        is_available=True,
+    )
+    values.update(fields)
+    return Product(**values)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository bound to a fresh SQLite database holding a small catalog"""
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "catalog.db"))
+    SQLProductRepository(SessionManager.get_session()).bulk_create([
+        build_product("1", price=Decimal("5.00"), location="Quito Norte"),
+        build_product("2", price=Decimal("15.00"), status="Used", location="Guayaquil"),
+        build_product("3", price=Decimal("25.00"), status="Used", is_available=False),
+        build_product("4", price=Decimal("15.00"), status="For parts", user_id="user-2"),
+        build_product("5", price=Decimal("35.00"), location="quito"),
+    ])
+    yield lambda: SQLProductRepository(SessionManager.get_session())
+    SessionManager.close_session()
+
+
+def filtered_ids(repository, **criteria):
+    products = repository().list_filtered(ProductFilter(**criteria), limit=10)
+    return [product.product_id for product in products]
+
+
+def test_list_filtered_combines_criteria(repository):
+    assert filtered_ids(repository, statuses=("Used", "For parts")) == ["2", "3", "4"]
+    assert filtered_ids(repository, statuses=("Used",), is_available=True) == ["2"]
+    assert filtered_ids(repository, price_min=Decimal("15"), price_max=Decimal("25")) == [
+        "2", "3", "4"
+    ]
+    assert filtered_ids(repository, user_id="user-2") == ["4"]
+    assert filtered_ids(repository, location_prefix="Quito") == ["1", "3", "4"]
+
+
+def test_list_filtered_sorts_with_product_id_tie_break(repository):
+    assert filtered_ids(repository, sort=ProductSortOrder.PRICE) == ["1", "2", "4", "3", "5"]
+    assert filtered_ids(repository, sort=ProductSortOrder.PRICE_DESC) == ["5", "3", "4", "2", "1"]
+    assert filtered_ids(repository, sort=ProductSortOrder.PRODUCT_ID_DESC) == [
+        "5", "4", "3", "2", "1"
+    ]
+
+
+@pytest.mark.parametrize("sort", list(ProductSortOrder))
+def test_filter_products_pages_through_every_sort_order(repository, sort):
+    use_case = FilterProducts(repository())
+    request = FilterProductsRequest(product_filter=ProductFilter(sort=sort), limit=2)
+    expected = filtered_ids(repository, sort=sort)
+
+    found, cursor = [], None
+    while True:
+        response = use_case(request._replace(cursor=cursor))
+        found.extend(product.product_id for product in response.products)
+        cursor = response.next_cursor
+        if cursor is None:
+            break
+
+    assert found == expected
+
+
+def test_filter_products_rejects_a_cursor_from_another_sort(repository):
+    use_case = FilterProducts(repository())
+    cursor = use_case(FilterProductsRequest(limit=1)).next_cursor
+
+    with pytest.raises(ValueError):
+        use_case(FilterProductsRequest(
+            product_filter=ProductFilter(sort=ProductSortOrder.PRICE), limit=1, cursor=cursor
+        ))
+
+
+def test_get_many_returns_products_in_request_order(repository):
+    products = repository().get_many(["2", "404", "1"])
+
+    assert [product and product.product_id for product in products] == ["2", None, "1"]
+    assert repository().get_many([]) == []
+
+
+def test_patch_writes_only_the_given_columns(repository):
+    statements = []
+    engine = SessionManager.get_engine()
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        patched = repository().patch("1", {"price": Decimal("7.50")})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert (patched.price, patched.location) == (Decimal("7.50"), "Quito Norte")
+    assert len(statements) == 2
+    assert "SET price=?, updated_at=?" in statements[0]
+    assert statements[1].startswith("INSERT INTO product_changes")
+    assert repository().patch("404", {"price": Decimal("1")}) is None
+
+
+def test_bulk_patch_updates_every_listed_product_at_once(repository):
+    patched = repository().bulk_patch(["3", "404", "1"], {"is_available": False})
+
+    assert patched == ["3", "1"]
+    assert filtered_ids(repository, is_available=False) == ["1", "3"]
+
+
+def test_writes_bump_the_version_and_honour_the_expected_one(repository):
+    product = repository().get_by_id("1")
+
+    assert repository().update(product, expected_version=product.version + 1) is None
+    updated = repository().update(product, expected_version=product.version)
+    patched = repository().patch("1", {"price": Decimal("6.00")})
+    repository().bulk_upsert([patched])
+
+    assert (updated.version, patched.version) == (2, 3)
+    assert repository().get_by_id("1").version == 4
+    assert repository().delete("1", expected_version=3) is None
+    assert repository().delete("1", expected_version=4).product_id == "1"
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from adapters.src.repositories.sql.connections import Connection
+from adapters.src.repositories.sql.migrations.versions import m0003_product_search as m0003
+from adapters.src.repositories.sql.search import POSTGRESQL_SEARCH_DOCUMENT, search_statement
+from adapters.src.repositories.sql.session_manager import SessionManager
+from adapters.src.repositories.sql.sql_product_repository import SQLProductRepository
+from app.src.core.models._product import Product
+
+
+class SQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite:///{self.database_path}"
+
+
+def build_product(product_id: str, name: str, description: str = "A product") -> Product:
+    return Product(
+        product_id=product_id,
+        user_id="user-1",
+        name=name,
+        description=description,
+        price=Decimal("10.50"),
+        location="Quito",
+        status="New",
+        is_available=True,
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository bound to a fresh SQLite database with the search index migrated"""
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "catalog.db"))
+    yield lambda: SQLProductRepository(SessionManager.get_session())
+    SessionManager.close_session()
+
+
+def search_ids(repository, query, **kwargs):
+    return [hit.product.product_id for hit in repository().search(query, limit=10, **kwargs)]
+
+
+def test_search_ranks_name_matches_first(repository):
+    repository().create(build_product("1", "Office chair", "Comes with a desk lamp"))
+    repository().create(build_product("2", "Desk lamp", "Bright LED"))
+    repository().create(build_product("3", "Sofa"))
+
+    assert search_ids(repository, "lamp") == ["2", "1"]
+    assert search_ids(repository, "desk lam") == ["2", "1"]
+    assert search_ids(repository, "?!") == []
+
+
+def test_search_index_follows_updates_and_deletes(repository):
+    repository().create(build_product("1", "Desk lamp"))
+    repository().create(build_product("2", "Floor lamp"))
+    repository().bulk_upsert([build_product("1", "Desk fan")])
+    repository().delete("2")
+
+    assert search_ids(repository, "lamp") == []
+    assert search_ids(repository, "fan") == ["1"]
+
+
+def test_search_pages_after_the_last_hit(repository):
+    repository().bulk_create([build_product(str(i), f"Lamp {i}") for i in range(1, 6)])
+
+    first_page = repository().search("lamp", limit=3)
+    last = first_page[-1]
+    second_page = repository().search(
+        "lamp", limit=3, after=(last.score, last.product.product_id)
+    )
+
+    found = [hit.product.product_id for hit in first_page + second_page]
+    assert sorted(found) == ["1", "2", "3", "4", "5"]
+
+
+def test_postgresql_search_uses_the_indexed_expression():
+    statement = search_statement("postgresql", ["desk", "la"], limit=10, after=None)
+    where = str(statement.whereclause.compile(dialect=postgresql.dialect()))
+
+    assert f"({POSTGRESQL_SEARCH_DOCUMENT}) @@" in where
+    assert f"(({POSTGRESQL_SEARCH_DOCUMENT}))" in m0003._POSTGRESQL_SEARCH_INDEX
+    assert "CONCURRENTLY" in m0003._POSTGRESQL_SEARCH_INDEX
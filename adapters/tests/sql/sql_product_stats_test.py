@@ -0,0 +1,124 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from adapters.src.repositories.sql import stats as stats_module
+from adapters.src.repositories.sql.connections import Connection
+from adapters.src.repositories.sql.session_manager import SessionManager
+from adapters.src.repositories.sql.sql_product_repository import SQLProductRepository
+from app.src.core import ProductFilter, StatusStats
+from app.src.core.models._product import Product
+
+
+class SQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite:///{self.database_path}"
+
+
+def build_product(product_id: str, price: str, status: str, is_available: bool) -> Product:
+    return Product(
+        product_id=product_id,
+        user_id="user-1",
+        name=f"Product {product_id}",
+        description="A product",
+        price=Decimal(price),
+        location="Quito",
+        status=status,
+        is_available=is_available,
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository bound to a fresh SQLite database"""
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "catalog.db"))
+    yield SQLProductRepository(SessionManager.get_session())
+    SessionManager.close_session()
+
+
+def test_stats_aggregates_counts_and_prices(repository):
+    repository.bulk_create([
+        build_product("1", "10.00", "New", True),
+        build_product("2", "20.00", "New", False),
+        build_product("3", "30.00", "Used", True),
+        build_product("4", "40.00", "Used", True),
+        build_product("5", "100.00", "For parts", False),
+    ])
+
+    stats = repository.stats()
+
+    assert (stats.count, stats.available) == (5, 3)
+    assert stats.by_status == {
+        "New": StatusStats(2, 1), "Used": StatusStats(2, 2), "For parts": StatusStats(1, 0)
+    }
+    assert (stats.price_min, stats.price_avg, stats.price_max) == (
+        Decimal("10.00"), Decimal("40.00"), Decimal("100.00")
+    )
+    assert stats.price_percentiles == {
+        "p50": Decimal("30.00"), "p90": Decimal("76.00"), "p99": Decimal("97.60")
+    }
+
+    used = repository.stats(ProductFilter(statuses=("Used",)))
+    assert (used.count, used.price_avg) == (2, Decimal("35.00"))
+
+
+def test_stats_of_no_products(repository):
+    stats = repository.stats()
+
+    assert (stats.count, stats.by_status, stats.price_avg, stats.price_percentiles) == (
+        0, {}, None, {}
+    )
+
+
+def test_percentiles_are_read_in_one_query(repository):
+    repository.bulk_create([
+        build_product(str(index), f"{index}.00", "New", True) for index in range(1, 21)
+    ])
+    statements = []
+    engine = SessionManager.get_engine()
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        stats = repository.stats(ProductFilter(price_min=Decimal("11")))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert stats.price_percentiles == {
+        "p50": Decimal("15.50"), "p90": Decimal("19.10"), "p99": Decimal("19.91")
+    }
+    assert len(statements) == 2
+
+
+def test_percentiles_of_a_single_price(repository):
+    repository.create(build_product("1", "25.00", "New", True))
+
+    assert set(repository.stats().price_percentiles.values()) == {Decimal("25.00")}
+
+
+def test_percentiles_survive_a_delete_committed_after_the_counts(repository, monkeypatch):
+    repository.bulk_create([
+        build_product(str(index), f"{index}.00", "New", True) for index in range(1, 21)
+    ])
+    read_percentiles = stats_module._percentiles
+
+    def delete_then_read(*args):
+        # Another request commits deletes between the aggregate and this read.
+        for index in range(11, 21):
+            SQLProductRepository(SessionManager.get_session()).delete(str(index))
+        return read_percentiles(*args)
+
+    monkeypatch.setattr(stats_module, "_percentiles", delete_then_read)
+
+    stats = repository.stats()
+
+    assert stats.count == 20
+    assert stats.price_percentiles == {
+        "p50": Decimal("5.50"), "p90": Decimal("9.10"), "p99": Decimal("9.91")
+    }
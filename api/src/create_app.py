@@ -3,9 +3,29 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
-from adapters.src.repositories import Connection, SessionManager, SQLConnection
+from adapters.src.repositories import (
+    AsyncSessionManager,
+    AsyncSQLConnection,
+    Connection,
+    SessionManager,
+    SQLConnection,
+)
 
-from api.src.routes import health_check_router, product_router
+from api.src.instrumentation import (
+    InstrumentationConfig,
+    RequestTimingMiddleware,
+    RouteMetricsMiddleware,
+    instrument_sql,
+)
+from api.src.routes import (
+    health_check_router,
+    metrics_router,
+    product_event_router,
+    product_router,
+    user_router,
+)
+from factories.config import CatalogRepositoryConfig
+from factories.repositories import catalog_metrics
 
 from dotenv import load_dotenv
 import os
@@ -15,14 +35,33 @@ load_dotenv()
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     connection: Connection = SQLConnection()
     SessionManager.initialize_session(connection)
+    if CatalogRepositoryConfig.is_async():
+        await AsyncSessionManager.initialize_session(AsyncSQLConnection())
     yield
+    if CatalogRepositoryConfig.is_async():
+        await AsyncSessionManager.close_session()
     SessionManager.close_session()
 
 
 def create_app() -> FastAPI:
     app = FastAPI(lifespan=lifespan)
+    if InstrumentationConfig.ENABLED:
+        instrument_sql()
+        app.add_middleware(
+            RequestTimingMiddleware,
+            repeated_query_threshold=InstrumentationConfig.REPEATED_QUERY_THRESHOLD,
+        )
+    metrics = catalog_metrics()
+    app.add_middleware(
+        RouteMetricsMiddleware,
+        latency=metrics.request_latency,
+        window=metrics.recent_requests,
+    )
     app.include_router(health_check_router, tags=["health check"])
+    app.include_router(metrics_router, tags=["metrics"])
+    app.include_router(product_event_router, tags=["products"])
     app.include_router(product_router, tags=["products"])
+    app.include_router(user_router, tags=["users"])
     return app
 
 print("DATABASE_URL:", os.getenv("DATABASE_URL"))
\ No newline at end of file
@@ -9,6 +9,22 @@ from .product import (
     DeleteProductResponse,
     FilterProductByStatusResponseDto,
     FilterProductsByStatusRequestDto,
+    BulkProductResultDto,
+    BulkCreateProductResponseDto,
+    BatchGetProductsRequestDto,
+    BatchGetProductsResponseDto,
+    PatchProductRequestDto,
+    PatchProductResponseDto,
+    BulkPatchProductsRequestDto,
+    BulkPatchProductsResponseDto,
+    ProductChangeDto,
+    ProductChangesResponseDto,
+    SearchProductsResponseDto,
+    UserProductsResponseDto,
+    StatusStatsDto,
+    PriceStatsDto,
+    ProductCountsResponseDto,
+    ProductStatsResponseDto,
 
 
 )
@@ -1,7 +1,17 @@
-from typing import List
+from datetime import datetime
+from typing import Dict, List, Optional
 from decimal import Decimal
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 from app.src.core.enums._product_statuses import ProductStatuses
+from app.src.use_cases.product.bulk_patch import MAX_BULK_PATCH_SIZE
+from app.src.use_cases.product.get_many import MAX_BATCH_GET_SIZE
+
+
+def normalize_status(v: str) -> str:
+    if v.lower() not in [s.value.lower() for s in ProductStatuses]:
+        raise ValueError(f"status must be one of: {', '.join([s.value for s in ProductStatuses])}")
+    return v.title()  # Normalize status to title case
+
 
 """After the issue with the update method,I added a validator to check if the product_id only accepts numbers.
 So now the user can only use numbers in the product_id.
@@ -29,13 +39,12 @@ class ProductBase(BaseModel):
 
     @validator('status')
     def validate_status(cls, v):
-        if v.lower() not in [s.value.lower() for s in ProductStatuses]:
-            raise ValueError(f"status must be one of: {', '.join([s.value for s in ProductStatuses])}")
-        return v.title()  # Normalize status to title case
+        return normalize_status(v)
 
 
 class ListProductResponseDto(BaseModel):
     products: List[ProductBase]
+    next_cursor: Optional[str] = None
 
 
 class FindProductByIdResponseDto(ProductBase):
@@ -81,5 +90,104 @@ class FilterProductsByStatusRequestDto(BaseModel):
 
 class FilterProductByStatusResponseDto(BaseModel):
     products: List[ProductBase]
+    next_cursor: Optional[str] = None
+
+# Isadora's code ends here.
+
+
+class BulkProductResultDto(BaseModel):
+    product_id: str
+    status: str
+
+
+class BulkCreateProductResponseDto(BaseModel):
+    results: List[BulkProductResultDto]
+
+
+class BatchGetProductsRequestDto(BaseModel):
+    product_ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_GET_SIZE)
+
+
+class BatchGetProductsResponseDto(BaseModel):
+    products: List[Optional[ProductBase]]
+    missing: List[str]
+
+
+class PatchProductRequestDto(BaseModel):
+    """Fields to change; the ones left out keep their value."""
+    user_id: Optional[str] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    price: Optional[Decimal] = None
+    location: Optional[str] = None
+    status: Optional[str] = None
+    is_available: Optional[bool] = None
+
+    @validator('*')
+    def reject_null(cls, v):
+        if v is None:
+            raise ValueError("may be left out but not set to null")
+        return v
+
+    @validator('status')
+    def validate_status(cls, v):
+        return normalize_status(v)
+
+
+class PatchProductResponseDto(ProductBase):
+    ...
+
+
+class BulkPatchProductsRequestDto(BaseModel):
+    product_ids: List[str] = Field(..., min_length=1, max_length=MAX_BULK_PATCH_SIZE)
+    fields: PatchProductRequestDto
+
+
+class BulkPatchProductsResponseDto(BaseModel):
+    updated: List[str]
+    missing: List[str]
+
+
+class ProductChangeDto(BaseModel):
+    sequence: int
+    product_id: str
+    operation: str
+    changed_at: datetime
+
+
+class ProductChangesResponseDto(BaseModel):
+    changes: List[ProductChangeDto]
+    next_since: int
+
+
+class SearchProductsResponseDto(BaseModel):
+    products: List[ProductBase]
+    next_cursor: Optional[str] = None
+
+
+class UserProductsResponseDto(BaseModel):
+    products: List[ProductBase]
+    total: int
+    counts_by_status: Dict[str, int]
+    next_cursor: Optional[str] = None
+
+
+class StatusStatsDto(BaseModel):
+    count: int
+    available: int
+    availability_ratio: Optional[float] = None
+
+
+class PriceStatsDto(BaseModel):
+    min: Optional[Decimal] = None
+    avg: Optional[Decimal] = None
+    max: Optional[Decimal] = None
+    percentiles: Dict[str, Decimal] = {}
+
+
+class ProductCountsResponseDto(StatusStatsDto):
+    by_status: Dict[str, StatusStatsDto]
+
 
-# Isadora's code ends here.
\ No newline at end of file
+class ProductStatsResponseDto(ProductCountsResponseDto):
+    price: PriceStatsDto
@@ -0,0 +1,6 @@
+from .config import InstrumentationConfig
+from .metrics import RequestMetrics, current_metrics, record_serialization
+from .middleware import RequestTimingMiddleware
+from .route_metrics import RouteMetricsMiddleware
+from .routing import TimedRoute
+from .sql import instrument_sql
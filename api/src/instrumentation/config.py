@@ -0,0 +1,7 @@
+import os
+
+
+class InstrumentationConfig:
+    ENABLED = os.environ.get("REQUEST_TIMING_ENABLED", "true").lower() == "true"
+    # A statement run this many times in one request is logged as an N+1 suspect.
+    REPEATED_QUERY_THRESHOLD = int(os.environ.get("REQUEST_REPEATED_QUERY_THRESHOLD", "2"))
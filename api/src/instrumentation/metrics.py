@@ -0,0 +1,83 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+
+class RequestMetrics:
+    """Timings collected while one request is handled.
+
+    Held in a context variable, so SQL events fired from the threadpool that
+    runs sync use cases still land on the request that caused them.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.statements: Counter = Counter()
+        self.endpoint_finished: Optional[float] = None
+        self.response_started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def record_query(self, statement: str, seconds: float) -> None:
+        self.sql_count += 1
+        self.sql_seconds += seconds
+        self.statements[statement] += 1
+
+    def record_serialization(self, seconds: float) -> None:
+        self.serialization_seconds += seconds
+
+    def mark_endpoint_finished(self) -> None:
+        self.endpoint_finished = time.perf_counter()
+
+    def mark_response_started(self) -> None:
+        self.response_started = time.perf_counter()
+        # Between the route returning and the response starting, FastAPI
+        # validates the return value against response_model and encodes it.
+        if self.endpoint_finished is not None:
+            self.serialization_seconds += self.response_started - self.endpoint_finished
+
+    def mark_finished(self) -> None:
+        self.finished = time.perf_counter()
+
+    @property
+    def total_seconds(self) -> float:
+        # Until the body is fully sent once finished, until the headers before.
+        end = self.finished or self.response_started or time.perf_counter()
+        return end - self.started
+
+    @property
+    def app_seconds(self) -> float:
+        return max(self.total_seconds - self.sql_seconds - self.serialization_seconds, 0.0)
+
+    def repeated_queries(self, threshold: int) -> Dict[str, int]:
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+    def server_timing(self) -> str:
+        return ", ".join([
+            f'sql;dur={self.sql_seconds * 1000:.2f};desc="{self.sql_count} queries"',
+            f"serialize;dur={self.serialization_seconds * 1000:.2f}",
+            f"app;dur={self.app_seconds * 1000:.2f}",
+            f"total;dur={self.total_seconds * 1000:.2f}",
+        ])
+
+
+_current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    return _current_metrics.get()
+
+
+def record_serialization(seconds: float) -> None:
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.record_serialization(seconds)
@@ -0,0 +1,63 @@
+import json
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import RequestMetrics, _current_metrics
+
+logger = logging.getLogger("catalog.requests")
+
+
+class RequestTimingMiddleware:
+    """Adds a Server-Timing header (SQL, serialization, remaining app time and
+    total) to every HTTP response, logs one structured line per request and
+    flags statements repeated within a request as N+1 suspects."""
+
+    def __init__(self, app: ASGIApp, repeated_query_threshold: int = 2) -> None:
+        self.app = app
+        self.repeated_query_threshold = repeated_query_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                metrics.mark_response_started()
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", metrics.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            metrics.mark_finished()
+            _current_metrics.reset(token)
+            self._log(scope, status_code, metrics)
+
+    def _log(self, scope: Scope, status_code: int, metrics: RequestMetrics) -> None:
+        repeated = metrics.repeated_queries(self.repeated_query_threshold)
+        record = {
+            "event": "request",
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "total_ms": round(metrics.total_seconds * 1000, 3),
+            "sql_count": metrics.sql_count,
+            "sql_ms": round(metrics.sql_seconds * 1000, 3),
+            "serialize_ms": round(metrics.serialization_seconds * 1000, 3),
+            "app_ms": round(metrics.app_seconds * 1000, 3),
+        }
+        if repeated:
+            record["repeated_queries"] = [
+                {"statement": " ".join(statement.split())[:200], "count": count}
+                for statement, count in repeated.items()
+            ]
+        logger.log(logging.WARNING if repeated else logging.INFO, json.dumps(record))
@@ -0,0 +1,46 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from adapters.src.metrics import Histogram, SlidingWindow
+
+# Probes and scrapes are left out of the error rate the readiness probe reads.
+_UNTRACKED_PREFIXES = ("/health_check", "/metrics")
+
+
+class RouteMetricsMiddleware:
+    """Observes request latency per route template, method and status code.
+
+    Labels use the route template (`/products/{product_id}`), never the raw
+    path, so the number of series stays bounded. API requests are also counted
+    in `window`, with 5xx responses as errors.
+    """
+
+    def __init__(self, app: ASGIApp, latency: Histogram, window: SlidingWindow) -> None:
+        self.app = app
+        self.latency = latency
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self.latency.labels(route, scope["method"], str(status_code)).observe(
+                time.perf_counter() - started
+            )
+            if not route.startswith(_UNTRACKED_PREFIXES):
+                self.window.record(status_code >= 500)
@@ -0,0 +1,39 @@
+import functools
+import inspect
+from typing import Any, Callable
+
+from fastapi.routing import APIRoute
+
+from .metrics import current_metrics
+
+
+def _mark_finished() -> None:
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.mark_endpoint_finished()
+
+
+def _timed(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark_finished()
+    else:
+        @functools.wraps(endpoint)
+        def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                _mark_finished()
+    return timed_endpoint
+
+
+class TimedRoute(APIRoute):
+    """Marks when the route function returns, so the middleware can tell the
+    route's own work from response_model validation and encoding."""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed(endpoint), **kwargs)
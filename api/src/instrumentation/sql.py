@@ -0,0 +1,32 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metrics import current_metrics
+
+
+# Kept on the execution context rather than the pooled connection, so a
+# statement that raises (no after_cursor_execute) leaves nothing behind.
+_STARTED = "_catalog_query_started"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        setattr(context, _STARTED, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, _STARTED, None)
+    metrics = current_metrics()
+    if started is not None and metrics is not None:
+        metrics.record_query(statement, time.perf_counter() - started)
+
+
+def instrument_sql() -> None:
+    """Times every statement of every engine, sync and async alike (async
+    engines run on a sync Engine underneath)."""
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
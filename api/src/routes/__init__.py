@@ -1,2 +1,5 @@
 from .health_check_routes import health_check_router
+from .metrics_routes import metrics_router
+from .product_event_routes import product_event_router
 from .product_routes import product_router
+from .user_routes import user_router
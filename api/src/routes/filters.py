@@ -0,0 +1,69 @@
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+
+from app.src.core import ProductFilter, ProductSortOrder, ProductStatuses
+
+
+def _invalid(field: str, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=[{"loc": ["query", field], "msg": message, "type": "value_error"}],
+    )
+
+
+def _parse_statuses(statuses: List[str]) -> Tuple[str, ...]:
+    """Every stored spelling of the requested statuses, which may be repeated
+    or comma separated."""
+    try:
+        parsed = tuple(
+            stored
+            for values in statuses
+            for value in values.split(",")
+            if value.strip()
+            for stored in ProductStatuses.parse(value.strip()).stored_values
+        )
+    except ValueError as e:
+        raise _invalid("status", str(e))
+    return tuple(dict.fromkeys(parsed))
+
+
+_STATUS_QUERY = Query(
+    [], alias="status", description="Repeat or comma separate to match several statuses"
+)
+_LOCATION_QUERY = Query(None, min_length=1, description="Location prefix")
+
+
+def product_filter_params(
+    statuses: List[str] = _STATUS_QUERY,
+    is_available: Optional[bool] = None,
+    price_min: Optional[Decimal] = Query(None, ge=0),
+    price_max: Optional[Decimal] = Query(None, ge=0),
+    user_id: Optional[str] = None,
+    location: Optional[str] = _LOCATION_QUERY,
+    sort: ProductSortOrder = ProductSortOrder.PRODUCT_ID,
+) -> ProductFilter:
+    """Query parameters of a filtered product listing, as a ProductFilter."""
+    if price_min is not None and price_max is not None and price_min > price_max:
+        raise _invalid("price_min", "price_min must not be greater than price_max")
+    return ProductFilter(
+        statuses=_parse_statuses(statuses),
+        is_available=is_available,
+        price_min=price_min,
+        price_max=price_max,
+        user_id=user_id,
+        location_prefix=location,
+        sort=sort,
+    )
+
+
+def stats_filter_params(
+    statuses: List[str] = _STATUS_QUERY,
+    user_id: Optional[str] = None,
+    location: Optional[str] = _LOCATION_QUERY,
+) -> ProductFilter:
+    """Query parameters of the product statistics, as a ProductFilter."""
+    return ProductFilter(
+        statuses=_parse_statuses(statuses), user_id=user_id, location_prefix=location
+    )
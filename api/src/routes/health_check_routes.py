@@ -1,15 +1,62 @@
-from typing import Literal
+from typing import Dict, List, Literal, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response, status
 from pydantic import BaseModel
 
-health_check_router = APIRouter(prefix="/health_check")
+from adapters.src.health import ReadinessProbe
+from factories.repositories import readiness_probe
+
+from ..instrumentation import TimedRoute
+
+health_check_router = APIRouter(prefix="/health_check", route_class=TimedRoute)
 
 
 class HealthCheck(BaseModel):
     status: Literal["OK", "ERROR"]
 
 
+class PoolCheck(BaseModel):
+    database_ok: bool
+    database_latency_ms: Optional[float]
+    saturation: Optional[float]
+
+
+class ReadinessCheck(HealthCheck):
+    database_ok: bool
+    database_latency_ms: Optional[float]
+    pool_saturation: Optional[float]
+    error_rate: Optional[float]
+    reasons: List[str]
+    pools: Dict[str, PoolCheck]
+
+
 @health_check_router.get("/", response_model=HealthCheck)
 async def check_health() -> HealthCheck:
     return HealthCheck(status="OK")
+
+
+@health_check_router.get("/live", response_model=HealthCheck)
+async def check_liveness() -> HealthCheck:
+    # Only proves the event loop answers; dependencies belong to /ready, so a
+    # database outage does not get every pod restarted.
+    return HealthCheck(status="OK")
+
+
+@health_check_router.get(
+    "/ready",
+    response_model=ReadinessCheck,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessCheck}},
+)
+async def check_readiness(
+    response: Response, probe: ReadinessProbe = Depends(readiness_probe)
+) -> ReadinessCheck:
+    report = await probe.check()
+    if not report.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessCheck(
+        status="OK" if report.ready else "ERROR",
+        **{
+            **report._asdict(),
+            "pools": {name: pool._asdict() for name, pool in report.pools.items()},
+        },
+    )
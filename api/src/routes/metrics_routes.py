@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Response
+
+from adapters.src.metrics import Registry
+from factories.repositories import catalog_metrics
+
+from ..instrumentation import TimedRoute
+
+metrics_router = APIRouter(route_class=TimedRoute)
+
+
+@metrics_router.get("/metrics", response_class=Response)
+async def get_metrics() -> Response:
+    return Response(catalog_metrics().registry.render(), media_type=Registry.CONTENT_TYPE)
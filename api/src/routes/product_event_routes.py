@@ -0,0 +1,126 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from adapters.src.events import (
+    InProcessProductEventBus,
+    Subscription,
+    SubscriptionOverflowException,
+)
+from adapters.src.repositories.config import EventsConfig
+from app.src.core import ProductEvent
+from factories.events import product_event_bus
+
+from ..instrumentation import TimedRoute
+from ..serializers import product_event_payload
+
+product_event_router = APIRouter(prefix="/products", route_class=TimedRoute)
+
+
+def sse_message(event: ProductEvent) -> str:
+    """One Server-Sent Events message; the event name is the operation, so
+    browsers can `addEventListener("updated", ...)`."""
+    data = json.dumps(product_event_payload(event), separators=(",", ":"))
+    return f"event: {event.operation}\ndata: {data}\n\n"
+
+
+async def sse_stream(
+    subscription: Subscription, keepalive_seconds: float
+) -> AsyncIterator[str]:
+    try:
+        while True:
+            try:
+                event = await subscription.get(timeout=keepalive_seconds)
+            except SubscriptionOverflowException:
+                # EventSource reconnects on its own; the client should reload
+                # the product when it sees this, since events were dropped.
+                yield "event: overflow\ndata: {}\n\n"
+                return
+            yield ": keepalive\n\n" if event is None else sse_message(event)
+    finally:
+        subscription.close()
+
+
+@product_event_router.get("/{product_id}/events", response_class=StreamingResponse)
+async def stream_product_events(
+    product_id: str,
+    bus: InProcessProductEventBus = Depends(product_event_bus),
+) -> StreamingResponse:
+    """Server-Sent Events for every write to the product, as it happens."""
+    subscription = bus.subscribe([product_id])
+    return StreamingResponse(
+        sse_stream(subscription, EventsConfig.KEEPALIVE_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _receive_commands(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        try:
+            message = await websocket.receive_json()
+        except WebSocketDisconnect:
+            return
+        except ValueError:
+            await websocket.send_json({"type": "error", "detail": "Messages must be JSON"})
+            continue
+        action = message.get("action") if isinstance(message, dict) else None
+        product_ids = message.get("product_ids") if isinstance(message, dict) else None
+        if action not in ("subscribe", "unsubscribe") or not isinstance(product_ids, list):
+            await websocket.send_json({
+                "type": "error",
+                "detail": 'Expected {"action": "subscribe" | "unsubscribe", "product_ids": [...]}',
+            })
+            continue
+        product_ids = [str(product_id) for product_id in product_ids]
+        if action == "unsubscribe":
+            subscription.unsubscribe(product_ids)
+        elif len(subscription.product_ids | set(product_ids)) > EventsConfig.MAX_SUBSCRIPTIONS:
+            await websocket.send_json({
+                "type": "error",
+                "detail": f"At most {EventsConfig.MAX_SUBSCRIPTIONS} products per connection",
+            })
+            continue
+        else:
+            subscription.subscribe(product_ids)
+        await websocket.send_json({
+            "type": f"{action}d", "product_ids": sorted(subscription.product_ids)
+        })
+
+
+async def _send_events(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        try:
+            event = await subscription.get()
+        except SubscriptionOverflowException as e:
+            await websocket.send_json({"type": "overflow", "detail": str(e)})
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return
+        await websocket.send_json({"type": "event", **product_event_payload(event)})
+
+
+@product_event_router.websocket("/events")
+async def product_events_socket(
+    websocket: WebSocket,
+    bus: InProcessProductEventBus = Depends(product_event_bus),
+) -> None:
+    """One connection watching many products. Clients send
+    `{"action": "subscribe" | "unsubscribe", "product_ids": [...]}` at any
+    time and receive `{"type": "event", ...}` for every write to those."""
+    await websocket.accept()
+    subscription = bus.subscribe()
+    tasks = {
+        asyncio.ensure_future(_receive_commands(websocket, subscription)),
+        asyncio.ensure_future(_send_events(websocket, subscription)),
+    }
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.result()
+    finally:
+        subscription.close()
@@ -1,30 +1,76 @@
+import asyncio
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.exceptions import HTTPException
+import time
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from app.src.use_cases.product import (
     ListProducts,
+    ListProductsRequest,
     ListProductResponse,
     FindProductById,
     FindProductByIdResponse,
     FindProductByIdRequest,
     CreateProduct,
-    CreateProductResponse,
     CreateProductRequest,
     DeleteProductRequest,
-    DeleteProductResponse,
     DeleteProduct,
     UpdateProductRequest,
-    UpdateProductResponse,
     UpdateProduct,
     FilterProductByStatus,
     FilterProductsByStatusRequest,
-    FilterProductsByStatusResponse
+    ExportProducts,
+    ExportProductsRequest,
+    BulkCreateProducts,
+    BulkCreateProductsRequest,
+    GetCollectionVersion,
+    GetCollectionVersionRequest,
+    SearchProducts,
+    SearchProductsRequest,
+    FilterProducts,
+    FilterProductsRequest,
+    GetProductStats,
+    GetProductStatsRequest,
+    CountProductsByStatus,
+    GetProductsByIds,
+    GetProductsByIdsRequest,
+    PatchProduct,
+    PatchProductRequest,
+    BulkPatchProducts,
+    BulkPatchProductsRequest,
+    ListProductChanges,
+    ListProductChangesRequest,
 )
+from app.src.core import ProductFilter
 from app.src.core.enums._product_statuses import ProductStatuses
-from app.src.exceptions import ProductNotFoundException, ProductRepositoryException
-from factories.use_cases.product import get_product_repository
+from app.src.use_cases.product.bulk_create import MAX_BULK_SIZE
+from app.src.use_cases.product.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.src.exceptions import (
+    ProductBusinessException,
+    ProductConflictException,
+    ProductNotFoundException,
+    ProductRepositoryException,
+)
+from ..instrumentation import TimedRoute
+from .filters import product_filter_params, stats_filter_params
+from .conditional import (
+    if_match_version,
+    is_not_modified,
+    not_modified,
+    strong_etag,
+    validator_headers,
+    version_etag,
+)
+from .utils import run_use_case
+from ..serializers import (
+    ExportFormat,
+    FastJSONResponse,
+    async_export_chunks,
+    export_chunks,
+    export_media_type,
+    product_payload,
+)
 from ..dtos import (
-    ProductBase,
     ListProductResponseDto,
     CreateProductRequestDto,
     CreateProductResponseDto,
@@ -33,7 +79,20 @@ from ..dtos import (
     UpdateProductRequestDto,
     UpdateProductResponseDto,
     FilterProductByStatusResponseDto,
-    FilterProductsByStatusRequestDto
+    BulkCreateProductResponseDto,
+    BulkProductResultDto,
+    SearchProductsResponseDto,
+    StatusStatsDto,
+    PriceStatsDto,
+    BatchGetProductsRequestDto,
+    BatchGetProductsResponseDto,
+    PatchProductRequestDto,
+    PatchProductResponseDto,
+    BulkPatchProductsRequestDto,
+    BulkPatchProductsResponseDto,
+    ProductCountsResponseDto,
+    ProductStatsResponseDto,
+    ProductChangesResponseDto,
 )
 from factories.use_cases import (
     list_product_use_case,
@@ -41,64 +100,92 @@ from factories.use_cases import (
     create_product_use_case,
     delete_product_use_case,
     update_product_use_case,
-    filter_product_use_case
+    filter_product_use_case,
+    export_products_use_case,
+    bulk_create_products_use_case,
+    collection_version_use_case,
+    search_products_use_case,
+    filter_products_use_case,
+    product_stats_use_case,
+    count_products_use_case,
+    get_products_by_ids_use_case,
+    patch_product_use_case,
+    bulk_patch_products_use_case,
+    list_product_changes_use_case,
 )
 
-product_router = APIRouter(prefix="/products")
+product_router = APIRouter(prefix="/products", route_class=TimedRoute)
 
 
 @product_router.get("/", response_model=ListProductResponseDto)
 async def get_products(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    product_filter: ProductFilter = Depends(product_filter_params),
     use_case: ListProducts = Depends(list_product_use_case),
+    filter_use_case: FilterProducts = Depends(filter_products_use_case),
+    version_use_case: GetCollectionVersion = Depends(collection_version_use_case),
 ) -> ListProductResponse:
-    response_list = use_case()
-    response = [
-        {**product._asdict(), "status": str(product.status.value)}
-        for product in response_list.products
-    ]
-    response_dto: ListProductResponseDto = ListProductResponseDto(
-        products=[ProductBase(**product) for product in response]
+    # One aggregate query decides whether the client's copy of this page is
+    # current; any write anywhere changes it, so filtered pages are covered too.
+    # No Last-Modified: a delete does not move the latest updated_at, so only
+    # the ETag, which also carries the count, tells the lists apart.
+    version = await run_use_case(version_use_case, GetCollectionVersionRequest())
+    etag = strong_etag(
+        "products", version.count, version.last_modified, limit, cursor, *product_filter
+    )
+    headers = validator_headers(etag, None)
+    if is_not_modified(request, etag, None):
+        return not_modified(headers)
+    try:
+        if product_filter == ProductFilter():
+            response_list = await run_use_case(
+                use_case, ListProductsRequest(limit=limit, cursor=cursor)
+            )
+        else:
+            response_list = await run_use_case(
+                filter_use_case,
+                FilterProductsRequest(product_filter=product_filter, limit=limit, cursor=cursor),
+            )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"loc": ["query", "cursor"], "msg": str(e), "type": "value_error"}]
+        )
+    # Rendered straight to JSON: the DTOs only document the response shape.
+    return FastJSONResponse(
+        {
+            "products": [product_payload(product) for product in response_list.products],
+            "next_cursor": response_list.next_cursor,
+        },
+        headers=headers,
     )
-    return response_dto
 
 
 #Route to filter by status
 @product_router.get("/filter-by-status", response_model=FilterProductByStatusResponseDto)
 async def filter_product_by_status(
     status_param: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     use_case: FilterProductByStatus = Depends(filter_product_use_case)
 ) -> FilterProductByStatusResponseDto:
     try:
-        # Validate status before calling use case
-        if status_param.lower() not in [s.value.lower() for s in ProductStatuses]:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=[{
-                    "loc": ["query", "status"],
-                    "msg": f"Not a valid status value. Must be one of: {', '.join([s.value for s in ProductStatuses])}",
-                    "type": "value_error.enum"
-                }]
-            )
-        
+        # Validate status before calling use case; raises ValueError when unknown
+        ProductStatuses.parse(status_param)
+
         # Create the request with the status
-        response = use_case(FilterProductsByStatusRequest(status=status_param))
-        
-        # Convert the response to FilterProductByStatusResponseDto
-        return FilterProductByStatusResponseDto(
-            products=[
-                ProductBase(
-                    product_id=product.product_id,
-                    user_id=product.user_id,
-                    name=product.name,
-                    description=product.description,
-                    price=product.price,
-                    location=product.location,
-                    status=product.status,
-                    is_available=product.is_available
-                )
-                for product in response.products
-            ]
+        response = await run_use_case(
+            use_case,
+            FilterProductsByStatusRequest(status=status_param, limit=limit, cursor=cursor),
         )
+        
+        # Same shape as FilterProductByStatusResponseDto, without re-validating rows
+        return FastJSONResponse({
+            "products": [product_payload(product) for product in response.products],
+            "next_cursor": response.next_cursor,
+        })
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -112,18 +199,163 @@ async def filter_product_by_status(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@product_router.get("/search", response_model=SearchProductsResponseDto)
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    use_case: SearchProducts = Depends(search_products_use_case),
+) -> SearchProductsResponseDto:
+    try:
+        response = await run_use_case(
+            use_case, SearchProductsRequest(query=q, limit=limit, cursor=cursor)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"loc": ["query", "cursor"], "msg": str(e), "type": "value_error"}]
+        )
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return FastJSONResponse({
+        "products": [product_payload(product) for product in response.products],
+        "next_cursor": response.next_cursor,
+    })
+
+
+def _ratio(part: int, whole: int) -> Optional[float]:
+    return round(part / whole, 4) if whole else None
+
+
+def _status_stats(count: int, available: int) -> StatusStatsDto:
+    return StatusStatsDto(
+        count=count, available=available, availability_ratio=_ratio(available, count)
+    )
+
+
+@product_router.get("/counts", response_model=ProductCountsResponseDto)
+async def count_products(
+    use_case: CountProductsByStatus = Depends(count_products_use_case),
+) -> ProductCountsResponseDto:
+    try:
+        counts = await run_use_case(use_case)
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return ProductCountsResponseDto(
+        **_status_stats(counts.count, counts.available).model_dump(),
+        by_status={
+            product_status: _status_stats(*status_counts)
+            for product_status, status_counts in counts.by_status.items()
+        },
+    )
+
+
+MAX_CHANGES_WAIT_SECONDS = 30
+CHANGES_POLL_INTERVAL_SECONDS = 0.5
+
+
+@product_router.get("/changes", response_model=ProductChangesResponseDto)
+async def list_product_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    wait: float = Query(0, ge=0, le=MAX_CHANGES_WAIT_SECONDS),
+    use_case: ListProductChanges = Depends(list_product_changes_use_case),
+) -> FastJSONResponse:
+    """Changes after `since`, oldest first. With `wait`, an empty read is
+    retried until a change arrives or `wait` seconds pass (long polling)."""
+    deadline = time.monotonic() + wait
+    changes_request = ListProductChangesRequest(since=since, limit=limit)
+    try:
+        response = await run_use_case(use_case, changes_request)
+        while not response.changes and time.monotonic() < deadline:
+            await asyncio.sleep(min(CHANGES_POLL_INTERVAL_SECONDS, deadline - time.monotonic()))
+            response = await run_use_case(use_case, changes_request)
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return FastJSONResponse({
+        "changes": [
+            {
+                "sequence": change.sequence,
+                "product_id": change.product_id,
+                "operation": change.operation,
+                "changed_at": change.changed_at,
+            }
+            for change in response.changes
+        ],
+        "next_since": response.next_since,
+    })
+
+
+@product_router.get("/stats", response_model=ProductStatsResponseDto)
+async def get_product_stats(
+    product_filter: ProductFilter = Depends(stats_filter_params),
+    use_case: GetProductStats = Depends(product_stats_use_case),
+) -> ProductStatsResponseDto:
+    try:
+        stats = await run_use_case(use_case, GetProductStatsRequest(product_filter=product_filter))
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return ProductStatsResponseDto(
+        **_status_stats(stats.count, stats.available).model_dump(),
+        by_status={
+            product_status: _status_stats(*counts)
+            for product_status, counts in stats.by_status.items()
+        },
+        price=PriceStatsDto(
+            min=stats.price_min,
+            avg=stats.price_avg,
+            max=stats.price_max,
+            percentiles=stats.price_percentiles,
+        ),
+    )
+
+
+@product_router.get("/export", response_class=StreamingResponse)
+async def export_products(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    batch_size: int = Query(1000, ge=1, le=10000),
+    use_case: ExportProducts = Depends(export_products_use_case),
+) -> StreamingResponse:
+    products = use_case(ExportProductsRequest(batch_size=batch_size))
+    if hasattr(products, "__aiter__"):
+        chunks = async_export_chunks(products, export_format)
+    else:
+        chunks = export_chunks(products, export_format)
+    return StreamingResponse(
+        chunks,
+        media_type=export_media_type(export_format),
+        headers={
+            "Content-Disposition": f'attachment; filename="products.{export_format.value}"'
+        },
+    )
+
+
 @product_router.get("/{product_id}", response_model=FindProductByIdResponseDto)
 async def get_product_by_id(
-    product_id: str, use_case: FindProductById = Depends(find_product_by_id_use_case)
+    product_id: str,
+    request: Request,
+    http_response: Response,
+    use_case: FindProductById = Depends(find_product_by_id_use_case),
 ) -> FindProductByIdResponse:
-    response = use_case(FindProductByIdRequest(product_id=product_id))
+    response = await run_use_case(use_case, FindProductByIdRequest(product_id=product_id))
+    if response.updated_at is not None:
+        if response.version is not None:
+            etag = version_etag(response.version)
+        else:
+            etag = strong_etag(response.product_id, response.updated_at.isoformat())
+        headers = validator_headers(etag, response.updated_at)
+        if is_not_modified(request, etag, response.updated_at):
+            return not_modified(headers)
+        http_response.headers.update(headers)
     response_dto: FindProductByIdResponseDto = FindProductByIdResponseDto(
         **response._asdict()
     )
     return response_dto
 
 
-@product_router.post("/", response_model=CreateProductResponseDto, status_code=status.HTTP_201_CREATED)
+@product_router.post(
+    "/", response_model=CreateProductResponseDto, status_code=status.HTTP_201_CREATED
+)
 async def create_product(
     request: CreateProductRequestDto,
     use_case: CreateProduct = Depends(create_product_use_case),
@@ -146,7 +378,8 @@ async def create_product(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail=[{
                     "loc": ["body", "status"],
-                    "msg": f"status must be one of: {', '.join([s.value for s in ProductStatuses])}",
+                    "msg": "status must be one of: "
+                    + ", ".join(s.value for s in ProductStatuses),
                     "type": "value_error.enum"
                 }]
             )
@@ -164,7 +397,7 @@ async def create_product(
         )
         
         # Call use case
-        response = use_case(product_request)
+        response = await run_use_case(use_case, product_request)
         
         # Convert response to DTO
         return CreateProductResponseDto(
@@ -199,19 +432,105 @@ async def create_product(
         )
 
 
+@product_router.post("/bulk", response_model=BulkCreateProductResponseDto)
+async def bulk_create_products(
+    request: List[CreateProductRequestDto] = Body(..., min_length=1, max_length=MAX_BULK_SIZE),
+    upsert: bool = False,
+    use_case: BulkCreateProducts = Depends(bulk_create_products_use_case),
+) -> BulkCreateProductResponseDto:
+    bulk_request = BulkCreateProductsRequest(
+        products=[CreateProductRequest(**item.model_dump()) for item in request],
+        upsert=upsert,
+    )
+    try:
+        response = await run_use_case(use_case, bulk_request)
+    except ProductBusinessException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return BulkCreateProductResponseDto(
+        results=[BulkProductResultDto(**result._asdict()) for result in response.results]
+    )
+
+
+@product_router.post("/batch-get", response_model=BatchGetProductsResponseDto)
+async def batch_get_products(
+    request: BatchGetProductsRequestDto,
+    use_case: GetProductsByIds = Depends(get_products_by_ids_use_case),
+) -> BatchGetProductsResponseDto:
+    try:
+        response = await run_use_case(
+            use_case, GetProductsByIdsRequest(product_ids=request.product_ids)
+        )
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return FastJSONResponse({
+        "products": [
+            None if product is None else product_payload(product)
+            for product in response.products
+        ],
+        "missing": response.missing,
+    })
+
+
+@product_router.patch("/bulk", response_model=BulkPatchProductsResponseDto)
+async def bulk_patch_products(
+    request: BulkPatchProductsRequestDto,
+    use_case: BulkPatchProducts = Depends(bulk_patch_products_use_case),
+) -> BulkPatchProductsResponseDto:
+    patch_request = BulkPatchProductsRequest(
+        product_ids=request.product_ids,
+        fields=request.fields.model_dump(exclude_unset=True),
+    )
+    try:
+        response = await run_use_case(use_case, patch_request)
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return BulkPatchProductsResponseDto(updated=response.updated, missing=response.missing)
+
+
+@product_router.patch("/{product_id}", response_model=PatchProductResponseDto)
+async def patch_product(
+    product_id: str,
+    request: PatchProductRequestDto,
+    expected_version: Optional[int] = Depends(if_match_version),
+    use_case: PatchProduct = Depends(patch_product_use_case),
+) -> PatchProductResponseDto:
+    patch_request = PatchProductRequest(
+        product_id=product_id,
+        fields=request.model_dump(exclude_unset=True),
+        expected_version=expected_version,
+    )
+    try:
+        product = await run_use_case(use_case, patch_request)
+    except ProductNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ProductConflictException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return FastJSONResponse(
+        product_payload(product), headers={"ETag": version_etag(product.version)}
+    )
+
+
 # Isadora's code starts here.
 
 #ROUTE TO DELETE
 @product_router.delete("/{product_id}", response_model=DeleteProductResponse)
 async def delete_product(
     product_id: str,
+    expected_version: Optional[int] = Depends(if_match_version),
     use_case: DeleteProduct = Depends(delete_product_use_case)
 ) -> DeleteProductResponse:
     logging.info(f"Deleting product with ID {product_id}")
     try:
-        response = use_case(DeleteProductRequest(product_id=product_id))
+        response = await run_use_case(
+            use_case,
+            DeleteProductRequest(product_id=product_id, expected_version=expected_version),
+        )
         logging.info(f"Product deleted: {response}")
         return response
+    except HTTPException:
+        raise
     except ProductNotFoundException as e:
         logging.error(f"Product not found: {str(e)}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -230,6 +549,8 @@ async def delete_product(
 async def update_product(
     product_id: str, 
     request: UpdateProductRequestDto,
+    http_response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
     use_case: UpdateProduct = Depends(update_product_use_case),    
 ) -> UpdateProductResponseDto | str:
     # Convert the DTO to the request model expected by the use case
@@ -242,12 +563,14 @@ async def update_product(
         location=request.location,
         status=request.status,
         is_available=request.is_available,
+        expected_version=expected_version,
     )
     
     # Call the use case
-    response = use_case(product_id, update_request)
+    response = await run_use_case(use_case, product_id, update_request)
     
     if response:
+        http_response.headers["ETag"] = version_etag(response.version)
         # Convert the response to updateProductResponseDto
         return UpdateProductResponseDto(
             product_id=response.product_id,
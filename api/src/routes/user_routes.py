@@ -0,0 +1,41 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.src.exceptions import ProductRepositoryException
+from app.src.use_cases.product import ListUserProducts, ListUserProductsRequest
+from app.src.use_cases.product.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from factories.use_cases import list_user_products_use_case
+
+from ..dtos import UserProductsResponseDto
+from ..instrumentation import TimedRoute
+from ..serializers import FastJSONResponse, product_payload
+from .utils import run_use_case
+
+user_router = APIRouter(prefix="/users", route_class=TimedRoute)
+
+
+@user_router.get("/{user_id}/products", response_model=UserProductsResponseDto)
+async def get_user_products(
+    user_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    use_case: ListUserProducts = Depends(list_user_products_use_case),
+) -> UserProductsResponseDto:
+    try:
+        response = await run_use_case(
+            use_case, ListUserProductsRequest(user_id=user_id, limit=limit, cursor=cursor)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"loc": ["query", "cursor"], "msg": str(e), "type": "value_error"}]
+        )
+    except ProductRepositoryException as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return FastJSONResponse({
+        "products": [product_payload(product) for product in response.products],
+        "total": response.total,
+        "counts_by_status": response.counts_by_status,
+        "next_cursor": response.next_cursor,
+    })
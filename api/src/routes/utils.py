@@ -0,0 +1,12 @@
+import inspect
+from typing import Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+
+async def run_use_case(use_case: Callable[..., Any], *args: Any) -> Any:
+    """Awaits async use cases and runs sync ones in the threadpool, so a blocking
+    repository call never stalls the event loop for other requests."""
+    if inspect.iscoroutinefunction(getattr(use_case, "__call__", use_case)):
+        return await use_case(*args)
+    return await run_in_threadpool(use_case, *args)
@@ -0,0 +1,13 @@
+from .product_export import (
+    ExportFormat,
+    async_export_chunks,
+    export_chunks,
+    export_media_type,
+)
+from .product_json import (
+    PRODUCT_PAYLOAD_FIELDS,
+    FastJSONResponse,
+    dumps_json,
+    product_event_payload,
+    product_payload,
+)
@@ -0,0 +1,96 @@
+import csv
+import io
+from enum import Enum
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, NamedTuple
+
+from app.src.core.models import Product
+
+from .product_json import PRODUCT_PAYLOAD_FIELDS, dumps_json, product_payload
+
+_ROWS_PER_CHUNK = 500
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    JSON = "json"
+    CSV = "csv"
+
+
+def _json_row(product: Product) -> str:
+    # Same row shape and encoding as the product list responses.
+    return dumps_json(product_payload(product)).decode("utf-8")
+
+
+def _csv_row(values: Iterable) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+class _Layout(NamedTuple):
+    media_type: str
+    header: str
+    separator: str
+    footer: str
+    encode: Callable[[Product], str]
+
+
+_LAYOUTS = {
+    ExportFormat.NDJSON: _Layout(
+        "application/x-ndjson", "", "", "", lambda product: _json_row(product) + "\n"
+    ),
+    ExportFormat.JSON: _Layout("application/json", "[", ",", "]", _json_row),
+    ExportFormat.CSV: _Layout(
+        "text/csv",
+        _csv_row(PRODUCT_PAYLOAD_FIELDS),
+        "",
+        "",
+        lambda product: _csv_row(product_payload(product).values()),
+    ),
+}
+
+
+def export_media_type(export_format: ExportFormat) -> str:
+    return _LAYOUTS[export_format].media_type
+
+
+class _ChunkBuilder:
+    """Encodes rows and groups them into chunks, so the response is neither one
+    write per row nor a body buffered in memory."""
+
+    def __init__(self, export_format: ExportFormat) -> None:
+        self.layout = _LAYOUTS[export_format]
+        self.rows: List[str] = []
+        self.first = True
+
+    def add(self, product: Product) -> bool:
+        if not self.first:
+            self.rows.append(self.layout.separator)
+        self.first = False
+        self.rows.append(self.layout.encode(product))
+        return len(self.rows) >= _ROWS_PER_CHUNK
+
+    def flush(self) -> str:
+        chunk = "".join(self.rows)
+        self.rows = []
+        return chunk
+
+
+def export_chunks(products: Iterable[Product], export_format: ExportFormat) -> Iterator[str]:
+    builder = _ChunkBuilder(export_format)
+    yield builder.layout.header
+    for product in products:
+        if builder.add(product):
+            yield builder.flush()
+    yield builder.flush() + builder.layout.footer
+
+
+async def async_export_chunks(
+    products: AsyncIterable[Product], export_format: ExportFormat
+) -> AsyncIterator[str]:
+    builder = _ChunkBuilder(export_format)
+    yield builder.layout.header
+    async for product in products:
+        if builder.add(product):
+            yield builder.flush()
+    yield builder.flush() + builder.layout.footer
@@ -0,0 +1,86 @@
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse
+
+from app.src.core.models import Product, ProductEvent
+
+from ..instrumentation import record_serialization
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the stdlib encoder is the fallback
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        # Same ISO 8601 text orjson writes natively.
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Compact JSON, with orjson when it is installed; Decimals as strings and
+    datetimes as ISO 8601 either way."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+# Keys of product_payload, in order (the CSV export header).
+PRODUCT_PAYLOAD_FIELDS = (
+    "product_id",
+    "user_id",
+    "name",
+    "description",
+    "price",
+    "location",
+    "status",
+    "is_available",
+)
+
+
+def product_payload(product: Product) -> Dict[str, Any]:
+    """JSON shape of ProductBase, built straight from a repository Product.
+
+    Products come from our own database, so they skip the DTO validators that
+    guard incoming requests.
+    """
+    return {
+        "product_id": product.product_id,
+        "user_id": product.user_id,
+        "name": product.name,
+        "description": product.description,
+        "price": str(product.price),
+        "location": product.location,
+        "status": getattr(product.status, "value", product.status),
+        "is_available": product.is_available,
+    }
+
+
+def product_event_payload(event: ProductEvent) -> Dict[str, Any]:
+    """JSON shape of a live product update; `product` is null after a delete."""
+    return {
+        "product_id": event.product_id,
+        "operation": event.operation,
+        "product": None if event.product is None else product_payload(event.product),
+    }
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        try:
+            return dumps_json(content)
+        finally:
+            record_serialization(time.perf_counter() - started)
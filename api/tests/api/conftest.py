@@ -1,110 +1,82 @@
+import asyncio
+
 import pytest
+from fastapi import Depends
 from fastapi.testclient import TestClient
 from decimal import Decimal
 from faker import Faker
 from unittest.mock import MagicMock
-from uuid import UUID
 
 from api.src.create_app import create_app
+from adapters.src.repositories.sql.async_session_manager import AsyncSessionManager
+from adapters.src.repositories.sql.connections import Connection
 from adapters.src.repositories.sql.session_manager import SessionManager
 from adapters.src.repositories.sql.tables.product import ProductSchema
 from app.src.core.models._product import Product
 from app.src.core.enums._product_statuses import ProductStatuses
-from app.src.exceptions import ProductRepositoryException
+from factories.config import CatalogRepositoryConfig
+from factories.repositories import (
+    async_sql_product_repository,
+    cached_product_repository,
+    instrumented_product_repository,
+    product_cache,
+    stats_cache,
+)
+from factories.use_cases.product import get_product_repository
 
 fake = Faker()
 
+
+class SQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite:///{self.database_path}"
+
+
 @pytest.fixture(autouse=True)
-def mock_db_session():
-    """Mock database session for all tests"""
-    session_mock = MagicMock()
-    
-    # Make session work as a context manager
-    session_mock.__enter__.return_value = session_mock
-    session_mock.__exit__.return_value = None
-    
-    # Initialize in-memory product storage
-    session_mock.products = []
-    
-    # Create query mock with proper chaining
-    query_mock = MagicMock()
-    session_mock.query.return_value = query_mock
-    
-    def mock_filter(condition):
-        """Mock filter operations for different queries"""
-        try:
-            # For status filtering
-            if hasattr(condition.right, 'value') and hasattr(condition.left, 'key') and condition.left.key == 'status':
-                status = condition.right.value
-                filtered_products = [p for p in session_mock.products if p.status.lower() == status.lower()]
-                query_mock.all.return_value = filtered_products
-                return query_mock
-            
-            # For product_id filtering
-            if hasattr(condition.left, 'key') and condition.left.key == 'product_id':
-                product_id = condition.right
-                product = next((p for p in session_mock.products if p.product_id == product_id), None)
-                query_mock.first.return_value = product
-                return query_mock
-                
-            # Default case - return all products
-            query_mock.first.return_value = None
-            query_mock.all.return_value = session_mock.products
-            return query_mock
-        except Exception as e:
-            print(f"Error in mock_filter: {str(e)}")
-            raise
-    
-    # Set up mock behaviors
-    query_mock.filter.side_effect = mock_filter
-    query_mock.all.return_value = session_mock.products
-    
-    def mock_add(product):
-        """Add product to in-memory storage"""
-        try:
-            if isinstance(product, ProductSchema):
-                # Check if product already exists
-                existing = next((p for p in session_mock.products if p.product_id == product.product_id), None)
-                if not existing:
-                    session_mock.products.append(product)
-            else:
-                # Convert Product model to ProductSchema
-                schema = ProductSchema(
-                    product_id=product.product_id,
-                    user_id=product.user_id,
-                    name=product.name,
-                    description=product.description,
-                    price=product.price,
-                    location=product.location,
-                    status=product.status,
-                    is_available=product.is_available
-                )
-                # Check if product already exists
-                existing = next((p for p in session_mock.products if p.product_id == schema.product_id), None)
-                if not existing:
-                    session_mock.products.append(schema)
-        except Exception as e:
-            print(f"Error in mock_add: {str(e)}")
-            raise ProductRepositoryException(method="create", message=str(e))
-    
-    def mock_commit():
-        """Mock commit operation"""
-        pass
-    
-    # Attach mock methods
-    session_mock.add = mock_add
-    session_mock.commit = mock_commit
-    
-    # Set up the session
-    SessionManager._session = session_mock
-    yield session_mock
-    # Clean up after test
-    SessionManager._session = None
-    session_mock.products = []
+def db_session(tmp_path):
+    """Bind the session manager to a throwaway SQLite database for every test"""
+    product_cache().clear()
+    stats_cache().clear()
+    SessionManager.initialize_session(SQLiteTestConnection(tmp_path / "catalog.db"))
+    with SessionManager.session_scope() as session:
+        yield session
+    SessionManager.close_session()
+
+
+class AioSQLiteTestConnection(Connection):
+    def __init__(self, database_path) -> None:
+        self.database_path = database_path
+
+    def get_connection_string(self) -> str:
+        return f"sqlite+aiosqlite:///{self.database_path}"
+
+
+def async_product_repository(product_repository=Depends(async_sql_product_repository)):
+    """get_product_repository as CATALOG_REPOSITORY=ASYNC_SQL builds it"""
+    return cached_product_repository(instrumented_product_repository(product_repository))
+
+
+@pytest.fixture(params=["SQL", "ASYNC_SQL"])
+def catalog_repository(request, tmp_path, monkeypatch, db_session):
+    """Run the routes on the sync and on the async repository over the same database"""
+    monkeypatch.setattr(CatalogRepositoryConfig, "_REPOSITORY", request.param)
+    if request.param == "ASYNC_SQL":
+        asyncio.run(AsyncSessionManager.initialize_session(
+            AioSQLiteTestConnection(tmp_path / "catalog.db")
+        ))
+    yield request.param
+    if request.param == "ASYNC_SQL":
+        asyncio.run(AsyncSessionManager.close_session())
+
 
 @pytest.fixture
-def test_client() -> TestClient:
+def test_client(catalog_repository) -> TestClient:
     api = create_app()
+    if catalog_repository == "ASYNC_SQL":
+        api.dependency_overrides[get_product_repository] = async_product_repository
     client = TestClient(api)
     return client
 
@@ -182,19 +154,5 @@ def create_test_product(test_client, fake_product):
         # Create product through API
         response = test_client.post("/products/", json=product_data)
         
-        # If creation successful, convert to ProductSchema and add to mock database
-        if response.status_code == 201:
-            schema = ProductSchema(
-                product_id=product_data["product_id"],
-                user_id=product_data["user_id"],
-                name=product_data["name"],
-                description=product_data["description"],
-                price=Decimal(product_data["price"]),
-                location=product_data["location"],
-                status=product_data["status"],
-                is_available=product_data["is_available"]
-            )
-            SessionManager._session.products.append(schema)
-            
         return response, product_data
     return _create_product
@@ -2,6 +2,8 @@ from http import HTTPStatus
 
 from fastapi.testclient import TestClient
 
+from factories.repositories import catalog_metrics, readiness_probe
+
 
 def test__returns_ok_status__when_api_is_working_correctly(api_client: TestClient):
     response = api_client.get("/health_check/")
@@ -9,3 +11,38 @@ def test__returns_ok_status__when_api_is_working_correctly(api_client: TestClien
     response_content = response.json()
     assert response.status_code == HTTPStatus.OK
     assert response_content["status"] == "OK"
+
+
+def test__liveness_does_not_touch_dependencies(api_client: TestClient):
+    response = api_client.get("/health_check/live")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"status": "OK"}
+
+
+def test__readiness_reports_database_and_pool(api_client: TestClient):
+    readiness_probe().clear()
+
+    response = api_client.get("/health_check/ready")
+
+    response_content = response.json()
+    assert response.status_code == HTTPStatus.OK
+    assert response_content["status"] == "OK"
+    assert response_content["database_ok"] is True
+    assert response_content["reasons"] == []
+
+
+def test__readiness_sheds_traffic_when_requests_fail(api_client: TestClient):
+    readiness_probe().clear()
+    window = catalog_metrics().recent_requests
+    for _ in range(50):
+        window.record(error=True)
+
+    try:
+        response = api_client.get("/health_check/ready")
+    finally:
+        window.clear()
+        readiness_probe().clear()
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.json()["status"] == "ERROR"
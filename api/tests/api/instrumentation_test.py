@@ -0,0 +1,101 @@
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from api.src.instrumentation import instrument_sql
+from api.src.instrumentation.metrics import RequestMetrics, _current_metrics
+
+test_product = {
+    "product_id": "1234",
+    "user_id": "IVLM",
+    "name": "Test Product",
+    "description": "Test Description",
+    "price": "100.00",
+    "location": "Test Location",
+    "status": "New",
+    "is_available": True,
+}
+
+
+def server_timing(response) -> dict:
+    entries = {}
+    for entry in response.headers["server-timing"].split(","):
+        name, *params = [part.strip() for part in entry.split(";")]
+        entries[name] = dict(param.split("=", 1) for param in params)
+    return entries
+
+
+def test_responses_carry_server_timing(test_client: TestClient):
+    test_client.post("/products/", json=test_product)
+
+    timing = server_timing(test_client.get("/products/1234"))
+
+    assert set(timing) == {"sql", "serialize", "app", "total"}
+    assert timing["sql"]["desc"] == '"1 queries"'
+    assert float(timing["total"]["dur"]) >= float(timing["sql"]["dur"])
+
+
+def test_repeated_statements_are_flagged_as_n_plus_one():
+    metrics = RequestMetrics()
+    for _ in range(2):
+        metrics.record_query("SELECT * FROM products WHERE product_id = ?", 0.001)
+    metrics.record_query("SELECT count(*) FROM products", 0.001)
+
+    assert metrics.repeated_queries(threshold=2) == {
+        "SELECT * FROM products WHERE product_id = ?": 2
+    }
+
+
+def test_update_does_not_read_before_writing(test_client: TestClient, caplog):
+    test_client.post("/products/", json=test_product)
+
+    with caplog.at_level(logging.INFO, logger="catalog.requests"):
+        test_client.put("/products/1234", json={**test_product, "name": "Renamed"})
+
+    record = json.loads(caplog.records[-1].getMessage())
+    assert caplog.records[-1].levelno == logging.INFO
+    assert record["method"] == "PUT"
+    # The UPDATE ... RETURNING and the change feed entry.
+    assert record["sql_count"] == 2
+    assert "repeated_queries" not in record
+
+
+def test_metrics_endpoint_exposes_route_repository_and_pool_series(test_client: TestClient):
+    test_client.post("/products/", json=test_product)
+    test_client.get("/products/1234")
+
+    response = test_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert (
+        'http_request_duration_seconds_count{route="/products/{product_id}",method="GET",'
+        'status="200"}'
+    ) in text
+    assert 'product_repository_duration_seconds_count{method="create"}' in text
+    assert 'db_pool_checked_out{engine="sync"}' in text
+    assert "product_cache_hit_ratio" in text
+
+
+def test_failed_statements_leave_no_timing_state_on_the_connection(tmp_path):
+    instrument_sql()
+    engine = create_engine(f"sqlite:///{tmp_path / 'timing.db'}")
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        with engine.connect() as connection:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    connection.execute(text("SELECT * FROM missing_table"))
+            connection.execute(text("SELECT 1"))
+            assert not connection.info.get("query_started")
+    finally:
+        _current_metrics.reset(token)
+        engine.dispose()
+
+    assert metrics.sql_count == 1
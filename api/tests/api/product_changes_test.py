@@ -0,0 +1,32 @@
+from fastapi.testclient import TestClient
+
+
+def create_product(test_client: TestClient, product_id: str, status: str, is_available: bool):
+    test_client.post("/products/", json={
+        "product_id": product_id,
+        "user_id": "user-1",
+        "name": "Lamp",
+        "description": "Desk lamp",
+        "price": "10.00",
+        "location": "Quito",
+        "status": status,
+        "is_available": is_available,
+    })
+
+
+def test_list_product_changes_pages_with_since(test_client: TestClient):
+    create_product(test_client, "1", "New", True)
+    create_product(test_client, "2", "New", True)
+    test_client.delete("/products/1")
+
+    first = test_client.get("/products/changes", params={"limit": 2}).json()
+    assert [(c["product_id"], c["operation"]) for c in first["changes"]] == [
+        ("1", "created"), ("2", "created")
+    ]
+    rest = test_client.get("/products/changes", params={"since": first["next_since"]}).json()
+    assert [(c["product_id"], c["operation"]) for c in rest["changes"]] == [("1", "deleted")]
+
+    empty = test_client.get(
+        "/products/changes", params={"since": rest["next_since"], "wait": 0.1}
+    ).json()
+    assert empty == {"changes": [], "next_since": rest["next_since"]}
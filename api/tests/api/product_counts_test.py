@@ -0,0 +1,30 @@
+from fastapi.testclient import TestClient
+
+
+def create_product(test_client: TestClient, product_id: str, status: str, is_available: bool):
+    test_client.post("/products/", json={
+        "product_id": product_id,
+        "user_id": "user-1",
+        "name": "Lamp",
+        "description": "Desk lamp",
+        "price": "10.00",
+        "location": "Quito",
+        "status": status,
+        "is_available": is_available,
+    })
+
+
+def test_get_product_counts_follows_writes(test_client: TestClient):
+    create_product(test_client, "1", "New", True)
+    create_product(test_client, "2", "New", False)
+    create_product(test_client, "3", "For parts", True)
+
+    counts = test_client.get("/products/counts").json()
+    assert (counts["count"], counts["available"]) == (3, 2)
+    assert counts["by_status"]["New"] == {"count": 2, "available": 1, "availability_ratio": 0.5}
+    assert counts["by_status"]["For parts"]["count"] == 1
+
+    test_client.delete("/products/2")
+    counts = test_client.get("/products/counts").json()
+    assert counts["count"] == 2
+    assert counts["by_status"]["New"]["availability_ratio"] == 1.0
@@ -0,0 +1,64 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from adapters.src.events import InProcessProductEventBus
+from api.src.routes.product_event_routes import sse_stream
+from app.src.core import ProductEvent
+
+
+def create_product(test_client: TestClient, product_id: str):
+    test_client.post("/products/", json={
+        "product_id": product_id,
+        "user_id": "user-1",
+        "name": "Lamp",
+        "description": "Desk lamp",
+        "price": "10.00",
+        "location": "Quito",
+        "status": "New",
+        "is_available": True,
+    })
+
+
+def test_websocket_pushes_writes_to_subscribed_products(test_client: TestClient):
+    create_product(test_client, "1")
+
+    with test_client.websocket_connect("/products/events") as websocket:
+        websocket.send_json({"action": "subscribe", "product_ids": ["1", "2"]})
+        assert websocket.receive_json() == {"type": "subscribed", "product_ids": ["1", "2"]}
+
+        test_client.patch("/products/1", json={"price": "12.50"})
+        event = websocket.receive_json()
+        assert (event["type"], event["product_id"], event["operation"]) == ("event", "1", "updated")
+        assert event["product"]["price"].startswith("12.5")
+
+        websocket.send_json({"action": "unsubscribe", "product_ids": ["1"]})
+        assert websocket.receive_json() == {"type": "unsubscribed", "product_ids": ["2"]}
+        test_client.delete("/products/1")
+        create_product(test_client, "2")
+        event = websocket.receive_json()
+        assert (event["product_id"], event["operation"]) == ("2", "created")
+
+
+def test_websocket_rejects_malformed_commands(test_client: TestClient):
+    with test_client.websocket_connect("/products/events") as websocket:
+        websocket.send_json({"action": "watch"})
+        assert websocket.receive_json()["type"] == "error"
+
+
+def test_sse_stream_frames_events_and_keepalives():
+    bus = InProcessProductEventBus()
+
+    async def scenario():
+        stream = sse_stream(bus.subscribe(["1"]), keepalive_seconds=0.01)
+        assert await stream.__anext__() == ": keepalive\n\n"
+        bus.publish(ProductEvent("1", "deleted"))
+        message = await stream.__anext__()
+        await stream.aclose()
+        return message
+
+    message = asyncio.run(scenario())
+    assert message == (
+        'event: deleted\ndata: {"product_id":"1","operation":"deleted","product":null}\n\n'
+    )
+    assert bus.subscriber_count == 0
@@ -1,7 +1,12 @@
+import csv
+import io
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from app.src.core import ProductStatuses
 from fastapi import status
+from api.src.dtos import ListProductResponseDto
 from decimal import Decimal
 
 # Test data
@@ -20,7 +25,7 @@ def test_get_products_empty_list(test_client: TestClient):
     """Test getting products when the database is empty"""
     response = test_client.get("/products/")
     assert response.status_code == 200
-    assert response.json() == {"products": []}
+    assert response.json() == {"products": [], "next_cursor": None}
 
 def test_get_products_with_data(test_client: TestClient, create_test_product):
     """Test getting products when there is data in the database"""
@@ -186,3 +191,274 @@ def test_create_product_missing_required_field(test_client):
         error["loc"] == ["body", "user_id"]
         for error in error_detail
     )
+
+
+def test_get_products_paginates_with_cursor(test_client: TestClient):
+    """Test walking the product list page by page with the returned cursor"""
+    for product_id in ["1001", "1002", "1003"]:
+        response = test_client.post("/products/", json={**test_product, "product_id": product_id})
+        assert response.status_code == status.HTTP_201_CREATED
+
+    first_page = test_client.get("/products/?limit=2").json()
+    second_page = test_client.get(f"/products/?limit=2&cursor={first_page['next_cursor']}").json()
+
+    assert [p["product_id"] for p in first_page["products"]] == ["1001", "1002"]
+    assert [p["product_id"] for p in second_page["products"]] == ["1003"]
+    assert second_page["next_cursor"] is None
+
+
+def test_get_products_invalid_cursor(test_client: TestClient):
+    """Test that a tampered cursor is rejected"""
+    response = test_client.get("/products/?cursor=not-a-cursor")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "json", "csv"])
+def test_export_products_streams_every_product(test_client: TestClient, export_format):
+    """Test exporting the whole catalog in each supported format"""
+    product_ids = [str(1000 + index) for index in range(3)]
+    for product_id in product_ids:
+        test_client.post("/products/", json={**test_product, "product_id": product_id})
+
+    response = test_client.get(f"/products/export?format={export_format}&batch_size=2")
+
+    assert response.status_code == status.HTTP_200_OK
+    if export_format == "ndjson":
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    elif export_format == "json":
+        rows = response.json()
+    else:
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["product_id"] for row in rows] == product_ids
+    listed = test_client.get("/products/").json()["products"]
+    if export_format == "csv":
+        listed = [{key: str(value) for key, value in row.items()} for row in listed]
+    assert rows == listed
+
+
+def test_bulk_create_reports_per_item_results(test_client: TestClient):
+    """Test bulk creation skips existing and repeated product ids"""
+    test_client.post("/products/", json={**test_product, "product_id": "1001"})
+    batch = [
+        {**test_product, "product_id": "1001"},
+        {**test_product, "product_id": "1002"},
+        {**test_product, "product_id": "1002"},
+    ]
+
+    response = test_client.post("/products/bulk", json=batch)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["results"] == [
+        {"product_id": "1001", "status": "already_exists"},
+        {"product_id": "1002", "status": "created"},
+        {"product_id": "1002", "status": "duplicate"},
+    ]
+
+
+def test_bulk_upsert_overwrites_existing_products(test_client: TestClient):
+    """Test bulk upsert updates existing products and inserts new ones"""
+    test_client.post("/products/", json={**test_product, "product_id": "1001"})
+    batch = [
+        {**test_product, "product_id": "1001", "name": "Renamed"},
+        {**test_product, "product_id": "1002"},
+    ]
+
+    response = test_client.post("/products/bulk?upsert=true", json=batch)
+
+    assert [r["status"] for r in response.json()["results"]] == ["updated", "created"]
+    assert test_client.get("/products/1001").json()["name"] == "Renamed"
+
+
+def test_get_product_by_id_honours_if_none_match(test_client: TestClient):
+    """Test a product read returns 304 while its ETag is current"""
+    test_client.post("/products/", json=test_product)
+    first = test_client.get("/products/1234")
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    response = test_client.get("/products/1234", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    test_client.put("/products/1234", json={**test_product, "name": "Renamed"})
+    response = test_client.get("/products/1234", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+def test_get_products_etag_changes_with_the_collection(test_client: TestClient):
+    """Test the list ETag follows creates and deletes"""
+    test_client.post("/products/", json=test_product)
+    etag = test_client.get("/products/").headers["etag"]
+
+    response = test_client.get("/products/", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert test_client.get("/products/?limit=1", headers={"If-None-Match": etag}).status_code == 200
+
+    test_client.delete("/products/1234")
+    response = test_client.get("/products/", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["products"] == []
+
+
+def test_get_products_is_not_validated_by_date_alone(test_client: TestClient):
+    """Test a delete is seen by a client sending only If-Modified-Since"""
+    test_client.post("/products/", json=test_product)
+    test_client.post("/products/", json={**test_product, "product_id": "1235"})
+    assert "last-modified" not in test_client.get("/products/").headers
+
+    test_client.delete("/products/1235")
+    response = test_client.get(
+        "/products/", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [p["product_id"] for p in response.json()["products"]] == ["1234"]
+
+
+def test_get_products_fast_path_matches_response_model(test_client: TestClient):
+    """Test the directly rendered list still matches ListProductResponseDto"""
+    test_client.post("/products/", json=test_product)
+
+    body = test_client.get("/products/").json()
+
+    assert ListProductResponseDto.model_validate(body).model_dump(mode="json") == body
+
+
+def test_search_products_returns_ranked_pages(test_client: TestClient):
+    for product_id, name in [("1", "Desk lamp"), ("2", "Lamp shade"), ("3", "Chair")]:
+        test_client.post("/products/", json={
+            "product_id": product_id,
+            "user_id": "user-1",
+            "name": name,
+            "description": "Used once",
+            "price": "10.00",
+            "location": "Quito",
+            "status": "New",
+            "is_available": True,
+        })
+
+    first = test_client.get("/products/search", params={"q": "lamp", "limit": 1}).json()
+    second = test_client.get(
+        "/products/search", params={"q": "lamp", "limit": 1, "cursor": first["next_cursor"]}
+    ).json()
+
+    found = [product["product_id"] for product in first["products"] + second["products"]]
+    assert sorted(found) == ["1", "2"]
+    assert second["next_cursor"] is None
+    chairs = test_client.get("/products/search", params={"q": "chair"}).json()["products"]
+    assert [product["product_id"] for product in chairs] == ["3"]
+    bad_cursor = test_client.get("/products/search", params={"q": "x", "cursor": "bad"})
+    assert bad_cursor.status_code == 422
+
+
+def test_get_products_applies_filters_and_sort(test_client: TestClient):
+    for product_id, price, product_status in [
+        ("1", "30.00", "New"), ("2", "10.00", "Used"), ("3", "20.00", "For parts")
+    ]:
+        test_client.post("/products/", json={
+            "product_id": product_id,
+            "user_id": "user-1",
+            "name": "Lamp",
+            "description": "Desk lamp",
+            "price": price,
+            "location": "Quito",
+            "status": product_status,
+            "is_available": True,
+        })
+
+    params = {"status": "used,for parts", "sort": "-price", "limit": 1}
+    first = test_client.get("/products/", params=params).json()
+    second = test_client.get(
+        "/products/", params={**params, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [p["product_id"] for p in first["products"] + second["products"]] == ["3", "2"]
+    assert second["next_cursor"] is None
+    assert test_client.get("/products/", params={"price_min": "25"}).json()["products"][0][
+        "product_id"
+    ] == "1"
+    assert test_client.get("/products/", params={"status": "sold"}).status_code == 422
+    assert test_client.get(
+        "/products/", params={"price_min": "5", "price_max": "1"}
+    ).status_code == 422
+
+
+def test_batch_get_products_keeps_request_order(test_client: TestClient):
+    for product_id in ["1", "2"]:
+        test_client.post("/products/", json={**test_product, "product_id": product_id})
+
+    response = test_client.post("/products/batch-get", json={"product_ids": ["2", "404", "1", "2"]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [p and p["product_id"] for p in body["products"]] == ["2", None, "1", "2"]
+    assert body["missing"] == ["404"]
+    assert test_client.post("/products/batch-get", json={"product_ids": []}).status_code == 422
+
+
+def test_update_and_delete_missing_product_return_404(test_client: TestClient):
+    response = test_client.put("/products/404", json={**test_product, "product_id": "404"})
+    assert response.status_code == 404
+
+    assert test_client.delete("/products/404").status_code == 404
+
+
+def test_delete_product_removes_it(test_client: TestClient):
+    test_client.post("/products/", json=test_product)
+
+    response = test_client.delete(f"/products/{test_product['product_id']}")
+
+    assert response.status_code == 200
+    assert test_client.delete(f"/products/{test_product['product_id']}").status_code == 404
+    assert test_client.post(
+        "/products/batch-get", json={"product_ids": [test_product["product_id"]]}
+    ).json()["missing"] == [test_product["product_id"]]
+
+
+def test_patch_product_changes_only_the_given_fields(test_client: TestClient):
+    test_client.post("/products/", json=test_product)
+
+    response = test_client.patch("/products/1234", json={"price": "80.00", "status": "used"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (Decimal(body["price"]), body["status"]) == (Decimal("80.00"), "Used")
+    assert body["description"] == test_product["description"]
+    assert test_client.patch("/products/404", json={"price": "1"}).status_code == 404
+    assert test_client.patch("/products/1234", json={"name": None}).status_code == 422
+
+
+def test_bulk_patch_products_reports_missing_ids(test_client: TestClient):
+    for product_id in ["1", "2"]:
+        test_client.post("/products/", json={**test_product, "product_id": product_id})
+
+    response = test_client.patch("/products/bulk", json={
+        "product_ids": ["2", "404", "1"], "fields": {"is_available": False}
+    })
+
+    assert response.json() == {"updated": ["2", "1"], "missing": ["404"]}
+    products = test_client.post("/products/batch-get", json={"product_ids": ["1", "2"]}).json()
+    assert [product["is_available"] for product in products["products"]] == [False, False]
+
+
+def test_writes_with_a_stale_if_match_are_rejected(test_client: TestClient):
+    test_client.post("/products/", json=test_product)
+    url = f"/products/{test_product['product_id']}"
+    etag = test_client.get(url).headers["etag"]
+
+    updated = test_client.put(url, json={**test_product, "name": "Renamed"}, headers={
+        "If-Match": etag
+    })
+    assert updated.status_code == 200
+    assert updated.headers["etag"] != etag
+
+    stale = {"If-Match": etag}
+    assert test_client.put(url, json=test_product, headers=stale).status_code == 409
+    assert test_client.patch(url, json={"price": "1"}, headers=stale).status_code == 409
+    assert test_client.delete(url, headers=stale).status_code == 409
+    assert test_client.patch(url, json={}, headers={"If-Match": "W/\"v1\""}).status_code == 400
+
+    current = {"If-Match": updated.headers["etag"]}
+    patched = test_client.patch(url, json={"price": "1"}, headers=current)
+    assert patched.status_code == 200
+    assert test_client.delete(url, headers={"If-Match": patched.headers["etag"]}).status_code == 200
@@ -0,0 +1,31 @@
+from fastapi.testclient import TestClient
+
+
+def create_product(test_client: TestClient, product_id: str, price: str, status: str) -> None:
+    test_client.post("/products/", json={
+        "product_id": product_id,
+        "user_id": "user-1",
+        "name": "Lamp",
+        "description": "Desk lamp",
+        "price": price,
+        "location": "Quito",
+        "status": status,
+        "is_available": True,
+    })
+
+
+def test_get_product_stats_follows_writes(test_client: TestClient):
+    create_product(test_client, "1", "10.00", "New")
+    create_product(test_client, "2", "30.00", "For parts")
+
+    stats = test_client.get("/products/stats").json()
+    assert stats["count"] == 2
+    assert stats["availability_ratio"] == 1.0
+    assert stats["by_status"]["For parts"]["count"] == 1
+    assert stats["price"]["avg"] == "20.00"
+
+    create_product(test_client, "3", "50.00", "New")
+    stats = test_client.get("/products/stats", params={"status": "new"}).json()
+    assert stats["count"] == 2
+    assert list(stats["by_status"]) == ["New"]
+    assert stats["price"]["max"] == "50.00"
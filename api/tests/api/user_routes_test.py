@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+
+
+def create_product(test_client: TestClient, product_id: str, user_id: str, status: str) -> None:
+    test_client.post("/products/", json={
+        "product_id": product_id,
+        "user_id": user_id,
+        "name": "Lamp",
+        "description": "Desk lamp",
+        "price": "10.00",
+        "location": "Quito",
+        "status": status,
+        "is_available": True,
+    })
+
+
+def test_get_user_products_pages_with_counts(test_client: TestClient):
+    create_product(test_client, "1", "seller-1", "New")
+    create_product(test_client, "2", "seller-2", "New")
+    create_product(test_client, "3", "seller-1", "For parts")
+    create_product(test_client, "4", "seller-1", "New")
+
+    first = test_client.get("/users/seller-1/products", params={"limit": 2}).json()
+    second = test_client.get(
+        "/users/seller-1/products", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [p["product_id"] for p in first["products"] + second["products"]] == ["1", "3", "4"]
+    assert second["next_cursor"] is None
+    assert first["total"] == 3
+    assert first["counts_by_status"] == {"New": 2, "Used": 0, "For parts": 1}
+
+
+def test_get_user_products_for_unknown_user(test_client: TestClient):
+    response = test_client.get("/users/nobody/products")
+
+    assert response.status_code == 200
+    assert response.json()["products"] == []
+    assert response.json()["total"] == 0
@@ -1,3 +1,14 @@
-from .core import Product
+from .core import (
+    CollectionVersion,
+    Product,
+    ProductChange,
+    ProductEvent,
+    ProductFilter,
+    ProductSearchHit,
+    ProductSortOrder,
+    ProductStats,
+    StatusStats,
+)
 from .exceptions import ProductRepositoryException
-from .repositories import ProductRepository
+from .events import ProductEventPublisher
+from .repositories import AsyncProductRepository, ProductRepository
@@ -1,2 +1,12 @@
-from .models import Product
-from .enums import ProductStatuses
+from .models import (
+    CollectionVersion,
+    Product,
+    ProductChange,
+    ProductChangeOperation,
+    ProductEvent,
+    ProductFilter,
+    ProductSearchHit,
+    ProductStats,
+    StatusStats,
+)
+from .enums import ProductSortOrder, ProductStatuses
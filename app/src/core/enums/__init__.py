@@ -1 +1,2 @@
+from ._product_sort_order import ProductSortOrder
 from ._product_statuses import ProductStatuses
@@ -0,0 +1,21 @@
+from enum import Enum
+
+
+class ProductSortOrder(str, Enum):
+    """Sort orders for product listings; a leading "-" sorts descending.
+    Ties are always broken by product_id, in the same direction."""
+
+    PRODUCT_ID = "product_id"
+    PRODUCT_ID_DESC = "-product_id"
+    PRICE = "price"
+    PRICE_DESC = "-price"
+    UPDATED_AT = "updated_at"
+    UPDATED_AT_DESC = "-updated_at"
+
+    @property
+    def field(self) -> str:
+        return self.value.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
@@ -1,7 +1,36 @@
 from enum import Enum
+from typing import Tuple
 
 
 class ProductStatuses(Enum):
     NEW = "New"
     USED = "Used"
     FOR_PARTS = "For parts"
+
+    @classmethod
+    def parse(cls, value: str) -> "ProductStatuses":
+        """Case-insensitive lookup by value; raises ValueError when unknown."""
+        try:
+            return _STATUSES_BY_LOWER_VALUE[value.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Not a valid status value. Must be one of: {', '.join(s.value for s in cls)}"
+            )
+
+    @classmethod
+    def canonical(cls, stored: str) -> str:
+        """The enum value a stored status stands for, or the stored text itself
+        when it matches none."""
+        try:
+            return cls.parse(stored).value
+        except (AttributeError, ValueError):
+            return str(stored)
+
+    @property
+    def stored_values(self) -> Tuple[str, ...]:
+        """Spellings found in the products table: the API title-cases statuses
+        on the way in ("For Parts"), other writers store the value as is."""
+        return tuple(dict.fromkeys((self.value, self.value.title())))
+
+
+_STATUSES_BY_LOWER_VALUE = {status.value.lower(): status for status in ProductStatuses}
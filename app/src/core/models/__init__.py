@@ -1 +1,7 @@
+from ._collection_version import CollectionVersion
 from ._product import Product
+from ._product_change import ProductChange, ProductChangeOperation
+from ._product_event import ProductEvent
+from ._product_filter import ProductFilter
+from ._product_search_hit import ProductSearchHit
+from ._product_stats import ProductStats, StatusStats
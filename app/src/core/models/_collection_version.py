@@ -0,0 +1,10 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class CollectionVersion(NamedTuple):
+    """Cheap fingerprint of a set of products: any create, update or delete
+    changes the row count or the latest `updated_at`."""
+
+    count: int
+    last_modified: Optional[datetime]
@@ -1,6 +1,7 @@
+from datetime import datetime
 from decimal import Decimal
 
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 
 from ..enums import ProductStatuses
@@ -15,3 +16,7 @@ class Product(NamedTuple):
     location: str
     status: ProductStatuses
     is_available: bool
+    # Set by the repository on every write; None until the product is stored.
+    updated_at: Optional[datetime] = None
+    # Incremented by every write; clients send it back to update optimistically.
+    version: Optional[int] = None
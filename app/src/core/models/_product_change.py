@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Literal, NamedTuple
+
+ProductChangeOperation = Literal["created", "updated", "deleted"]
+
+
+class ProductChange(NamedTuple):
+    """One entry of the product change feed. Sequences increase with every
+    write, so a consumer resumes from the last one it has seen."""
+
+    sequence: int
+    product_id: str
+    operation: ProductChangeOperation
+    changed_at: datetime
@@ -0,0 +1,13 @@
+from typing import NamedTuple, Optional
+
+from ._product import Product
+from ._product_change import ProductChangeOperation
+
+
+class ProductEvent(NamedTuple):
+    """A product write, as pushed to live subscribers. `product` is the
+    product as written, or None once it is deleted."""
+
+    product_id: str
+    operation: ProductChangeOperation
+    product: Optional[Product] = None
@@ -0,0 +1,17 @@
+from decimal import Decimal
+from typing import NamedTuple, Optional, Tuple
+
+from ..enums import ProductSortOrder
+
+
+class ProductFilter(NamedTuple):
+    """Which products to list and in what order. Fields left at their default
+    match every product; the others are combined with AND."""
+
+    statuses: Tuple[str, ...] = ()
+    is_available: Optional[bool] = None
+    price_min: Optional[Decimal] = None
+    price_max: Optional[Decimal] = None
+    user_id: Optional[str] = None
+    location_prefix: Optional[str] = None
+    sort: ProductSortOrder = ProductSortOrder.PRODUCT_ID
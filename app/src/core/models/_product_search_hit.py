@@ -0,0 +1,11 @@
+from typing import NamedTuple
+
+from ._product import Product
+
+
+class ProductSearchHit(NamedTuple):
+    """A full-text search match. Lower scores rank first, whatever the
+    database's own ranking function returns."""
+
+    product: Product
+    score: float
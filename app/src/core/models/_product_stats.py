@@ -0,0 +1,22 @@
+from decimal import Decimal
+from typing import Dict, NamedTuple, Optional
+
+
+class StatusStats(NamedTuple):
+    count: int
+    available: int
+
+
+class ProductStats(NamedTuple):
+    """Aggregates over a set of products. Price figures are rounded to the
+    cent, leave out products without a price and are None when no product
+    has one."""
+
+    count: int
+    available: int
+    by_status: Dict[str, StatusStats]
+    price_min: Optional[Decimal]
+    price_avg: Optional[Decimal]
+    price_max: Optional[Decimal]
+    # Keyed "p50", "p90", "p99", interpolated like PostgreSQL's percentile_cont.
+    price_percentiles: Dict[str, Decimal]
@@ -0,0 +1 @@
+from .product_event_publisher import ProductEventPublisher
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from ..core.models import ProductEvent
+
+
+class ProductEventPublisher(ABC):
+    @abstractmethod
+    def publish(self, event: ProductEvent) -> None:
+        """Hands the event to the subscribers of its product without waiting
+        for them to receive it. Called from the event loop by async use cases
+        and from threadpool workers by sync ones, so it must be thread-safe."""
+        raise NotImplementedError
@@ -2,9 +2,11 @@ from .repository import ProductRepositoryException
 from .business import (
     AlreadyExistsException,
     BusinessException,
+    ConflictException,
     NoneException,
     NotFoundException,
     ProductAlreadyExistsException,
+    ProductConflictException,
     ProductNoneException,
     ProductNotFoundException,
     ProductBusinessException,
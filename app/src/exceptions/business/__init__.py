@@ -1,6 +1,7 @@
 from .base import (
     AlreadyExistsException,
     BusinessException,
+    ConflictException,
     NoneException,
     NotFoundException,
 )
@@ -8,6 +9,7 @@ from .base import (
 from .product import (
     ProductAlreadyExistsException,
     ProductBusinessException,
+    ProductConflictException,
     ProductNoneException,
     ProductNotFoundException,
 )
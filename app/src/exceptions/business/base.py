@@ -18,3 +18,11 @@ class NoneException(BusinessException):
     def __init__(self, entity_type: str) -> None:
         message = f"The {entity_type} is None."
         super().__init__(message)
+
+
+class ConflictException(BusinessException):
+    def __init__(self, entity_type: str, entity_id: str) -> None:
+        message = (
+            f"The {entity_type} with the id '{entity_id}' was changed since it was read."
+        )
+        super().__init__(message)
@@ -1,6 +1,7 @@
 from .base import (
     AlreadyExistsException,
     BusinessException,
+    ConflictException,
     NoneException,
     NotFoundException,
 )
@@ -23,3 +24,8 @@ class ProductAlreadyExistsException(AlreadyExistsException):
 class ProductNoneException(NoneException):
     def __init__(self) -> None:
         super().__init__(entity_type="Product")
+
+
+class ProductConflictException(ConflictException):
+    def __init__(self, product_id: str) -> None:
+        super().__init__(entity_type="Product", entity_id=product_id)
@@ -1 +1,2 @@
+from .async_product_repository import AsyncProductRepository
 from .product_repository import ProductRepository
@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional
+
+from ..core.models import CollectionVersion, Product
+
+
+class AsyncProductRepository(ABC):
+    @abstractmethod
+    async def create(self, product: Product) -> Product:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(self) -> List[Product]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        """Returns up to `limit` products ordered by product_id, starting right
+        after the `after` product_id (keyset pagination)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 1000) -> AsyncIterator[Product]:
+        """Yields every product through a server-side cursor, fetching
+        `batch_size` rows at a time, so memory stays flat for any table size."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        """Row count and latest `updated_at` of the products, optionally of one
+        status; one aggregate query used to answer conditional list requests."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, product_id: str) -> Optional[Product]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        """Deletes the product in one statement and returns it as it was, or
+        None when no product has that id or, given `expected_version`, when it
+        no longer has that version."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def filter(self, filter_by: str) -> List[Product]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        """Overwrites the product in one statement, bumping its version, and
+        returns it as stored; None when no product has its id or, given
+        `expected_version`, when it no longer has that version."""
+        raise NotImplementedError
@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from ..core.models import Product
+from ..core.models import (
+    CollectionVersion,
+    Product,
+    ProductChange,
+    ProductFilter,
+    ProductSearchHit,
+    ProductStats,
+    StatusStats,
+)
 
 
 class ProductRepository(ABC):
@@ -9,16 +17,118 @@ class ProductRepository(ABC):
     def create(self, product: Product) -> Product:
         raise NotImplementedError
 
+    @abstractmethod
+    def bulk_create(self, products: List[Product]) -> List[str]:
+        """Inserts the products whose product_id does not exist yet and returns
+        the product_ids that were inserted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_upsert(self, products: List[Product]) -> List[str]:
+        """Inserts new products and overwrites existing ones. Returns the
+        product_ids that were inserted; the others were updated."""
+        raise NotImplementedError
+
     @abstractmethod
     def list_all(self) -> List[Product]:
         raise NotImplementedError
 
+    @abstractmethod
+    def list_page(
+        self, after: Optional[str], limit: int, status: Optional[str] = None
+    ) -> List[Product]:
+        """Returns up to `limit` products ordered by product_id, starting right
+        after the `after` product_id (keyset pagination)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_by_user(self, user_id: str, after: Optional[str], limit: int) -> List[Product]:
+        """Keyset page of one user's products ordered by product_id, served
+        from the (user_id, product_id) index."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_by_user(self, user_id: str) -> Dict[str, int]:
+        """Number of the user's products per stored status."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_filtered(
+        self, product_filter: ProductFilter, limit: int, after: Optional[Tuple[Any, str]] = None
+    ) -> List[Product]:
+        """Returns up to `limit` products matching the filter in its sort order,
+        starting right after the `after` (sort value, product_id) keyset."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_by_status(self) -> Dict[str, StatusStats]:
+        """Product counts per stored status, with how many are available; read
+        from materialized counters where the database maintains them."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self, product_filter: ProductFilter = ProductFilter()) -> ProductStats:
+        """Counts and price aggregates of the products matching the filter,
+        computed by the database; the filter's sort order is ignored."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 1000) -> Iterator[Product]:
+        """Yields every product through a server-side cursor, fetching
+        `batch_size` rows at a time, so memory stays flat for any table size."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def collection_version(self, status: Optional[str] = None) -> CollectionVersion:
+        """Row count and latest `updated_at` of the products, optionally of one
+        status; one aggregate query used to answer conditional list requests."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def search(
+        self, query: str, limit: int, after: Optional[Tuple[float, str]] = None
+    ) -> List[ProductSearchHit]:
+        """Full-text search over product names and descriptions, best match
+        first. Pages are keyed on the (score, product_id) of the last hit."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_changes(self, since: int, limit: int) -> List[ProductChange]:
+        """Up to `limit` entries of the change feed after the `since` sequence,
+        oldest first. Every write appends to the feed in its own transaction."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, product_id: str) -> Optional[Product]:
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, product_id: str) -> Product:
+    def get_many(self, product_ids: List[str]) -> List[Optional[Product]]:
+        """The products of `product_ids` in the same order, None for every id
+        that does not exist; one query for the whole batch."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(
+        self, product_id: str, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        """Deletes the product in one statement and returns it as it was, or
+        None when no product has that id or, given `expected_version`, when it
+        no longer has that version."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def patch(
+        self, product_id: str, fields: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        """Sets only the given fields, in one UPDATE of those columns, and
+        returns the product as stored; None as for `update`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_patch(self, product_ids: List[str], fields: Dict[str, Any]) -> List[str]:
+        """Sets the same fields on every listed product in one statement and
+        returns the product_ids that exist, in request order."""
         raise NotImplementedError
 
     @abstractmethod
@@ -27,5 +137,10 @@ class ProductRepository(ABC):
         # raise NotImplementedError
 
     @abstractmethod
-    def update(self, product_id: str,  product: Product) -> Product:
+    def update(
+        self, product: Product, expected_version: Optional[int] = None
+    ) -> Optional[Product]:
+        """Overwrites the product in one statement, bumping its version, and
+        returns it as stored; None when no product has its id or, given
+        `expected_version`, when it no longer has that version."""
         raise NotImplementedError
\ No newline at end of file
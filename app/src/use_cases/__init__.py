@@ -2,6 +2,7 @@ from .product import (
     
     ListProductResponse,
     ListProducts,
+    ListProductsRequest,
     FindProductById,
     FindProductByIdRequest,
     FindProductByIdResponse,
@@ -16,6 +17,48 @@ from .product import (
     UpdateProduct,
     FilterProductByStatus,
     FilterProductsByStatusRequest,
-    FilterProductsByStatusResponse
+    FilterProductsByStatusResponse,
+    AsyncListProducts,
+    AsyncFindProductById,
+    AsyncCreateProduct,
+    AsyncDeleteProduct,
+    AsyncUpdateProduct,
+    AsyncFilterProductByStatus,
+    ExportProductsRequest,
+    ExportProducts,
+    AsyncExportProducts,
+    BulkCreateProductsRequest,
+    BulkCreateProductsResponse,
+    BulkProductResult,
+    BulkCreateProducts,
+    GetCollectionVersionRequest,
+    GetCollectionVersionResponse,
+    GetCollectionVersion,
+    AsyncGetCollectionVersion,
+    SearchProductsRequest,
+    SearchProductsResponse,
+    SearchProducts,
+    FilterProductsRequest,
+    FilterProductsResponse,
+    FilterProducts,
+    ListUserProductsRequest,
+    ListUserProductsResponse,
+    ListUserProducts,
+    GetProductStatsRequest,
+    GetProductStatsResponse,
+    GetProductStats,
+    CountProductsByStatusResponse,
+    CountProductsByStatus,
+    GetProductsByIdsRequest,
+    GetProductsByIdsResponse,
+    GetProductsByIds,
+    PatchProductRequest,
+    PatchProduct,
+    BulkPatchProductsRequest,
+    BulkPatchProductsResponse,
+    BulkPatchProducts,
+    ListProductChangesRequest,
+    ListProductChangesResponse,
+    ListProductChanges,
 
 )
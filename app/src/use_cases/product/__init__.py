@@ -1,6 +1,18 @@
-from .list_all import ListProductResponse, ListProducts
-from .get_by_id import FindProductById, FindProductByIdRequest, FindProductByIdResponse
-from .create import CreateProduct, CreateProductRequest, CreateProductResponse
-from .delete import DeleteProductRequest, DeleteProductResponse, DeleteProduct
-from .update import UpdateProductRequest, UpdateProductResponse, UpdateProduct
-from .get_by_status import FilterProductByStatus, FilterProductsByStatusRequest, FilterProductsByStatusResponse 
\ No newline at end of file
+from .list_all import ListProductsRequest, ListProductResponse, ListProducts, AsyncListProducts
+from .get_by_id import FindProductById, FindProductByIdRequest, FindProductByIdResponse, AsyncFindProductById
+from .create import CreateProduct, CreateProductRequest, CreateProductResponse, AsyncCreateProduct
+from .delete import DeleteProductRequest, DeleteProductResponse, DeleteProduct, AsyncDeleteProduct
+from .update import UpdateProductRequest, UpdateProductResponse, UpdateProduct, AsyncUpdateProduct
+from .get_by_status import FilterProductByStatus, FilterProductsByStatusRequest, FilterProductsByStatusResponse, AsyncFilterProductByStatus
+from .export import ExportProductsRequest, ExportProducts, AsyncExportProducts
+from .bulk_create import BulkCreateProductsRequest, BulkCreateProductsResponse, BulkProductResult, BulkCreateProducts
+from .collection_version import GetCollectionVersionRequest, GetCollectionVersionResponse, GetCollectionVersion, AsyncGetCollectionVersion
+from .search import SearchProductsRequest, SearchProductsResponse, SearchProducts
+from .list_filtered import FilterProductsRequest, FilterProductsResponse, FilterProducts
+from .list_by_user import ListUserProductsRequest, ListUserProductsResponse, ListUserProducts
+from .stats import GetProductStatsRequest, GetProductStatsResponse, GetProductStats
+from .count_by_status import CountProductsByStatusResponse, CountProductsByStatus
+from .get_many import GetProductsByIdsRequest, GetProductsByIdsResponse, GetProductsByIds
+from .patch import PatchProductRequest, PatchProduct
+from .list_changes import ListProductChangesRequest, ListProductChangesResponse, ListProductChanges
+from .bulk_patch import BulkPatchProductsRequest, BulkPatchProductsResponse, BulkPatchProducts
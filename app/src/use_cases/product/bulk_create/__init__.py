@@ -0,0 +1,3 @@
+from .request import BulkCreateProductsRequest
+from .response import BulkCreateProductsResponse, BulkProductResult
+from .use_case import MAX_BULK_SIZE, BulkCreateProducts
@@ -0,0 +1,8 @@
+from typing import List, NamedTuple
+
+from ..create import CreateProductRequest
+
+
+class BulkCreateProductsRequest(NamedTuple):
+    products: List[CreateProductRequest]
+    upsert: bool = False
@@ -0,0 +1,12 @@
+from typing import List, Literal, NamedTuple
+
+BulkProductStatus = Literal["created", "updated", "already_exists", "duplicate"]
+
+
+class BulkProductResult(NamedTuple):
+    product_id: str
+    status: BulkProductStatus
+
+
+class BulkCreateProductsResponse(NamedTuple):
+    results: List[BulkProductResult]
@@ -0,0 +1,44 @@
+from typing import List, Set
+
+from app.src.core import Product
+from app.src.repositories import ProductRepository
+from app.src.exceptions import ProductBusinessException, ProductRepositoryException
+
+from .request import BulkCreateProductsRequest
+from .response import BulkCreateProductsResponse, BulkProductResult
+
+MAX_BULK_SIZE = 10000
+
+
+class BulkCreateProducts:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: BulkCreateProductsRequest) -> BulkCreateProductsResponse:
+        seen: Set[str] = set()
+        products: List[Product] = []
+        for item in request.products:
+            if item.product_id not in seen:
+                seen.add(item.product_id)
+                products.append(Product(**item._asdict()))
+
+        try:
+            if request.upsert:
+                inserted = set(self.product_repository.bulk_upsert(products))
+                existing_status = "updated"
+            else:
+                inserted = set(self.product_repository.bulk_create(products))
+                existing_status = "already_exists"
+        except ProductRepositoryException as e:
+            raise ProductBusinessException(str(e))
+
+        results: List[BulkProductResult] = []
+        reported: Set[str] = set()
+        for item in request.products:
+            if item.product_id in reported:
+                results.append(BulkProductResult(item.product_id, "duplicate"))
+                continue
+            reported.add(item.product_id)
+            status = "created" if item.product_id in inserted else existing_status
+            results.append(BulkProductResult(item.product_id, status))
+        return BulkCreateProductsResponse(results=results)
@@ -0,0 +1,3 @@
+from .request import BulkPatchProductsRequest
+from .response import BulkPatchProductsResponse
+from .use_case import MAX_BULK_PATCH_SIZE, BulkPatchProducts
@@ -0,0 +1,6 @@
+from typing import Any, Dict, List, NamedTuple
+
+
+class BulkPatchProductsRequest(NamedTuple):
+    product_ids: List[str]
+    fields: Dict[str, Any]
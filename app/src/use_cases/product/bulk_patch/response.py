@@ -0,0 +1,6 @@
+from typing import List, NamedTuple
+
+
+class BulkPatchProductsResponse(NamedTuple):
+    updated: List[str]
+    missing: List[str]
@@ -0,0 +1,29 @@
+from app.src.repositories import ProductRepository
+
+from ..patch.use_case import validate_fields
+from .request import BulkPatchProductsRequest
+from .response import BulkPatchProductsResponse
+
+MAX_BULK_PATCH_SIZE = 10000
+
+
+class BulkPatchProducts:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: BulkPatchProductsRequest) -> BulkPatchProductsResponse:
+        validate_fields(request.fields)
+        product_ids = list(dict.fromkeys(request.product_ids))
+        if request.fields:
+            updated = self.product_repository.bulk_patch(product_ids, request.fields)
+        else:
+            updated = [
+                product.product_id
+                for product in self.product_repository.get_many(product_ids)
+                if product is not None
+            ]
+        found = set(updated)
+        return BulkPatchProductsResponse(
+            updated=updated,
+            missing=[product_id for product_id in product_ids if product_id not in found],
+        )
@@ -0,0 +1,4 @@
+from .request import GetCollectionVersionRequest
+from .response import GetCollectionVersionResponse
+from .use_case import GetCollectionVersion
+from .async_use_case import AsyncGetCollectionVersion
@@ -0,0 +1,15 @@
+from app.src.repositories import AsyncProductRepository
+
+from .request import GetCollectionVersionRequest
+from .response import GetCollectionVersionResponse
+
+
+class AsyncGetCollectionVersion:
+    def __init__(self, product_repository: AsyncProductRepository) -> None:
+        self.product_repository = product_repository
+
+    async def __call__(
+        self, request: GetCollectionVersionRequest = GetCollectionVersionRequest()
+    ) -> GetCollectionVersionResponse:
+        version = await self.product_repository.collection_version(status=request.status)
+        return GetCollectionVersionResponse(**version._asdict())
@@ -0,0 +1,5 @@
+from typing import NamedTuple, Optional
+
+
+class GetCollectionVersionRequest(NamedTuple):
+    status: Optional[str] = None
@@ -0,0 +1,7 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class GetCollectionVersionResponse(NamedTuple):
+    count: int
+    last_modified: Optional[datetime]
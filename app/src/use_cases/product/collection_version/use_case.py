@@ -0,0 +1,15 @@
+from app.src.repositories import ProductRepository
+
+from .request import GetCollectionVersionRequest
+from .response import GetCollectionVersionResponse
+
+
+class GetCollectionVersion:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(
+        self, request: GetCollectionVersionRequest = GetCollectionVersionRequest()
+    ) -> GetCollectionVersionResponse:
+        version = self.product_repository.collection_version(status=request.status)
+        return GetCollectionVersionResponse(**version._asdict())
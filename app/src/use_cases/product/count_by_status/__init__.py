@@ -0,0 +1,2 @@
+from .response import CountProductsByStatusResponse
+from .use_case import CountProductsByStatus
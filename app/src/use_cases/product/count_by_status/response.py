@@ -0,0 +1,9 @@
+from typing import Dict, NamedTuple
+
+from app.src.core import StatusStats
+
+
+class CountProductsByStatusResponse(NamedTuple):
+    count: int
+    available: int
+    by_status: Dict[str, StatusStats]
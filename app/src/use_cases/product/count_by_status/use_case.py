@@ -0,0 +1,17 @@
+from app.src.repositories import ProductRepository
+
+from ..status_counts import fold_status_stats
+from .response import CountProductsByStatusResponse
+
+
+class CountProductsByStatus:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self) -> CountProductsByStatusResponse:
+        by_status = fold_status_stats(self.product_repository.count_by_status())
+        return CountProductsByStatusResponse(
+            count=sum(counts.count for counts in by_status.values()),
+            available=sum(counts.available for counts in by_status.values()),
+            by_status=by_status,
+        )
@@ -1,3 +1,4 @@
 from .request import CreateProductRequest
 from .response import CreateProductResponse
 from .use_case import CreateProduct
+from .async_use_case import AsyncCreateProduct
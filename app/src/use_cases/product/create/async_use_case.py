@@ -0,0 +1,42 @@
+from typing import Optional
+
+from app.src.core import Product
+from app.src.events import ProductEventPublisher
+from app.src.repositories import AsyncProductRepository
+from app.src.exceptions import (
+    ProductAlreadyExistsException,
+    ProductNoneException,
+    ProductRepositoryException,
+    ProductBusinessException,
+)
+
+from ..events import publish_write
+from .response import CreateProductResponse
+from .request import CreateProductRequest
+
+
+class AsyncCreateProduct:
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        event_publisher: Optional[ProductEventPublisher] = None,
+    ) -> None:
+        self.product_repository = product_repository
+        self.event_publisher = event_publisher
+
+    async def __call__(
+        self, request: CreateProductRequest
+    ) -> Optional[CreateProductResponse]:
+        product = Product(**request._asdict())
+        try:
+            product_existing = await self.product_repository.get_by_id(request.product_id)
+            if product_existing:
+                raise ProductAlreadyExistsException(product_id=request.product_id)
+            response: Optional[Product] = await self.product_repository.create(product)
+            if not response:
+                raise ProductNoneException()
+
+            publish_write(self.event_publisher, "created", response)
+            return CreateProductResponse(**response._asdict())
+        except ProductRepositoryException as e:
+            raise ProductBusinessException(str(e))
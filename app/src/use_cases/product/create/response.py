@@ -1,6 +1,7 @@
+from datetime import datetime
 from decimal import Decimal
 
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 from ....core import ProductStatuses
 
@@ -14,3 +15,5 @@ class CreateProductResponse(NamedTuple):
     location: str
     status: ProductStatuses
     is_available: bool
+    updated_at: Optional[datetime] = None
+    version: Optional[int] = None
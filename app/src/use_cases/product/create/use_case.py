@@ -1,6 +1,7 @@
 from typing import Optional
 
 from app.src.core import Product
+from app.src.events import ProductEventPublisher
 from app.src.repositories import ProductRepository
 from app.src.exceptions import (
     ProductAlreadyExistsException,
@@ -9,13 +10,19 @@ from app.src.exceptions import (
     ProductBusinessException,
 )
 
+from ..events import publish_write
 from .response import CreateProductResponse
 from .request import CreateProductRequest
 
 
 class CreateProduct:
-    def __init__(self, product_repository: ProductRepository) -> None:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        event_publisher: Optional[ProductEventPublisher] = None,
+    ) -> None:
         self.product_repository = product_repository
+        self.event_publisher = event_publisher
 
     def __call__(
         self, request: CreateProductRequest
@@ -29,6 +36,7 @@ class CreateProduct:
             if not response:
                 raise ProductNoneException()
 
+            publish_write(self.event_publisher, "created", response)
             return CreateProductResponse(**response._asdict())
         except ProductRepositoryException as e:
             raise ProductBusinessException(str(e))
@@ -1,3 +1,4 @@
 from .request import DeleteProductRequest
 from .response import DeleteProductResponse
-from .use_case import DeleteProduct
\ No newline at end of file
+from .use_case import DeleteProduct
+from .async_use_case import AsyncDeleteProduct
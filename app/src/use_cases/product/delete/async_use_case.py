@@ -0,0 +1,45 @@
+from typing import Optional
+
+from app.src.exceptions import (
+    ProductConflictException,
+    ProductNotFoundException,
+    ProductRepositoryException
+)
+from fastapi.exceptions import HTTPException
+from app.src.events import ProductEventPublisher
+from app.src.repositories import AsyncProductRepository
+
+from ..events import publish_write
+from ..versioning import async_verify_written
+from .request import DeleteProductRequest
+from .response import DeleteProductResponse
+
+
+class AsyncDeleteProduct:
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        event_publisher: Optional[ProductEventPublisher] = None,
+    ):
+        self.product_repository = product_repository
+        self.event_publisher = event_publisher
+
+    async def __call__(self, request: DeleteProductRequest) -> Optional[DeleteProductResponse]:
+        try:
+            deleted_product = await self.product_repository.delete(
+                request.product_id, expected_version=request.expected_version
+            )
+            deleted_product = await async_verify_written(
+                self.product_repository,
+                deleted_product,
+                request.product_id,
+                request.expected_version,
+            )
+            publish_write(self.event_publisher, "deleted", deleted_product)
+            return deleted_product
+        except ProductNotFoundException as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except ProductConflictException as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except ProductRepositoryException as e:
+            raise HTTPException(status_code=500, detail=str(e))
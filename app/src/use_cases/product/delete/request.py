@@ -1,5 +1,7 @@
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 
 class DeleteProductRequest(NamedTuple):
-    product_id: str
\ No newline at end of file
+    product_id: str
+    # From If-Match: only delete while the product still has this version.
+    expected_version: Optional[int] = None
@@ -1,36 +1,44 @@
 from typing import Optional
 
 from app.src.exceptions import (
+    ProductConflictException,
     ProductNotFoundException,
     ProductRepositoryException
 )
 from fastapi.exceptions import HTTPException
-from app.src.core.models import Product
+from app.src.events import ProductEventPublisher
 from app.src.repositories import ProductRepository
 
+from ..events import publish_write
+from ..versioning import verify_written
 from .request import DeleteProductRequest
 from .response import DeleteProductResponse
 
 
 class DeleteProduct:
-    def __init__(self, product_repository):
+    def __init__(
+        self, product_repository, event_publisher: Optional[ProductEventPublisher] = None
+    ):
         self.product_repository = product_repository
-
-    def __verify_product_exists(self, product: Product, request_entity_id: str) -> None:
-        if not product:
-            raise ProductNotFoundException(
-                f"Product with id {request_entity_id} not found"
-            )
+        self.event_publisher = event_publisher
 
     def __call__(self, request: DeleteProductRequest) -> Optional[DeleteProductResponse]:
         try:
-            existing_product = self.product_repository.get_by_id(request.product_id)
-            self.__verify_product_exists(
-                existing_product, request_entity_id=request.product_id
+            # One DELETE ... RETURNING; see UpdateProduct.
+            deleted_product = self.product_repository.delete(
+                request.product_id, expected_version=request.expected_version
+            )
+            deleted_product = verify_written(
+                self.product_repository,
+                deleted_product,
+                request.product_id,
+                request.expected_version,
             )
-            response = self.product_repository.delete(request.product_id)
-            return response
+            publish_write(self.event_publisher, "deleted", deleted_product)
+            return deleted_product
         except ProductNotFoundException as e:
             raise HTTPException(status_code=404, detail=str(e))
+        except ProductConflictException as e:
+            raise HTTPException(status_code=409, detail=str(e))
         except ProductRepositoryException as e:
             raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from app.src.core import Product, ProductChangeOperation, ProductEvent
+from app.src.events import ProductEventPublisher
+
+
+def publish_write(
+    event_publisher: Optional[ProductEventPublisher],
+    operation: ProductChangeOperation,
+    product: Product,
+) -> None:
+    """Tells live subscribers about a write that has been committed."""
+    if event_publisher is None:
+        return
+    written = None if operation == "deleted" else product
+    event_publisher.publish(ProductEvent(product.product_id, operation, written))
@@ -0,0 +1,3 @@
+from .request import ExportProductsRequest
+from .use_case import ExportProducts
+from .async_use_case import AsyncExportProducts
@@ -0,0 +1,14 @@
+from typing import AsyncIterator
+
+from app.src.core.models import Product
+from app.src.repositories import AsyncProductRepository
+
+from .request import ExportProductsRequest
+
+
+class AsyncExportProducts:
+    def __init__(self, product_repository: AsyncProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: ExportProductsRequest) -> AsyncIterator[Product]:
+        return self.product_repository.stream_all(batch_size=request.batch_size)
@@ -0,0 +1,5 @@
+from typing import NamedTuple
+
+
+class ExportProductsRequest(NamedTuple):
+    batch_size: int = 1000
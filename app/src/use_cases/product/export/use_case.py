@@ -0,0 +1,15 @@
+from typing import Iterator
+
+from app.src.core.models import Product
+from app.src.repositories import ProductRepository
+
+from .request import ExportProductsRequest
+
+
+class ExportProducts:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: ExportProductsRequest) -> Iterator[Product]:
+        # Lazy on purpose: rows are only fetched while the response is streamed.
+        return self.product_repository.stream_all(batch_size=request.batch_size)
@@ -1,3 +1,4 @@
 from .request import FindProductByIdRequest
 from .response import FindProductByIdResponse
 from .use_case import FindProductById
+from .async_use_case import AsyncFindProductById
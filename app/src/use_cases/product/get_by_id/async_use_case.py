@@ -0,0 +1,31 @@
+from typing import Optional
+
+from app.src.exceptions import ProductNotFoundException, ProductRepositoryException
+
+from app.src.core.models import Product
+from app.src.repositories import AsyncProductRepository
+
+from .request import FindProductByIdRequest
+from .response import FindProductByIdResponse
+
+
+class AsyncFindProductById:
+    def __init__(self, product_repository: AsyncProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __verify_product_exists(
+        self, product: Optional[Product], request_entity_id: str
+    ) -> None:
+        if product is None:
+            raise ProductNotFoundException(product_id=request_entity_id)
+
+    async def __call__(self, request: FindProductByIdRequest) -> FindProductByIdResponse:
+        try:
+            existing_product = await self.product_repository.get_by_id(request.product_id)
+            self.__verify_product_exists(
+                existing_product, request_entity_id=request.product_id
+            )
+            response = FindProductByIdResponse(**existing_product._asdict())
+            return response
+        except ProductRepositoryException as e:
+            raise e
@@ -1,3 +1,4 @@
 from .request import FilterProductsByStatusRequest
 from .response import FilterProductsByStatusResponse
-from .use_case import FilterProductByStatus
\ No newline at end of file
+from .use_case import FilterProductByStatus
+from .async_use_case import AsyncFilterProductByStatus
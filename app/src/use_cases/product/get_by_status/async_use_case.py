@@ -0,0 +1,28 @@
+from app.src.exceptions import ProductRepositoryException
+
+from app.src.repositories import AsyncProductRepository
+
+from ..pagination import decode_cursor, paginate
+from .request import FilterProductsByStatusRequest
+from .response import FilterProductsByStatusResponse
+
+
+class AsyncFilterProductByStatus:
+
+    def __init__(self, product_repository: AsyncProductRepository) -> None:
+        self.product_repository = product_repository
+
+    async def __call__(
+        self, request: FilterProductsByStatusRequest
+    ) -> FilterProductsByStatusResponse:
+        after = decode_cursor(request.cursor)
+        try:
+            existing_products = await self.product_repository.list_page(
+                after=after, limit=request.limit + 1, status=request.status
+            )
+            if not existing_products:
+                return FilterProductsByStatusResponse(products=[])
+            page, next_cursor = paginate(existing_products, request.limit)
+            return FilterProductsByStatusResponse(products=page, next_cursor=next_cursor)
+        except ProductRepositoryException as e:
+            raise e
@@ -1,5 +1,10 @@
-from typing import NamedTuple
+from typing import NamedTuple, Optional
+
+from ..pagination import DEFAULT_PAGE_SIZE
+
 
 class FilterProductsByStatusRequest(NamedTuple):
 
-    status: str
\ No newline at end of file
+    status: str
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
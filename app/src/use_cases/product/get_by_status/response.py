@@ -1,10 +1,9 @@
-from typing import List
-from decimal import Decimal
+from typing import List, Optional
 from pydantic import BaseModel
-from typing import NamedTuple
 
 from ....core.models._product import Product
 
 
 class FilterProductsByStatusResponse(BaseModel):
-    products: List[Product]
\ No newline at end of file
+    products: List[Product]
+    next_cursor: Optional[str] = None
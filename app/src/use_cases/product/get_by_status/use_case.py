@@ -4,6 +4,7 @@ from app.src.exceptions import ProductRepositoryException, ProductNotFoundExcept
 from app.src.core.models import Product
 from app.src.repositories import ProductRepository
 
+from ..pagination import decode_cursor, paginate
 from .request import FilterProductsByStatusRequest
 from .response import FilterProductsByStatusResponse
 
@@ -14,16 +15,20 @@ class FilterProductByStatus:
         self.product_repository = product_repository
 
     def __call__(self, request: FilterProductsByStatusRequest) -> FilterProductsByStatusResponse:
+        after = decode_cursor(request.cursor)
         try:
-            # Get products with the requested status
-            existing_products = self.product_repository.filter(request.status)
+            # Get one page of products with the requested status
+            existing_products = self.product_repository.list_page(
+                after=after, limit=request.limit + 1, status=request.status
+            )
             
             # Return empty list if no products found
             if not existing_products:
                 return FilterProductsByStatusResponse(products=[])
             
             # Return found products
-            return FilterProductsByStatusResponse(products=existing_products)
+            page, next_cursor = paginate(existing_products, request.limit)
+            return FilterProductsByStatusResponse(products=page, next_cursor=next_cursor)
         except ProductRepositoryException as e:
             raise e
         except Exception as e:
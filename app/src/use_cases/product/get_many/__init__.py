@@ -0,0 +1,3 @@
+from .request import GetProductsByIdsRequest
+from .response import GetProductsByIdsResponse
+from .use_case import MAX_BATCH_GET_SIZE, GetProductsByIds
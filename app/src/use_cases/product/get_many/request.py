@@ -0,0 +1,5 @@
+from typing import List, NamedTuple
+
+
+class GetProductsByIdsRequest(NamedTuple):
+    product_ids: List[str]
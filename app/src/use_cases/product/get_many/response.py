@@ -0,0 +1,9 @@
+from typing import List, NamedTuple, Optional
+
+from app.src.core import Product
+
+
+class GetProductsByIdsResponse(NamedTuple):
+    # Same order as the requested ids, None where a product does not exist.
+    products: List[Optional[Product]]
+    missing: List[str]
@@ -0,0 +1,20 @@
+from app.src.repositories import ProductRepository
+
+from .request import GetProductsByIdsRequest
+from .response import GetProductsByIdsResponse
+
+MAX_BATCH_GET_SIZE = 1000
+
+
+class GetProductsByIds:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: GetProductsByIdsRequest) -> GetProductsByIdsResponse:
+        products = self.product_repository.get_many(request.product_ids)
+        missing = [
+            product_id
+            for product_id, product in zip(request.product_ids, products)
+            if product is None
+        ]
+        return GetProductsByIdsResponse(products=products, missing=list(dict.fromkeys(missing)))
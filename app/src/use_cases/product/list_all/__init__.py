@@ -1,2 +1,4 @@
+from .request import ListProductsRequest
 from .response import ListProductResponse
 from .use_case import ListProducts
+from .async_use_case import AsyncListProducts
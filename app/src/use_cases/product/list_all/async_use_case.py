@@ -0,0 +1,23 @@
+from typing import Optional
+
+from app.src.exceptions.repository.product import ProductRepositoryException
+from app.src.repositories import AsyncProductRepository
+from ..pagination import decode_cursor, paginate
+from .request import ListProductsRequest
+from .response import ListProductResponse
+
+
+class AsyncListProducts:
+    def __init__(self, product_repository: AsyncProductRepository):
+        self.product_repository = product_repository
+
+    async def __call__(self, request: Optional[ListProductsRequest] = None) -> ListProductResponse:
+        request = request or ListProductsRequest()
+        try:
+            products = await self.product_repository.list_page(
+                after=decode_cursor(request.cursor), limit=request.limit + 1
+            )
+            page, next_cursor = paginate(products, request.limit)
+            return ListProductResponse(products=page, next_cursor=next_cursor)
+        except ProductRepositoryException as error:
+            raise ProductRepositoryException(str(error))
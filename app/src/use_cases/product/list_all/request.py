@@ -0,0 +1,8 @@
+from typing import NamedTuple, Optional
+
+from ..pagination import DEFAULT_PAGE_SIZE
+
+
+class ListProductsRequest(NamedTuple):
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
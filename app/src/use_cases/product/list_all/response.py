@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 
 from ....core.models._product import Product
@@ -6,3 +6,4 @@ from ....core.models._product import Product
 
 class ListProductResponse(BaseModel):
     products: List[Product]
+    next_cursor: Optional[str] = None
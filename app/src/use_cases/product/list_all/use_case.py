@@ -1,5 +1,9 @@
+from typing import Optional
+
 from app.src.exceptions.repository.product import ProductRepositoryException
 from app.src.repositories import ProductRepository
+from ..pagination import decode_cursor, paginate
+from .request import ListProductsRequest
 from .response import ListProductResponse
 
 
@@ -7,9 +11,13 @@ class ListProducts:
     def __init__(self, product_repository: ProductRepository):
         self.product_repository = product_repository
 
-    def __call__(self) -> ListProductResponse:
+    def __call__(self, request: Optional[ListProductsRequest] = None) -> ListProductResponse:
+        request = request or ListProductsRequest()
         try:
-            products = self.product_repository.list_all()
-            return ListProductResponse(products=products)
+            products = self.product_repository.list_page(
+                after=decode_cursor(request.cursor), limit=request.limit + 1
+            )
+            page, next_cursor = paginate(products, request.limit)
+            return ListProductResponse(products=page, next_cursor=next_cursor)
         except ProductRepositoryException as error:
             raise ProductRepositoryException(str(error))
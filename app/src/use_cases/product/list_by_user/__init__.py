@@ -0,0 +1,3 @@
+from .request import ListUserProductsRequest
+from .response import ListUserProductsResponse
+from .use_case import ListUserProducts
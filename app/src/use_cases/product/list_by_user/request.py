@@ -0,0 +1,9 @@
+from typing import NamedTuple, Optional
+
+from ..pagination import DEFAULT_PAGE_SIZE
+
+
+class ListUserProductsRequest(NamedTuple):
+    user_id: str
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
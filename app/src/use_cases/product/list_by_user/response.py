@@ -0,0 +1,10 @@
+from typing import Dict, List, NamedTuple, Optional
+
+from app.src.core import Product
+
+
+class ListUserProductsResponse(NamedTuple):
+    products: List[Product]
+    total: int
+    counts_by_status: Dict[str, int]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,36 @@
+from typing import Dict
+
+from app.src.core import ProductStatuses
+from app.src.repositories import ProductRepository
+
+from ..pagination import decode_cursor, paginate
+from .request import ListUserProductsRequest
+from .response import ListUserProductsResponse
+
+
+class ListUserProducts:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: ListUserProductsRequest) -> ListUserProductsResponse:
+        after = decode_cursor(request.cursor)
+        products = self.product_repository.list_by_user(
+            request.user_id, after=after, limit=request.limit + 1
+        )
+        page, next_cursor = paginate(products, request.limit)
+        counts = self._counts_by_status(self.product_repository.count_by_user(request.user_id))
+        return ListUserProductsResponse(
+            products=page,
+            total=sum(counts.values()),
+            counts_by_status=counts,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _counts_by_status(stored_counts: Dict[str, int]) -> Dict[str, int]:
+        # Folds the spellings of one status ("For parts", "For Parts") together.
+        counts = {status.value: 0 for status in ProductStatuses}
+        for stored_status, count in stored_counts.items():
+            key = ProductStatuses.canonical(stored_status)
+            counts[key] = counts.get(key, 0) + count
+        return counts
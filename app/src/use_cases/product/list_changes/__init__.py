@@ -0,0 +1,3 @@
+from .request import ListProductChangesRequest
+from .response import ListProductChangesResponse
+from .use_case import ListProductChanges
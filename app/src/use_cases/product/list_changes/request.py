@@ -0,0 +1,9 @@
+from typing import NamedTuple
+
+from ..pagination import DEFAULT_PAGE_SIZE
+
+
+class ListProductChangesRequest(NamedTuple):
+    # Sequence of the last change the consumer has seen; 0 reads from the start.
+    since: int = 0
+    limit: int = DEFAULT_PAGE_SIZE
@@ -0,0 +1,9 @@
+from typing import List, NamedTuple
+
+from app.src.core import ProductChange
+
+
+class ListProductChangesResponse(NamedTuple):
+    changes: List[ProductChange]
+    # Where the next read resumes: the last sequence returned, or `since`.
+    next_since: int
@@ -0,0 +1,14 @@
+from app.src.repositories import ProductRepository
+
+from .request import ListProductChangesRequest
+from .response import ListProductChangesResponse
+
+
+class ListProductChanges:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: ListProductChangesRequest) -> ListProductChangesResponse:
+        changes = self.product_repository.list_changes(request.since, limit=request.limit)
+        next_since = changes[-1].sequence if changes else request.since
+        return ListProductChangesResponse(changes=changes, next_since=next_since)
@@ -0,0 +1,3 @@
+from .request import FilterProductsRequest
+from .response import FilterProductsResponse
+from .use_case import FilterProducts
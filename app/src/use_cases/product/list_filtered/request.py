@@ -0,0 +1,11 @@
+from typing import NamedTuple, Optional
+
+from app.src.core import ProductFilter
+
+from ..pagination import DEFAULT_PAGE_SIZE
+
+
+class FilterProductsRequest(NamedTuple):
+    product_filter: ProductFilter = ProductFilter()
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
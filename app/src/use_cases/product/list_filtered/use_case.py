@@ -0,0 +1,23 @@
+from app.src.repositories import ProductRepository
+
+from ..pagination import decode_sort_cursor, encode_sort_cursor
+from .request import FilterProductsRequest
+from .response import FilterProductsResponse
+
+
+class FilterProducts:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: FilterProductsRequest) -> FilterProductsResponse:
+        sort = request.product_filter.sort
+        after = decode_sort_cursor(request.cursor, sort)
+        products = self.product_repository.list_filtered(
+            request.product_filter, limit=request.limit + 1, after=after
+        )
+        if len(products) <= request.limit:
+            return FilterProductsResponse(products=products)
+        page = products[:request.limit]
+        return FilterProductsResponse(
+            products=page, next_cursor=encode_sort_cursor(page[-1], sort)
+        )
@@ -0,0 +1,78 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, List, Optional, Tuple
+
+from app.src.core.enums import ProductSortOrder
+from app.src.core.models import Product
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_keyset(*values: Any) -> str:
+    """Opaque cursor holding the sort key of the last row of a page."""
+    payload = json.dumps(list(values)).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_keyset(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid pagination cursor")
+    return values
+
+
+def encode_cursor(product_id: str) -> str:
+    return encode_keyset(product_id)
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[str]:
+    values = decode_keyset(cursor, 1)
+    return None if values is None else str(values[0])
+
+
+def paginate(products: List[Product], limit: int) -> Tuple[List[Product], Optional[str]]:
+    """Splits a `limit + 1` lookahead fetch into the page and the cursor of the next one."""
+    if len(products) <= limit:
+        return products, None
+    page = products[:limit]
+    return page, encode_cursor(page[-1].product_id)
+
+
+def encode_sort_cursor(product: Product, sort: ProductSortOrder) -> str:
+    """Cursor after `product` in `sort` order. The order is part of the cursor,
+    so one cannot be replayed against another."""
+    value = getattr(product, sort.field)
+    if isinstance(value, Decimal):
+        value = str(value)
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return encode_keyset(sort.value, value, product.product_id)
+
+
+def decode_sort_cursor(cursor: Optional[str], sort: ProductSortOrder) -> Optional[Tuple[Any, str]]:
+    values = decode_keyset(cursor, 3)
+    if values is None:
+        return None
+    order, value, product_id = values
+    if order != sort.value:
+        raise ValueError("Pagination cursor belongs to a different sort order")
+    try:
+        if sort.field == "price":
+            value = Decimal(value)
+        elif sort.field == "updated_at":
+            value = datetime.fromisoformat(value)
+        else:
+            value = str(value)
+    except (InvalidOperation, TypeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
+    return value, str(product_id)
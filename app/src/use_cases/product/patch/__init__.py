@@ -0,0 +1,2 @@
+from .request import PatchProductRequest
+from .use_case import PATCHABLE_FIELDS, PatchProduct
@@ -0,0 +1,8 @@
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class PatchProductRequest(NamedTuple):
+    product_id: str
+    # Only the fields to change, by Product field name.
+    fields: Dict[str, Any]
+    expected_version: Optional[int] = None
@@ -0,0 +1,50 @@
+from typing import Any, Dict, Optional
+
+from app.src.core import Product
+from app.src.exceptions import (
+    ProductBusinessException,
+    ProductConflictException,
+    ProductNotFoundException,
+)
+from app.src.events import ProductEventPublisher
+from app.src.repositories import ProductRepository
+
+from ..events import publish_write
+from ..versioning import verify_written
+from .request import PatchProductRequest
+
+PATCHABLE_FIELDS = frozenset(Product._fields) - {"product_id", "updated_at"}
+
+
+def validate_fields(fields: Dict[str, Any]) -> None:
+    unknown = set(fields) - PATCHABLE_FIELDS
+    if unknown:
+        raise ProductBusinessException(f"Fields cannot be patched: {', '.join(sorted(unknown))}")
+
+
+class PatchProduct:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        event_publisher: Optional[ProductEventPublisher] = None,
+    ) -> None:
+        self.product_repository = product_repository
+        self.event_publisher = event_publisher
+
+    def __call__(self, request: PatchProductRequest) -> Product:
+        validate_fields(request.fields)
+        if not request.fields:
+            product = self.product_repository.get_by_id(request.product_id)
+            if product is None:
+                raise ProductNotFoundException(product_id=request.product_id)
+            if request.expected_version not in (None, product.version):
+                raise ProductConflictException(product_id=request.product_id)
+            return product
+        product = self.product_repository.patch(
+            request.product_id, request.fields, expected_version=request.expected_version
+        )
+        product = verify_written(
+            self.product_repository, product, request.product_id, request.expected_version
+        )
+        publish_write(self.event_publisher, "updated", product)
+        return product
@@ -0,0 +1,3 @@
+from .request import SearchProductsRequest
+from .response import SearchProductsResponse
+from .use_case import SearchProducts
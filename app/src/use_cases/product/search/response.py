@@ -0,0 +1,8 @@
+from typing import List, NamedTuple, Optional
+
+from app.src.core import Product
+
+
+class SearchProductsResponse(NamedTuple):
+    products: List[Product]
+    next_cursor: Optional[str] = None
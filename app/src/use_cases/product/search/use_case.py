@@ -0,0 +1,26 @@
+from app.src.repositories import ProductRepository
+
+from ..pagination import decode_keyset, encode_keyset
+from .request import SearchProductsRequest
+from .response import SearchProductsResponse
+
+
+class SearchProducts:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(self, request: SearchProductsRequest) -> SearchProductsResponse:
+        after = decode_keyset(request.cursor, 2)
+        hits = self.product_repository.search(
+            request.query,
+            limit=request.limit + 1,
+            after=None if after is None else (float(after[0]), str(after[1])),
+        )
+        page = hits[:request.limit]
+        next_cursor = None
+        if len(hits) > request.limit:
+            last = page[-1]
+            next_cursor = encode_keyset(last.score, last.product.product_id)
+        return SearchProductsResponse(
+            products=[hit.product for hit in page], next_cursor=next_cursor
+        )
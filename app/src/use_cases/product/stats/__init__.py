@@ -0,0 +1,3 @@
+from .request import GetProductStatsRequest
+from .response import GetProductStatsResponse
+from .use_case import GetProductStats
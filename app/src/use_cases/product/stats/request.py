@@ -0,0 +1,7 @@
+from typing import NamedTuple
+
+from app.src.core import ProductFilter
+
+
+class GetProductStatsRequest(NamedTuple):
+    product_filter: ProductFilter = ProductFilter()
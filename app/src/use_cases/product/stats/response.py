@@ -0,0 +1,14 @@
+from decimal import Decimal
+from typing import Dict, NamedTuple, Optional
+
+from app.src.core import StatusStats
+
+
+class GetProductStatsResponse(NamedTuple):
+    count: int
+    available: int
+    by_status: Dict[str, StatusStats]
+    price_min: Optional[Decimal]
+    price_avg: Optional[Decimal]
+    price_max: Optional[Decimal]
+    price_percentiles: Dict[str, Decimal]
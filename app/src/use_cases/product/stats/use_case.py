@@ -0,0 +1,17 @@
+from app.src.repositories import ProductRepository
+
+from ..status_counts import fold_status_stats
+from .request import GetProductStatsRequest
+from .response import GetProductStatsResponse
+
+
+class GetProductStats:
+    def __init__(self, product_repository: ProductRepository) -> None:
+        self.product_repository = product_repository
+
+    def __call__(
+        self, request: GetProductStatsRequest = GetProductStatsRequest()
+    ) -> GetProductStatsResponse:
+        stats = self.product_repository.stats(request.product_filter)
+        by_status = fold_status_stats(stats.by_status)
+        return GetProductStatsResponse(**stats._replace(by_status=by_status)._asdict())
@@ -0,0 +1,16 @@
+from typing import Dict
+
+from app.src.core import ProductStatuses, StatusStats
+
+
+def fold_status_stats(stored: Dict[str, StatusStats]) -> Dict[str, StatusStats]:
+    """Merges the stored spellings of one status ("For parts", "For Parts")
+    under its enum value."""
+    folded: Dict[str, StatusStats] = {}
+    for stored_status, counts in stored.items():
+        key = ProductStatuses.canonical(stored_status)
+        current = folded.get(key, StatusStats(0, 0))
+        folded[key] = StatusStats(
+            current.count + counts.count, current.available + counts.available
+        )
+    return folded
@@ -1,4 +1,4 @@
 from .request import UpdateProductRequest
 from .response import UpdateProductResponse
 from .use_case import UpdateProduct
-
+from .async_use_case import AsyncUpdateProduct
@@ -0,0 +1,45 @@
+from typing import Optional
+from fastapi.exceptions import HTTPException
+from app.src.exceptions import (
+    ProductConflictException,
+    ProductNotFoundException,
+    ProductRepositoryException
+)
+
+from app.src.core.models import Product
+from app.src.events import ProductEventPublisher
+from app.src.repositories import AsyncProductRepository
+
+from ..events import publish_write
+from ..versioning import async_verify_written
+from .request import UpdateProductRequest
+from .response import UpdateProductResponse
+
+
+class AsyncUpdateProduct:
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        event_publisher: Optional[ProductEventPublisher] = None,
+    ):
+        self.product_repository = product_repository
+        self.event_publisher = event_publisher
+
+    async def __call__(
+        self, product_id: str, request: UpdateProductRequest
+    ) -> Optional[UpdateProductResponse]:
+        try:
+            response: Optional[Product] = await self.product_repository.update(
+                product=request, expected_version=request.expected_version
+            )
+            product = await async_verify_written(
+                self.product_repository, response, request.product_id, request.expected_version
+            )
+            publish_write(self.event_publisher, "updated", product)
+            return product
+        except ProductNotFoundException as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except ProductConflictException as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except ProductRepositoryException as e:
+            raise HTTPException(status_code=500, detail=str(e))
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 
 from ....core import ProductStatuses
@@ -17,3 +17,5 @@ class UpdateProductRequest(NamedTuple):
     location: str
     status: ProductStatuses
     is_available: bool
+    # From If-Match: only update while the product still has this version.
+    expected_version: Optional[int] = None
@@ -1,40 +1,47 @@
 from typing import Optional
 from fastapi.exceptions import HTTPException
 from app.src.exceptions import (
+    ProductConflictException,
     ProductNotFoundException,
     ProductRepositoryException
 )
 
 from app.src.core.models import Product
+from app.src.events import ProductEventPublisher
 from app.src.repositories import ProductRepository
 
+from ..events import publish_write
+from ..versioning import verify_written
 from .request import UpdateProductRequest
 from .response import UpdateProductResponse
 
 
 class UpdateProduct:
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        event_publisher: Optional[ProductEventPublisher] = None,
+    ):
         self.product_repository = product_repository
+        self.event_publisher = event_publisher
 
     def __call__(
         self, product_id: str, request: UpdateProductRequest
     ) -> Optional[UpdateProductResponse]:
         try:
-            print("executing update product use case")
-            product_existing = self.product_repository.get_by_id(request.product_id)
-            if product_existing:
-                print(request)
-                response: Optional[Product] = self.product_repository.update(product=request)
-            return response
+            # One UPDATE ... RETURNING; no row back means there was no product
+            # or, with an expected version, that someone else wrote first.
+            response: Optional[Product] = self.product_repository.update(
+                product=request, expected_version=request.expected_version
+            )
+            product = verify_written(
+                self.product_repository, response, request.product_id, request.expected_version
+            )
+            publish_write(self.event_publisher, "updated", product)
+            return product
         except ProductNotFoundException as e:
             raise HTTPException(status_code=404, detail=str(e))
+        except ProductConflictException as e:
+            raise HTTPException(status_code=409, detail=str(e))
         except ProductRepositoryException as e:
             raise HTTPException(status_code=500, detail=str(e))
-
-    def __verify_product_exists(
-        self, existing_product: Optional[Product], request_entity_id: str
-    ) -> None:
-        if existing_product is None:
-            raise ProductNotFoundException(
-                f"Product with ID {request_entity_id} not found"
-            )
\ No newline at end of file
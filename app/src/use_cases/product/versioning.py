@@ -0,0 +1,37 @@
+from typing import Optional
+
+from app.src.core import Product
+from app.src.exceptions import ProductConflictException, ProductNotFoundException
+from app.src.repositories import AsyncProductRepository, ProductRepository
+
+
+def verify_written(
+    product_repository: ProductRepository,
+    product: Optional[Product],
+    product_id: str,
+    expected_version: Optional[int],
+) -> Product:
+    """Returns the product a single-statement write handed back. When it wrote
+    nothing, tells apart a missing product from one whose version moved on;
+    that extra read only happens on the failure path."""
+    if product is not None:
+        return product
+    if expected_version is not None and product_repository.get_by_id(product_id) is not None:
+        raise ProductConflictException(product_id=product_id)
+    raise ProductNotFoundException(product_id=product_id)
+
+
+async def async_verify_written(
+    product_repository: AsyncProductRepository,
+    product: Optional[Product],
+    product_id: str,
+    expected_version: Optional[int],
+) -> Product:
+    if product is not None:
+        return product
+    if (
+        expected_version is not None
+        and await product_repository.get_by_id(product_id) is not None
+    ):
+        raise ProductConflictException(product_id=product_id)
+    raise ProductNotFoundException(product_id=product_id)
@@ -0,0 +1,60 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from faker import Faker
+
+from app.src.core.models._product import Product
+from app.src.exceptions import ProductAlreadyExistsException, ProductNotFoundException
+from app.src.use_cases.product import (
+    AsyncCreateProduct,
+    AsyncFindProductById,
+    AsyncListProducts,
+    CreateProductRequest,
+    FindProductByIdRequest,
+)
+
+fake = Faker()
+
+
+@pytest.fixture
+def fake_product():
+    return Product(
+        product_id=fake.numerify(text='####'),
+        user_id=fake.uuid4(),
+        name=fake.word(),
+        description=fake.sentence(),
+        price=fake.pydecimal(left_digits=4, right_digits=2, positive=True),
+        location=fake.address(),
+        status="New",
+        is_available=fake.boolean()
+    )
+
+
+def test_async_list_products_awaits_repository(fake_product):
+    repository = AsyncMock()
+    repository.list_page.return_value = [fake_product]
+
+    response = asyncio.run(AsyncListProducts(repository)())
+
+    repository.list_page.assert_awaited_once()
+    assert [p.product_id for p in response.products] == [fake_product.product_id]
+
+
+def test_async_find_product_by_id_raises_when_missing():
+    repository = AsyncMock()
+    repository.get_by_id.return_value = None
+
+    with pytest.raises(ProductNotFoundException):
+        asyncio.run(AsyncFindProductById(repository)(FindProductByIdRequest(product_id="1")))
+
+
+def test_async_create_product_rejects_existing_id(fake_product):
+    repository = AsyncMock()
+    repository.get_by_id.return_value = fake_product
+
+    request = CreateProductRequest(*fake_product[:len(CreateProductRequest._fields)])
+
+    with pytest.raises(ProductAlreadyExistsException):
+        asyncio.run(AsyncCreateProduct(repository)(request))
+    repository.create.assert_not_awaited()
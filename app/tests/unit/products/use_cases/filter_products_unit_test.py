@@ -32,7 +32,7 @@ def test_filter_products_success(mock_product_repository, fake_product_list):
     """Test filtering products successfully"""
     # Arrange
     filter_by = ProductStatuses.NEW
-    mock_product_repository.filter.return_value = fake_product_list
+    mock_product_repository.list_page.return_value = fake_product_list
     
     filter_product = FilterProductByStatus(product_repository=mock_product_repository)
     request = FilterProductsByStatusRequest(status=filter_by)
@@ -41,7 +41,9 @@ def test_filter_products_success(mock_product_repository, fake_product_list):
     response = filter_product(request)
     
     # Assert
-    mock_product_repository.filter.assert_called_once_with(filter_by)
+    mock_product_repository.list_page.assert_called_once_with(
+        after=None, limit=request.limit + 1, status=filter_by
+    )
     assert response.products == fake_product_list
     assert all(p.status == ProductStatuses.NEW for p in response.products)
 
@@ -49,7 +51,7 @@ def test_filter_products_repository_exception(mock_product_repository):
     """Test handling repository exception when filtering products"""
     # Arrange
     filter_by = ProductStatuses.USED
-    mock_product_repository.filter.side_effect = ProductRepositoryException(method="filter")
+    mock_product_repository.list_page.side_effect = ProductRepositoryException(method="filter")
     
     filter_product = FilterProductByStatus(product_repository=mock_product_repository)
     request = FilterProductsByStatusRequest(status=filter_by)
@@ -58,4 +60,6 @@ def test_filter_products_repository_exception(mock_product_repository):
     with pytest.raises(ProductRepositoryException) as exc_info:
         filter_product(request)
     assert str(exc_info.value) == "Exception while executing filter in Product"
-    mock_product_repository.filter.assert_called_once_with(filter_by)
+    mock_product_repository.list_page.assert_called_once_with(
+        after=None, limit=request.limit + 1, status=filter_by
+    )
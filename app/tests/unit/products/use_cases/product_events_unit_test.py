@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.exceptions import HTTPException
+
+from app.src.core import ProductEvent
+from app.src.use_cases.product import (
+    CreateProduct,
+    CreateProductRequest,
+    DeleteProduct,
+    DeleteProductRequest,
+)
+
+
+def test_create_product_publishes_the_created_product(mock_product_repository):
+    publisher = MagicMock()
+    created = mock_product_repository.create.return_value
+
+    fields = {field: getattr(created, field) for field in CreateProductRequest._fields}
+
+    CreateProduct(mock_product_repository, publisher)(CreateProductRequest(**fields))
+
+    publisher.publish.assert_called_once_with(
+        ProductEvent(created.product_id, "created", created)
+    )
+
+
+def test_delete_product_publishes_without_the_product(mock_product_repository):
+    publisher = MagicMock()
+    deleted = mock_product_repository.create.return_value
+    mock_product_repository.delete.return_value = deleted
+
+    DeleteProduct(mock_product_repository, publisher)(
+        DeleteProductRequest(product_id=deleted.product_id)
+    )
+
+    publisher.publish.assert_called_once_with(ProductEvent(deleted.product_id, "deleted"))
+
+
+def test_failed_writes_publish_nothing(mock_product_repository):
+    publisher = MagicMock()
+    mock_product_repository.delete.return_value = None
+
+    with pytest.raises(HTTPException):
+        DeleteProduct(mock_product_repository, publisher)(DeleteProductRequest(product_id="1"))
+
+    publisher.publish.assert_not_called()
@@ -0,0 +1,63 @@
+import random
+from decimal import Decimal
+from typing import Iterator, List
+
+from faker import Faker
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from adapters.src.repositories.sql.tables import ProductSchema
+from app.src.core.enums import ProductStatuses
+
+_STATUSES = [status.value for status in ProductStatuses]
+_POOL_SIZE = 500
+
+
+class ProductRowFactory:
+    """Builds product rows from pools of Faker values.
+
+    Calling Faker for every field of a million rows takes minutes, so values
+    are drawn once and recombined; the distribution stays realistic enough for
+    query plans and payload sizes.
+    """
+
+    def __init__(self, seed: int = 42, users: int = 1000) -> None:
+        fake = Faker()
+        Faker.seed(seed)
+        self.random = random.Random(seed)
+        self.user_ids = [fake.uuid4() for _ in range(users)]
+        self.names = [fake.word() for _ in range(_POOL_SIZE)]
+        self.descriptions = [fake.sentence() for _ in range(_POOL_SIZE)]
+        self.locations = [fake.city() for _ in range(_POOL_SIZE)]
+
+    def row(self, index: int) -> dict:
+        pick = self.random.choice
+        return {
+            "product_id": f"{index:09d}",
+            "user_id": pick(self.user_ids),
+            "name": pick(self.names),
+            "description": pick(self.descriptions),
+            "price": Decimal(self.random.randint(100, 999_999)) / 100,
+            "location": pick(self.locations),
+            "status": pick(_STATUSES),
+            "is_available": self.random.random() < 0.7,
+        }
+
+    def rows(self, count: int, start: int = 1) -> Iterator[dict]:
+        for index in range(start, start + count):
+            yield self.row(index)
+
+
+def seed_products(
+    engine: Engine, count: int, factory: ProductRowFactory = None, chunk_size: int = 10_000
+) -> None:
+    factory = factory or ProductRowFactory()
+    chunk: List[dict] = []
+    with engine.begin() as connection:
+        for row in factory.rows(count):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                connection.execute(insert(ProductSchema), chunk)
+                chunk = []
+        if chunk:
+            connection.execute(insert(ProductSchema), chunk)
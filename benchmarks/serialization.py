@@ -0,0 +1,83 @@
+"""Compares the per-product cost of the validated DTO response path with the
+column projection + direct JSON path used by the list and filter routes.
+
+    python -m benchmarks.serialization --rows 10000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from adapters.src.repositories.sql.mappers import PRODUCT_COLUMNS, row_to_product, to_product
+from adapters.src.repositories.sql.tables import Base, ProductSchema
+from api.src.dtos import ListProductResponseDto, ProductBase
+from api.src.serializers import FastJSONResponse, product_payload
+from app.src.core.models import Product
+from benchmarks.seed import seed_products
+
+REPEATS = 5
+
+
+def best_of(function: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def dto_response(products: List[Product]) -> bytes:
+    # What get_products did before: dict per product, validated DTOs, and the
+    # response_model pass FastAPI runs over the returned DTO.
+    payload = [{**product._asdict(), "status": product.status} for product in products]
+    dto = ListProductResponseDto(products=[ProductBase(**item) for item in payload])
+    validated = ListProductResponseDto.model_validate(dto.model_dump())
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def fast_response(products: List[Product]) -> bytes:
+    return FastJSONResponse(
+        {"products": [product_payload(product) for product in products], "next_cursor": None}
+    ).body
+
+
+def report(name: str, seconds: float, rows: int) -> None:
+    print(f"  {name:<28} {seconds * 1000:8.1f} ms  {seconds * 1e6 / rows:6.2f} us/product")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{Path(tempfile.mkdtemp()) / 'serialization.db'}")
+    Base.metadata.create_all(engine)
+    seed_products(engine, args.rows)
+
+    def fetch_entities() -> List[Product]:
+        with Session(engine) as session:
+            return [to_product(product) for product in session.scalars(select(ProductSchema))]
+
+    def fetch_columns() -> List[Product]:
+        with Session(engine) as session:
+            return [row_to_product(row) for row in session.execute(select(*PRODUCT_COLUMNS))]
+
+    products = fetch_columns()
+    print(f"{args.rows} products, best of {REPEATS} runs")
+    print("fetch")
+    report("ORM entities + to_product", best_of(fetch_entities), args.rows)
+    report("column projection", best_of(fetch_columns), args.rows)
+    print("serialize")
+    report("DTO + response_model", best_of(lambda: dto_response(products)), args.rows)
+    report("product_payload + orjson", best_of(lambda: fast_response(products)), args.rows)
+
+
+if __name__ == "__main__":
+    main()
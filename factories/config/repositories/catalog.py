@@ -1,10 +1,23 @@
+import os
+
 from .base import RepositoryConfig
-from factories.repositories import sql_product_repository
+from factories.repositories import async_sql_product_repository, sql_product_repository
 
 
 class CatalogRepositoryConfig(RepositoryConfig):
-    _AVAILABLE_REPOSITORIES: list[str] = ["SQL"]
+    _REPOSITORY: str = os.environ.get("CATALOG_REPOSITORY", "SQL")
+    _AVAILABLE_REPOSITORIES: list[str] = ["SQL", "ASYNC_SQL"]
+    _ASYNC_REPOSITORIES: list[str] = ["ASYNC_SQL"]
+
+    @classmethod
+    def is_async(cls) -> bool:
+        return cls._REPOSITORY in cls._ASYNC_REPOSITORIES
 
     @classmethod
     def _get_repository_instances(cls) -> dict:
-        return {"SQL": sql_product_repository()}
+        # Values are FastAPI dependencies, so each request builds its repository
+        # on top of its own session.
+        return {
+            "SQL": sql_product_repository,
+            "ASYNC_SQL": async_sql_product_repository,
+        }
@@ -0,0 +1 @@
+from .product import product_event_bus
@@ -0,0 +1,10 @@
+from functools import lru_cache
+
+from adapters.src.events import InProcessProductEventBus
+from adapters.src.repositories.config import EventsConfig
+
+
+@lru_cache(maxsize=None)
+def product_event_bus() -> InProcessProductEventBus:
+    # One bus per process: write use cases publish to it, live streams subscribe.
+    return InProcessProductEventBus(max_queue_size=EventsConfig.QUEUE_SIZE)
@@ -1 +1,5 @@
-from .product import sql_product_repository
+from .cache import cached_product_repository, product_cache, stats_cache
+from .health import readiness_probe
+from .metrics import catalog_metrics, instrumented_product_repository
+from .product import async_sql_product_repository, sql_product_repository
+from .session import async_sql_session, sql_session
@@ -0,0 +1,51 @@
+from functools import lru_cache
+from typing import Union
+
+from adapters.src.cache import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    LRUCache,
+    ProductCache,
+    RedisCacheBackend,
+    StatsCache,
+)
+from adapters.src.repositories import AsyncCachedProductRepository, CachedProductRepository
+from adapters.src.repositories.config import CacheConfig
+from app.src.repositories import AsyncProductRepository, ProductRepository
+
+
+def cache_backend() -> CacheBackend:
+    if CacheConfig.BACKEND == "redis":
+        return RedisCacheBackend.from_url(CacheConfig.REDIS_URL)
+    if CacheConfig.BACKEND == "memory":
+        return InMemoryCacheBackend(
+            max_size=CacheConfig.MAX_SIZE, ttl_seconds=CacheConfig.TTL_SECONDS
+        )
+    raise ValueError(f"Unknown product cache backend: {CacheConfig.BACKEND}")
+
+
+@lru_cache(maxsize=None)
+def product_cache() -> ProductCache:
+    # One cache per process, shared by every request's repository.
+    backend = cache_backend()
+    near_cache = None
+    if backend.is_shared and CacheConfig.NEAR_CACHE_TTL_SECONDS > 0:
+        near_cache = LRUCache(
+            max_size=CacheConfig.MAX_SIZE, ttl_seconds=CacheConfig.NEAR_CACHE_TTL_SECONDS
+        )
+    return ProductCache(backend, ttl_seconds=CacheConfig.TTL_SECONDS, near_cache=near_cache)
+
+
+@lru_cache(maxsize=None)
+def stats_cache() -> StatsCache:
+    return StatsCache(cache_backend(), ttl_seconds=CacheConfig.STATS_TTL_SECONDS)
+
+
+def cached_product_repository(
+    product_repository: Union[ProductRepository, AsyncProductRepository],
+) -> Union[ProductRepository, AsyncProductRepository]:
+    if not CacheConfig.ENABLED:
+        return product_repository
+    if isinstance(product_repository, AsyncProductRepository):
+        return AsyncCachedProductRepository(product_repository, product_cache(), stats_cache())
+    return CachedProductRepository(product_repository, product_cache(), stats_cache())
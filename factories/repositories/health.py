@@ -0,0 +1,32 @@
+from functools import lru_cache
+from typing import Callable, Dict
+
+from adapters.src.health import AnyEngine, ReadinessProbe
+from adapters.src.repositories import AsyncSessionManager, SessionManager
+from adapters.src.repositories.config import HealthConfig
+
+from .metrics import catalog_metrics
+
+
+def _engines() -> Dict[str, Callable[[], AnyEngine]]:
+    """Engines of the pools serving traffic. The sync one always does, since
+    the SQL-only features use it whichever CATALOG_REPOSITORY is selected."""
+    from factories.config import CatalogRepositoryConfig
+
+    engines: Dict[str, Callable[[], AnyEngine]] = {"sync": SessionManager.get_engine}
+    if CatalogRepositoryConfig.is_async():
+        engines["async"] = AsyncSessionManager.get_engine
+    return engines
+
+
+@lru_cache(maxsize=None)
+def readiness_probe() -> ReadinessProbe:
+    return ReadinessProbe(
+        engines=_engines(),
+        window=catalog_metrics().recent_requests,
+        timeout_seconds=HealthConfig.PROBE_TIMEOUT_SECONDS,
+        cache_seconds=HealthConfig.PROBE_CACHE_SECONDS,
+        saturation_threshold=HealthConfig.POOL_SATURATION_THRESHOLD,
+        error_rate_threshold=HealthConfig.ERROR_RATE_THRESHOLD,
+        error_rate_min_requests=HealthConfig.ERROR_RATE_MIN_REQUESTS,
+    )
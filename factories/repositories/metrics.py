@@ -0,0 +1,51 @@
+from functools import lru_cache
+from typing import Dict, Union
+
+from sqlalchemy.pool import Pool
+
+from adapters.src.metrics import CatalogMetrics
+from adapters.src.repositories import (
+    AsyncInstrumentedProductRepository,
+    AsyncSessionManager,
+    InstrumentedProductRepository,
+    SessionManager,
+)
+from adapters.src.repositories.config import HealthConfig
+from app.src.repositories import AsyncProductRepository, ProductRepository
+
+from .cache import product_cache
+
+
+def _pools() -> Dict[str, Pool]:
+    pools = {}
+    if SessionManager._engine is not None:
+        pools["sync"] = SessionManager._engine.pool
+    if AsyncSessionManager._engine is not None:
+        pools["async"] = AsyncSessionManager._engine.pool
+    return pools
+
+
+@lru_cache(maxsize=None)
+def catalog_metrics() -> CatalogMetrics:
+    # One registry per process; every worker is scraped separately.
+    metrics = CatalogMetrics(window_seconds=HealthConfig.ERROR_WINDOW_SECONDS)
+    metrics.register_pools(_pools)
+    metrics.register_cache(lambda: product_cache().stats)
+    return metrics
+
+
+def instrumented_product_repository(
+    product_repository: Union[ProductRepository, AsyncProductRepository],
+) -> Union[ProductRepository, AsyncProductRepository]:
+    metrics = catalog_metrics()
+    if isinstance(product_repository, AsyncProductRepository):
+        return AsyncInstrumentedProductRepository(
+            product_repository,
+            metrics.repository_latency_by_method,
+            metrics.repository_errors_by_method,
+        )
+    return InstrumentedProductRepository(
+        product_repository,
+        metrics.repository_latency_by_method,
+        metrics.repository_errors_by_method,
+    )
@@ -1,6 +1,18 @@
-from adapters.src.repositories import SQLProductRepository, SessionManager
-from app.src.repositories import ProductRepository
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from adapters.src.repositories import AsyncSQLProductRepository, SQLProductRepository
+from app.src.repositories import AsyncProductRepository, ProductRepository
 
-def sql_product_repository() -> ProductRepository:
-    return SQLProductRepository(SessionManager.get_session())
+from .session import async_sql_session, sql_session
+
+
+def sql_product_repository(session: Session = Depends(sql_session)) -> ProductRepository:
+    return SQLProductRepository(session)
+
+
+def async_sql_product_repository(
+    session: AsyncSession = Depends(async_sql_session),
+) -> AsyncProductRepository:
+    return AsyncSQLProductRepository(session)
@@ -0,0 +1,16 @@
+from typing import AsyncIterator, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from adapters.src.repositories import AsyncSessionManager, SessionManager
+
+
+def sql_session() -> Iterator[Session]:
+    with SessionManager.session_scope() as session:
+        yield session
+
+
+async def async_sql_session() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionManager.session_scope() as session:
+        yield session
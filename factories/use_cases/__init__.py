@@ -4,6 +4,18 @@ from .product import (
     create_product_use_case,
     delete_product_use_case,
     update_product_use_case,
-    filter_product_use_case
-    
+    filter_product_use_case,
+    export_products_use_case,
+    bulk_create_products_use_case,
+    collection_version_use_case,
+    search_products_use_case,
+    filter_products_use_case,
+    list_user_products_use_case,
+    product_stats_use_case,
+    count_products_use_case,
+    get_products_by_ids_use_case,
+    patch_product_use_case,
+    bulk_patch_products_use_case,
+    list_product_changes_use_case,
+
 )
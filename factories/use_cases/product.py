@@ -1,32 +1,185 @@
-from app.src.repositories import ProductRepository
-from factories.repositories import sql_product_repository
-from app.src.use_cases import ListProducts, FindProductById, CreateProduct, DeleteProduct, UpdateProduct, FilterProductByStatus
+from typing import Any, Union
 
+from fastapi import Depends
 
-def get_product_repository() -> ProductRepository:
-    return sql_product_repository()
+from app.src.events import ProductEventPublisher
+from app.src.repositories import AsyncProductRepository, ProductRepository
+from factories.config import CatalogRepositoryConfig
+from factories.events import product_event_bus
+from factories.repositories import (
+    cached_product_repository,
+    instrumented_product_repository,
+    sql_product_repository,
+)
+from app.src.use_cases import (
+    ListProducts,
+    FindProductById,
+    CreateProduct,
+    DeleteProduct,
+    UpdateProduct,
+    FilterProductByStatus,
+    AsyncListProducts,
+    AsyncFindProductById,
+    AsyncCreateProduct,
+    AsyncDeleteProduct,
+    AsyncUpdateProduct,
+    AsyncFilterProductByStatus,
+    ExportProducts,
+    AsyncExportProducts,
+    BulkCreateProducts,
+    GetCollectionVersion,
+    AsyncGetCollectionVersion,
+    SearchProducts,
+    FilterProducts,
+    ListUserProducts,
+    GetProductStats,
+    CountProductsByStatus,
+    GetProductsByIds,
+    PatchProduct,
+    BulkPatchProducts,
+    ListProductChanges,
+)
 
+AnyProductRepository = Union[ProductRepository, AsyncProductRepository]
 
-def list_product_use_case() -> ListProducts:
-    return ListProducts(get_product_repository())
 
+def get_product_repository(
+    product_repository: AnyProductRepository = Depends(CatalogRepositoryConfig.get_repository()),
+) -> AnyProductRepository:
+    # Metrics wrap the database repository, so cache hits are not counted as calls.
+    return cached_product_repository(instrumented_product_repository(product_repository))
 
-def find_product_by_id_use_case() -> FindProductById:
-    return FindProductById(get_product_repository())
 
+def get_sql_product_repository(
+    product_repository: ProductRepository = Depends(sql_product_repository),
+) -> ProductRepository:
+    """Repository for the features only the SQL implementation offers; they are
+    served from it whichever CATALOG_REPOSITORY is selected."""
+    return cached_product_repository(instrumented_product_repository(product_repository))
 
-def create_product_use_case() -> CreateProduct:
-    return CreateProduct(get_product_repository())
+
+def get_product_event_publisher() -> ProductEventPublisher:
+    return product_event_bus()
+
+
+def _build_use_case(
+    use_case: type, async_use_case: type, product_repository: AnyProductRepository, *args: Any
+) -> Any:
+    if isinstance(product_repository, AsyncProductRepository):
+        return async_use_case(product_repository, *args)
+    return use_case(product_repository, *args)
+
+
+def list_product_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+) -> Union[ListProducts, AsyncListProducts]:
+    return _build_use_case(ListProducts, AsyncListProducts, product_repository)
+
+
+def find_product_by_id_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+) -> Union[FindProductById, AsyncFindProductById]:
+    return _build_use_case(FindProductById, AsyncFindProductById, product_repository)
+
+
+def create_product_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+    event_publisher: ProductEventPublisher = Depends(get_product_event_publisher),
+) -> Union[CreateProduct, AsyncCreateProduct]:
+    return _build_use_case(CreateProduct, AsyncCreateProduct, product_repository, event_publisher)
 
 # Isadora's code starts here
 
-def delete_product_use_case() -> DeleteProduct:
-    return DeleteProduct(get_product_repository())
+def delete_product_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+    event_publisher: ProductEventPublisher = Depends(get_product_event_publisher),
+) -> Union[DeleteProduct, AsyncDeleteProduct]:
+    return _build_use_case(DeleteProduct, AsyncDeleteProduct, product_repository, event_publisher)
+
+
+def update_product_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+    event_publisher: ProductEventPublisher = Depends(get_product_event_publisher),
+) -> Union[UpdateProduct, AsyncUpdateProduct]:
+    return _build_use_case(UpdateProduct, AsyncUpdateProduct, product_repository, event_publisher)
+
+
+def filter_product_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+) -> Union[FilterProductByStatus, AsyncFilterProductByStatus]:
+    return _build_use_case(
+        FilterProductByStatus, AsyncFilterProductByStatus, product_repository
+    )
+
+
+def collection_version_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+) -> Union[GetCollectionVersion, AsyncGetCollectionVersion]:
+    return _build_use_case(GetCollectionVersion, AsyncGetCollectionVersion, product_repository)
+
+
+def export_products_use_case(
+    product_repository: AnyProductRepository = Depends(get_product_repository),
+) -> Union[ExportProducts, AsyncExportProducts]:
+    return _build_use_case(ExportProducts, AsyncExportProducts, product_repository)
+
+
+def bulk_create_products_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> BulkCreateProducts:
+    return BulkCreateProducts(product_repository)
+
+
+def search_products_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> SearchProducts:
+    return SearchProducts(product_repository)
+
+
+def filter_products_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> FilterProducts:
+    return FilterProducts(product_repository)
+
+
+def list_user_products_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> ListUserProducts:
+    return ListUserProducts(product_repository)
+
+
+def product_stats_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> GetProductStats:
+    return GetProductStats(product_repository)
+
+
+def count_products_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> CountProductsByStatus:
+    return CountProductsByStatus(product_repository)
+
+
+def get_products_by_ids_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> GetProductsByIds:
+    return GetProductsByIds(product_repository)
+
+
+def patch_product_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+    event_publisher: ProductEventPublisher = Depends(get_product_event_publisher),
+) -> PatchProduct:
+    return PatchProduct(product_repository, event_publisher)
 
 
-def update_product_use_case() -> UpdateProduct:
-    return UpdateProduct(get_product_repository())
+def bulk_patch_products_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> BulkPatchProducts:
+    return BulkPatchProducts(product_repository)
 
 
-def filter_product_use_case() -> FilterProductByStatus:
-    return FilterProductByStatus(get_product_repository())
+def list_product_changes_use_case(
+    product_repository: ProductRepository = Depends(get_sql_product_repository),
+) -> ListProductChanges:
+    return ListProductChanges(product_repository)